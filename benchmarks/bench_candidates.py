@@ -0,0 +1,12 @@
+from pyslab.batch import create_candidate_grid_batch
+from pyslab.solver import create_candidate_grid
+
+
+def test_create_candidate_grid(benchmark, corpus):
+    benchmark.group = "create_candidate_grid"
+    benchmark(lambda: [create_candidate_grid(grid) for grid in corpus])
+
+
+def test_create_candidate_grid_batch(benchmark, corpus):
+    benchmark.group = "create_candidate_grid"
+    benchmark(create_candidate_grid_batch, corpus)
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from pyslab.generator import (
+    dig_graded,
+    dig_problem,
+    generate_targeted,
+    generate_problem,
+    generate_solution,
+)
+
+
+@pytest.fixture(name="solution")
+def fixture_solution():
+    return generate_solution(permutations=200, rng=random.Random(0))
+
+
+@pytest.mark.parametrize("max_clues", [50, 40])
+def test_generate_problem(benchmark, solution, max_clues):
+    benchmark.group = "generate_problem"
+    benchmark.extra_info["max_clues"] = max_clues
+    benchmark(lambda: next(generate_problem(solution, max_clues, random.Random(0))))
+
+
+@pytest.mark.parametrize("max_clues", [40, 0])
+def test_dig_problem(benchmark, solution, max_clues):
+    benchmark.group = "dig_problem"
+    benchmark.extra_info["max_clues"] = max_clues
+    benchmark(dig_problem, solution, max_clues, random.Random(0))
+
+
+@pytest.mark.parametrize("max_rating", [2.3, None])
+def test_dig_graded(benchmark, solution, max_rating):
+    benchmark.group = "dig_graded"
+    benchmark.extra_info["max_rating"] = max_rating
+    benchmark(dig_graded, solution, 0.0, max_rating, random.Random(0))
+
+
+@pytest.mark.parametrize("strategy", ["Pointing", "Naked Pair"])
+def test_generate_targeted(benchmark, strategy):
+    benchmark.group = "generate_targeted"
+    benchmark.extra_info["strategy"] = strategy
+    benchmark.pedantic(
+        lambda: next(
+            generate_targeted(strategy, permutations=200, rng=random.Random(0))
+        ),
+        rounds=3,
+    )
@@ -0,0 +1,35 @@
+import pytest
+
+from pyslab.batch import solve_batch
+from pyslab.core.validation import brute_force_solution, has_unique_solution
+from pyslab.grading import grade
+from pyslab.solver import solve
+
+BACKENDS = ["bitmask", "dlx", "hybrid"]
+
+
+def test_solve(benchmark, corpus):
+    benchmark.group = "solve"
+    benchmark(lambda: [solve(grid.copy()) for grid in corpus])
+
+
+def test_grade(benchmark, corpus):
+    benchmark.group = "grade"
+    benchmark(lambda: [grade(grid) for grid in corpus])
+
+
+def test_solve_batch(benchmark, corpus):
+    benchmark.group = "solve_batch"
+    benchmark(solve_batch, corpus)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_brute_force_solution(benchmark, corpus, backend):
+    benchmark.group = "brute_force_solution"
+    benchmark(lambda: [brute_force_solution(grid, backend) for grid in corpus])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_has_unique_solution(benchmark, corpus, backend):
+    benchmark.group = "has_unique_solution"
+    benchmark(lambda: [has_unique_solution(grid, backend) for grid in corpus])
@@ -0,0 +1,68 @@
+import pytest
+
+from pyslab.core.topology import TOPOLOGY
+from pyslab.solver import create_candidate_grid
+from pyslab.strategies import (
+    box_line,
+    hidden_pair,
+    hidden_quad,
+    hidden_single,
+    hidden_triple,
+    jellyfish,
+    naked_pair,
+    naked_quad,
+    naked_single,
+    naked_triple,
+    pointing,
+    swordfish,
+    x_wing,
+)
+
+FINDERS = {
+    "naked_single": naked_single.find_placements,
+    "hidden_single": hidden_single.find_placements,
+    "naked_pair": naked_pair.find_eliminations,
+    "hidden_pair": hidden_pair.find_eliminations,
+    "naked_triple": naked_triple.find_eliminations,
+    "hidden_triple": hidden_triple.find_eliminations,
+    "naked_quad": naked_quad.find_eliminations,
+    "hidden_quad": hidden_quad.find_eliminations,
+}
+
+
+@pytest.mark.parametrize("strategy", list(FINDERS))
+def test_strategy_all_houses(benchmark, corpus, strategy):
+    benchmark.group = f"strategy {strategy}"
+    finder = FINDERS[strategy]
+    states = [(grid, create_candidate_grid(grid)) for grid in corpus]
+
+    def run():
+        for grid, candidates in states:
+            for cells in TOPOLOGY.house_cells:
+                finder(grid, candidates, cells)
+
+    benchmark(run)
+
+
+WHOLE_GRID_FINDERS = {
+    "naked_single": naked_single.find_all_placements,
+    "hidden_single": hidden_single.find_all_placements,
+    "pointing": pointing.find_all_eliminations,
+    "box_line": box_line.find_all_eliminations,
+    "x_wing": x_wing.find_all_eliminations,
+    "swordfish": swordfish.find_all_eliminations,
+    "jellyfish": jellyfish.find_all_eliminations,
+}
+
+
+@pytest.mark.parametrize("strategy", list(WHOLE_GRID_FINDERS))
+def test_strategy_whole_grid(benchmark, corpus, strategy):
+    benchmark.group = f"strategy {strategy}"
+    finder = WHOLE_GRID_FINDERS[strategy]
+    states = [(grid, create_candidate_grid(grid)) for grid in corpus]
+
+    def run():
+        for grid, candidates in states:
+            finder(grid, candidates)
+
+    benchmark(run)
@@ -0,0 +1,22 @@
+from os import path
+
+import numpy as np
+import pytest
+
+from pyslab.io import read_chunks
+
+DATA = path.join(path.dirname(__file__), "data")
+
+CORPORA = ["easy", "hard", "seventeen"]
+
+
+def load_corpus(name: str) -> np.ndarray:
+    return np.concatenate(list(read_chunks(path.join(DATA, f"{name}.txt"))))
+
+
+@pytest.fixture(name="corpus", params=CORPORA)
+def fixture_corpus(request, benchmark):
+    grids = load_corpus(request.param)
+    benchmark.extra_info["corpus"] = request.param
+    benchmark.extra_info["puzzles"] = len(grids)
+    return grids
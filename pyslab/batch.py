@@ -0,0 +1,174 @@
+"""Batched Sudoku Solver
+
+Solves many grids at once by computing candidates, naked singles and hidden
+singles for a whole (N, 9, 9) stack with array operations over bitmasks.
+Grids that stall are handed to a per-grid brute force search.
+"""
+from enum import IntEnum
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+from .core.bitmask import ALL_DIGITS, CANDIDATE_DTYPE, lowest_digit, popcount
+from .core.topology import TOPOLOGY
+from .core.validation import DEFAULT_BACKEND, brute_force_solution
+
+
+class SolveStatus(IntEnum):
+    UNSOLVED = 0
+    SOLVED = 1
+    SEARCHED = 2
+    INVALID = 3
+
+
+class BatchResult(NamedTuple):
+    grids: np.ndarray
+    status: np.ndarray
+
+
+def _digit_bits(values: np.ndarray) -> np.ndarray:
+    """Convert (N, 81) digits into single-digit masks, 0 for empty cells"""
+    return np.where(values > 0, np.left_shift(1, values, dtype=np.int64), 0).astype(
+        CANDIDATE_DTYPE
+    )
+
+
+def _house_union(masks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Combine (N, 81) masks over each house
+    Args:
+        masks: (N, 81) masks
+
+    Returns:
+        (N, 27) union of masks in each house, and (N, 27) bits that occur in
+        more than one cell of each house
+    """
+    seen_once = np.zeros([len(masks), 27], dtype=CANDIDATE_DTYPE)
+    seen_twice = np.zeros_like(seen_once)
+    for i in range(9):
+        cell_masks = masks[:, TOPOLOGY.houses[:, i]]
+        seen_twice |= seen_once & cell_masks
+        seen_once |= cell_masks
+    return seen_once, seen_twice
+
+
+def _cell_union(house_masks: np.ndarray) -> np.ndarray:
+    """Combine (N, 27) house masks into (N, 81) masks over each cell's houses"""
+    by_cell = house_masks[:, TOPOLOGY.cell_houses]
+    return by_cell[:, :, 0] | by_cell[:, :, 1] | by_cell[:, :, 2]
+
+
+def _candidates(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute candidates for (N, 81) digits
+    Args:
+        values: (N, 81) digits, 0 for empty cells
+
+    Returns:
+        (N, 81) candidate masks, and (N,) flags for grids with a digit
+        repeated in a house
+    """
+    bits = _digit_bits(values)
+    placed, repeated = _house_union(bits)
+    candidates = np.where(values > 0, bits, ALL_DIGITS & ~_cell_union(placed)).astype(
+        CANDIDATE_DTYPE
+    )
+    return candidates, repeated.any(axis=1)
+
+
+def create_candidate_grid_batch(grids: np.ndarray) -> np.ndarray:
+    """
+    Generate candidate masks for a stack of grids, as create_candidate_grid
+    does for a single grid
+
+    Args:
+        grids: (N, 9, 9) array of sudoku cores
+
+    Returns:
+        (N, 9, 9) candidate cores
+    """
+    values = np.asarray(grids).reshape([-1, 81]).astype(np.int64)
+    candidates, _ = _candidates(values)
+    return candidates.reshape([-1, 9, 9])
+
+
+def _solve_singles(values: np.ndarray) -> np.ndarray:
+    """
+    Place naked and hidden singles across all grids until every grid is
+    solved, invalid or stalled
+    Args:
+        values: (N, 81) digits, updated in place
+
+    Returns:
+        (N,) status of each grid
+    """
+    status = np.full(len(values), SolveStatus.UNSOLVED, dtype=np.uint8)
+    active = np.arange(len(values))
+
+    while active.size:
+        current = values[active]
+        empty = current == 0
+        candidates, invalid = _candidates(current)
+
+        seen_once, seen_twice = _house_union(candidates)
+        invalid |= (seen_once != ALL_DIGITS).any(axis=1)
+        invalid |= (empty & (candidates == 0)).any(axis=1)
+
+        hidden = candidates & _cell_union(seen_once & ~seen_twice)
+        naked = np.where(popcount(candidates) == 1, candidates, 0)
+        placements = np.where(empty, hidden | naked, 0).astype(CANDIDATE_DTYPE)
+        invalid |= (popcount(placements) > 1).any(axis=1)
+
+        solved = ~empty.any(axis=1) & ~invalid
+        progress = (placements != 0).any(axis=1) & ~invalid
+
+        status[active[invalid]] = SolveStatus.INVALID
+        status[active[solved]] = SolveStatus.SOLVED
+
+        values[active[progress]] = np.where(
+            placements[progress] != 0,
+            lowest_digit(placements[progress]),
+            current[progress],
+        )
+        active = active[progress]
+
+    return status
+
+
+def solve_batch(
+    grids: np.ndarray,
+    search: bool = True,
+    backend: str = DEFAULT_BACKEND,
+    chunk_size: int = 4096,
+) -> BatchResult:
+    """
+    Solve a stack of grids together. Naked and hidden singles are placed in
+    every grid at once; grids which stall are then brute forced one at a time.
+
+    Args:
+        grids: (N, 9, 9) array of sudoku cores
+        search: brute force grids which stall on singles
+        backend: name of the search backend used for stalled grids
+        chunk_size: number of grids processed together
+
+    Returns:
+        (N, 9, 9) grids, solved where possible, and (N,) SolveStatus of each
+    """
+    grids = np.asarray(grids)
+    values = grids.reshape([-1, 81]).astype(np.int64)
+    status = np.empty(len(values), dtype=np.uint8)
+
+    for start in range(0, len(values), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        status[chunk] = _solve_singles(values[chunk])
+
+    if search:
+        for i in np.flatnonzero(status == SolveStatus.UNSOLVED):
+            solution = brute_force_solution(values[i].reshape([9, 9]), backend)
+            if solution is None:
+                status[i] = SolveStatus.INVALID
+            else:
+                values[i] = solution.flatten()
+                status[i] = SolveStatus.SEARCHED
+
+    return BatchResult(values.astype(grids.dtype).reshape(grids.shape), status)
@@ -0,0 +1,213 @@
+"""Solve result cache
+
+Results are stored against the canonical form of a puzzle, so a puzzle which
+is equivalent to one solved before is answered by mapping the earlier result
+back through the inverse transform. Recent results are held in an in-memory
+LRU, with an optional on-disk ``shelve`` tier which outlives the process.
+
+Canonicalizing a puzzle takes milliseconds, so the transforms of recently seen
+grids are also remembered, and an exact repeat is answered without it.
+"""
+import shelve
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .canonical import Transform, canonical_form, grid_hash
+from .core.types import Candidate, Placement
+from .core.validation import DEFAULT_BACKEND, brute_force_solution, count_solutions
+from .solver import solve
+from .steps import Step, StepSink
+
+
+class CacheEntry(NamedTuple):
+    """
+    Results for a canonical puzzle. Fields are None until computed.
+
+    Attributes:
+        solution: a brute force solution, None if there is none
+        solutions: number of solutions, counted up to 2
+        solved: the puzzle after applying logical strategies
+        steps: the steps applied by the logical strategies
+    """
+
+    solution: Optional[np.ndarray] = None
+    solutions: Optional[int] = None
+    solved: Optional[np.ndarray] = None
+    steps: Optional[List[Step]] = None
+
+
+class SolveCache:
+    """
+    Cache in front of solve, brute_force_solution and has_unique_solution
+
+    Args:
+        maxsize: number of entries held in memory
+        path: optional shelve file holding every entry
+        backend: name of the search backend used on a miss
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        path: Optional[str] = None,
+        backend: str = DEFAULT_BACKEND,
+    ):
+        self.maxsize = maxsize
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, CacheEntry]" = OrderedDict()
+        self._keys: "OrderedDict[bytes, Tuple[bytes, Transform]]" = OrderedDict()
+        self._shelf = shelve.open(path) if path is not None else None
+
+    def solve(self, grid: np.ndarray, sink: Optional[StepSink] = None) -> np.ndarray:
+        """
+        Solve a core in place by applying logical strategies, as solve does
+        Args:
+            grid: 2-d array sudoku core
+            sink: optional callable which receives a Step for each strategy applied
+
+        Returns:
+            The core, solved as far as the strategies allow
+        """
+        key, transform = self._key(grid)
+        entry = self._get(key)
+
+        if entry.solved is None:
+            self.misses += 1
+            steps = []
+            solve(grid, steps.append)
+            self._put(
+                key,
+                entry._replace(
+                    solved=transform.apply(grid),
+                    steps=[_map_step(step, transform, inverse=False) for step in steps],
+                ),
+            )
+        else:
+            self.hits += 1
+            grid[:] = transform.invert(entry.solved)
+            steps = [_map_step(step, transform, inverse=True) for step in entry.steps]
+
+        if sink is not None:
+            for step in steps:
+                sink(step)
+        return grid
+
+    def brute_force_solution(self, grid: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Find a single solution by brute force search
+        Args:
+            grid: 2-d array sudoku core
+
+        Returns:
+            Solved core, or None if there is no solution
+        """
+        key, transform = self._key(grid)
+        entry = self._get(key)
+
+        if entry.solution is not None or entry.solutions == 0:
+            self.hits += 1
+            return None if entry.solution is None else transform.invert(entry.solution)
+
+        self.misses += 1
+        solution = brute_force_solution(grid, self.backend)
+        if solution is None:
+            self._put(key, entry._replace(solutions=0))
+        else:
+            self._put(key, entry._replace(solution=transform.apply(solution)))
+        return solution
+
+    def has_unique_solution(self, grid: np.ndarray) -> bool:
+        """
+        Check if a core has a unique solution
+        Args:
+            grid: 2-d array sudoku core
+
+        Returns:
+            True if the core has a unique solution
+        """
+        key, _ = self._key(grid)
+        entry = self._get(key)
+
+        if entry.solutions is None:
+            self.misses += 1
+            entry = entry._replace(solutions=count_solutions(grid, 2, self.backend))
+            self._put(key, entry)
+        else:
+            self.hits += 1
+        return entry.solutions == 1
+
+    def _key(self, grid: np.ndarray) -> Tuple[bytes, Transform]:
+        exact = grid_hash(grid)
+        if exact in self._keys:
+            self._keys.move_to_end(exact)
+            return self._keys[exact]
+
+        canonical, transform = canonical_form(grid)
+        self._keys[exact] = grid_hash(canonical), transform
+        if len(self._keys) > self.maxsize:
+            self._keys.popitem(last=False)
+        return self._keys[exact]
+
+    def _get(self, key: bytes) -> CacheEntry:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        if self._shelf is not None and key.hex() in self._shelf:
+            entry = self._shelf[key.hex()]
+            self._remember(key, entry)
+            return entry
+
+        return CacheEntry()
+
+    def _put(self, key: bytes, entry: CacheEntry) -> None:
+        self._remember(key, entry)
+        if self._shelf is not None:
+            self._shelf[key.hex()] = entry
+
+    def _remember(self, key: bytes, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def __enter__(self) -> "SolveCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _map_step(step: Step, transform: Transform, inverse: bool) -> Step:
+    """
+    Map a step through a transform or its inverse
+    Args:
+        step: step applied to a core
+        transform: transform between the core and its canonical form
+        inverse: map from the canonical form back to the core
+
+    Returns:
+        The equivalent step in the other core
+    """
+    cell = transform.invert_cell if inverse else transform.apply_cell
+    digit = transform.invert_digit if inverse else transform.apply_digit
+    house = transform.invert_house if inverse else transform.apply_house
+
+    return Step(
+        step.strategy,
+        None if step.house is None else house(step.house),
+        [Placement(cell(p.cell), digit(p.digit)) for p in step.placements],
+        [Candidate(cell(c.cell), digit(c.digit)) for c in step.eliminations],
+    )
@@ -0,0 +1,341 @@
+"""Canonical forms of puzzles
+
+Two puzzles are equivalent if one can be turned into the other by transposing,
+permuting bands, stacks, rows within a band or columns within a stack, and
+relabelling digits. These transforms preserve validity and the number of
+solutions, so equivalent puzzles only need solving or storing once.
+
+The canonical form of a puzzle is the equivalent puzzle whose 81 digits are
+lexicographically smallest, with empty cells as 0 and digits relabelled in
+order of first appearance. It is found row by row, keeping only the partial
+transforms which produce the smallest rows so far.
+"""
+import hashlib
+from itertools import permutations, product
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from .core.topology import TOPOLOGY, flat_index
+from .core.types import Cell
+
+_TRIPLES = list(permutations(range(3)))
+
+# all 1296 orderings of the 9 columns which keep stacks together
+_LINE_PERMUTATIONS = np.array(
+    [
+        [
+            3 * block + offset
+            for block, within in zip(blocks, inner)
+            for offset in within
+        ]
+        for blocks in _TRIPLES
+        for inner in product(_TRIPLES, repeat=3)
+    ]
+)
+
+_POWERS = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+
+class Transform(NamedTuple):
+    """
+    A validity-preserving transform. The grid is optionally transposed, then
+    output row i is taken from row ``rows[i]`` and output column j from column
+    ``columns[j]``, and each digit d is relabelled to ``digits[d]``.
+    """
+
+    transpose: bool
+    rows: Tuple[int, ...]
+    columns: Tuple[int, ...]
+    digits: Tuple[int, ...]
+
+    def apply(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Transform a grid
+        Args:
+            grid: 2-d array sudoku core
+
+        Returns:
+            Transformed core
+        """
+        source = grid.T if self.transpose else grid
+        relabel = np.array(self.digits, dtype=grid.dtype)
+        return relabel[source[np.ix_(self.rows, self.columns)].astype(int)]
+
+    def invert(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Undo the transform of a grid
+        Args:
+            grid: 2-d array sudoku core produced by apply
+
+        Returns:
+            Original core
+        """
+        restore = np.zeros(10, dtype=grid.dtype)
+        restore[list(self.digits)] = np.arange(10)
+        source = np.zeros_like(grid)
+        source[np.ix_(self.rows, self.columns)] = restore[grid.astype(int)]
+        return source.T if self.transpose else source
+
+    def apply_cell(self, cell: Cell) -> Cell:
+        row, column = (cell.column, cell.row) if self.transpose else cell
+        return Cell(self.rows.index(row), self.columns.index(column))
+
+    def invert_cell(self, cell: Cell) -> Cell:
+        row, column = self.rows[cell.row], self.columns[cell.column]
+        return Cell(column, row) if self.transpose else Cell(row, column)
+
+    def apply_digit(self, digit: int) -> int:
+        return self.digits[digit]
+
+    def invert_digit(self, digit: int) -> int:
+        return self.digits.index(digit)
+
+    def apply_house(self, house: int) -> int:
+        return _map_house(house, self.apply_cell)
+
+    def invert_house(self, house: int) -> int:
+        return _map_house(house, self.invert_cell)
+
+
+def _map_house(house: int, map_cell: Callable[[Cell], Cell]) -> int:
+    """Find the only house containing every mapped cell of a house"""
+    flats = [flat_index(map_cell(cell)) for cell in TOPOLOGY.house_cells[house]]
+    houses = TOPOLOGY.cell_houses[flats]
+    (mapped,) = set(houses[0].tolist()).intersection(*houses[1:].tolist())
+    return mapped
+
+
+class _Partial(NamedTuple):
+    transpose: bool
+    rows: np.ndarray
+    columns: np.ndarray
+    labels: np.ndarray
+    next_label: np.ndarray
+
+
+def _next_rows(rows: Tuple[int, ...]) -> List[int]:
+    """Rows which may come next while keeping bands together"""
+    if len(rows) % 3:
+        band = rows[-1] // 3
+        return [r for r in range(3 * band, 3 * band + 3) if r not in rows]
+    used = {r // 3 for r in rows}
+    return [r for r in range(9) if r // 3 not in used]
+
+
+def _extend(
+    source: np.ndarray, partial: _Partial, row: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Relabel a source row under every column ordering of a partial transform
+    Args:
+        source: 2-d array sudoku core, transposed if required
+        partial: partial transform to extend
+        row: source row to place next
+
+    Returns:
+        Keys ordering the relabelled rows, updated labels and next labels
+    """
+    values = source[row][_LINE_PERMUTATIONS[partial.columns]]
+    labels, next_label = partial.labels.copy(), partial.next_label.copy()
+    index = np.arange(len(values))
+
+    relabelled = np.empty_like(values)
+    for j in range(9):
+        digits = values[:, j]
+        new = (digits > 0) & (labels[index, digits] == 0)
+        labels[index[new], digits[new]] = next_label[new]
+        next_label[new] += 1
+        relabelled[:, j] = labels[index, digits]
+
+    return relabelled @ _POWERS, labels, next_label
+
+
+def _merge(group: List[_Partial]) -> _Partial:
+    """
+    Merge partial transforms which have placed the same set of rows. The
+    order of the placed rows cannot affect the rows still to come, so only the
+    first transform with each column ordering and labelling is kept.
+    """
+    if len(group) == 1:
+        return group[0]
+    rows = np.concatenate([partial.rows for partial in group])
+    columns = np.concatenate([partial.columns for partial in group])
+    labels = np.concatenate([partial.labels for partial in group])
+    next_label = np.concatenate([partial.next_label for partial in group])
+    _, first = np.unique(np.column_stack([columns, labels]), axis=0, return_index=True)
+    first.sort()
+    return _Partial(
+        group[0].transpose,
+        rows[first],
+        columns[first],
+        labels[first],
+        next_label[first],
+    )
+
+
+def _place_next_row(values: np.ndarray, partials: List[_Partial]) -> List[_Partial]:
+    """
+    Extend partial transforms by one row, keeping only those whose next row
+    has the smallest key
+    Args:
+        values: 2-d array sudoku core
+        partials: partial transforms which have placed the same number of rows
+
+    Returns:
+        Extended partial transforms, merged by transposition and placed rows
+    """
+    extensions = []
+    for partial in partials:
+        source = values.T if partial.transpose else values
+        for row in _next_rows(tuple(partial.rows[0])):
+            keys, labels, next_label = _extend(source, partial, row)
+            extensions.append((partial, row, keys, labels, next_label))
+
+    best = min(int(keys.min()) for _, _, keys, _, _ in extensions)
+    merged: Dict[Tuple[bool, FrozenSet[int]], List[_Partial]] = {}
+    for partial, row, keys, labels, next_label in extensions:
+        keep = keys == best
+        if keep.any():
+            rows = np.column_stack([partial.rows[keep], np.full(keep.sum(), row)])
+            merged.setdefault((partial.transpose, frozenset(rows[0])), []).append(
+                _Partial(
+                    partial.transpose,
+                    rows,
+                    partial.columns[keep],
+                    labels[keep],
+                    next_label[keep],
+                )
+            )
+    return [_merge(group) for group in merged.values()]
+
+
+def canonical_form(grid: np.ndarray) -> Tuple[np.ndarray, Transform]:
+    """
+    Find the canonical form of a puzzle and a transform which produces it
+    Args:
+        grid: 2-d array sudoku core
+
+    Returns:
+        Canonical core, and the transform from grid to the canonical core
+    """
+    values = np.asarray(grid).astype(np.int64)
+    n_orders = len(_LINE_PERMUTATIONS)
+    partials = [
+        _Partial(
+            transpose,
+            np.zeros([n_orders, 0], dtype=np.int64),
+            np.arange(n_orders),
+            np.zeros([n_orders, 10], dtype=np.int64),
+            np.ones(n_orders, dtype=np.int64),
+        )
+        for transpose in (False, True)
+    ]
+
+    for _ in range(9):
+        partials = _place_next_row(values, partials)
+
+    partial = partials[0]
+    labels = partial.labels[0]
+    # digits missing from the puzzle take the remaining labels in order
+    unused = iter(range(int(partial.next_label[0]), 10))
+    digits = tuple(
+        0 if d == 0 else int(labels[d]) if labels[d] else next(unused)
+        for d in range(10)
+    )
+    transform = Transform(
+        bool(partial.transpose),
+        tuple(int(r) for r in partial.rows[0]),
+        tuple(int(c) for c in _LINE_PERMUTATIONS[partial.columns[0]]),
+        digits,
+    )
+    return transform.apply(np.asarray(grid)), transform
+
+
+def canonicalize(grid: np.ndarray) -> np.ndarray:
+    """
+    Map a puzzle to the canonical form of its equivalence class
+    Args:
+        grid: 2-d array sudoku core
+
+    Returns:
+        Canonical core
+    """
+    return canonical_form(grid)[0]
+
+
+def canonical_hash(grid: np.ndarray) -> bytes:
+    """
+    Hash the canonical form of a puzzle, so equivalent puzzles hash equally
+    Args:
+        grid: 2-d array sudoku core
+
+    Returns:
+        16 byte digest
+    """
+    return grid_hash(canonicalize(grid))
+
+
+def grid_hash(grid: np.ndarray) -> bytes:
+    """
+    Hash a grid exactly as it is, without canonicalizing it
+    Args:
+        grid: 2-d array sudoku core
+
+    Returns:
+        16 byte digest
+    """
+    return hashlib.blake2b(grid.astype(np.uint8).tobytes(), digest_size=16).digest()
+
+
+class CanonicalIndex:
+    """
+    Set of puzzle equivalence classes, keyed by canonical hash
+    """
+
+    def __init__(self):
+        self._hashes: Set[bytes] = set()
+
+    def add(self, grid: np.ndarray) -> bool:
+        """
+        Add a puzzle to the index
+        Args:
+            grid: 2-d array sudoku core
+
+        Returns:
+            True if no equivalent puzzle was already in the index
+        """
+        digest = canonical_hash(grid)
+        if digest in self._hashes:
+            return False
+        self._hashes.add(digest)
+        return True
+
+    def unique(self, grids: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        Filter a stream of puzzles, dropping any equivalent to an earlier one
+        Args:
+            grids: 2-d array sudoku cores
+
+        Returns:
+            Puzzles not equivalent to any puzzle seen before
+        """
+        for grid in grids:
+            if self.add(grid):
+                yield grid
+
+    def __contains__(self, grid: np.ndarray) -> bool:
+        return canonical_hash(grid) in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
@@ -0,0 +1,109 @@
+"""Bitmask candidate representation
+
+A set of digits is stored as an integer where bit ``d`` is set when digit ``d``
+is a member. Bit 0 is never used, so a full set of candidates is ``0x3FE``.
+Candidate grids are 9x9 ``uint16`` arrays of these masks.
+"""
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+ALL_DIGITS = 0x3FE
+
+CANDIDATE_DTYPE = np.uint16
+
+POPCOUNT_TABLE = np.array(
+    [bin(mask).count("1") for mask in range(1 << 10)], dtype=np.uint8
+)
+
+# plain list lookups are much faster than numpy scalar indexing in Python loops
+POPCOUNT_LIST = POPCOUNT_TABLE.tolist()
+
+LOWEST_DIGIT_TABLE = np.array(
+    [(mask & -mask).bit_length() - 1 if mask else 0 for mask in range(1 << 10)],
+    dtype=np.uint8,
+)
+
+MASK_DIGITS_TABLE = tuple(
+    tuple(digit for digit in range(1, 10) if mask & (1 << digit))
+    for mask in range(1 << 10)
+)
+
+
+def digit_mask(digit: int) -> int:
+    """
+    Create a mask containing a single digit
+    Args:
+        digit: digit between 1 and 9
+
+    Returns:
+        Mask with only the bit for digit set
+    """
+    return 1 << int(digit)
+
+
+def digits_mask(digits: Iterable[int]) -> int:
+    """
+    Create a mask from a collection of digits
+    Args:
+        digits: digits between 1 and 9, zeros are ignored
+
+    Returns:
+        Mask with the bit for each digit set
+    """
+    mask = 0
+    for digit in digits:
+        mask |= 1 << int(digit)
+    return mask & ALL_DIGITS
+
+
+def mask_digits(mask: int) -> Tuple[int, ...]:
+    """
+    Expand a mask into its digits
+    Args:
+        mask: candidate mask
+
+    Returns:
+        Digits contained in the mask, in ascending order
+    """
+    return MASK_DIGITS_TABLE[int(mask)]
+
+
+def popcount(mask: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+    """
+    Count the digits in a mask, or element-wise over an array of masks
+    Args:
+        mask: candidate mask or array of candidate masks
+
+    Returns:
+        Number of digits in each mask
+    """
+    return POPCOUNT_TABLE[mask]
+
+
+def lowest_digit(mask: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+    """
+    Find the smallest digit in a mask, or element-wise over an array of masks
+    Args:
+        mask: candidate mask or array of candidate masks
+
+    Returns:
+        Smallest digit in each mask, or 0 for an empty mask
+    """
+    return LOWEST_DIGIT_TABLE[mask]
+
+
+DIGIT_BITS = np.array([1 << digit for digit in range(1, 10)], dtype=CANDIDATE_DTYPE)
+
+
+def digit_planes(masks: np.ndarray) -> np.ndarray:
+    """
+    Split an array of masks into one boolean plane per digit
+    Args:
+        masks: array of candidate masks
+
+    Returns:
+        Boolean array with a trailing axis of 9, where ``planes[..., d - 1]``
+        is True if digit d is in the mask
+    """
+    return (np.asarray(masks)[..., None] & DIGIT_BITS) > 0
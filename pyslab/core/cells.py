@@ -1,20 +1,21 @@
 from typing import List
 
+from .topology import (
+    TOPOLOGY,
+    ROW_HOUSE_OFFSET,
+    COLUMN_HOUSE_OFFSET,
+    BOX_HOUSE_OFFSET,
+)
 from .types import Cell
 
 
 def row_cells(row: int) -> List[Cell]:
-    return [Cell(row, c) for c in range(9)]
+    return list(TOPOLOGY.house_cells[ROW_HOUSE_OFFSET + row])
 
 
 def column_cells(column: int) -> List[Cell]:
-    return [Cell(r, column) for r in range(9)]
+    return list(TOPOLOGY.house_cells[COLUMN_HOUSE_OFFSET + column])
 
 
 def box_cells(box: int) -> List[Cell]:
-    corner_r, corner_c = box // 3 * 3, box % 3 * 3
-    return [
-        Cell(r, c)
-        for r in range(corner_r, corner_r + 3)
-        for c in range(corner_c, corner_c + 3)
-    ]
+    return list(TOPOLOGY.house_cells[BOX_HOUSE_OFFSET + box])
@@ -1,12 +1,16 @@
-from typing import Set
+from typing import Optional, Set
 
 import numpy as np
 
-from .cells import row_cells, column_cells, box_cells
-from .peers import all_peer_cells
+from .bitmask import ALL_DIGITS, CANDIDATE_DTYPE, POPCOUNT_TABLE
+from .topology import TOPOLOGY, flat_index
 from .types import Cell
 
 
+def _digit_set(values: np.ndarray) -> Set[int]:
+    return set(values.ravel().tolist()) - {0}
+
+
 def row_digits(grid: np.ndarray, row: int) -> Set[int]:
     """
     Find all digits in a row
@@ -17,7 +21,7 @@ def row_digits(grid: np.ndarray, row: int) -> Set[int]:
     Returns:
         Set of all digits in a row
     """
-    return set(grid[list(zip(*row_cells(row)))]) - {0}
+    return _digit_set(grid[row, :])
 
 
 def column_digits(grid: np.ndarray, column: int) -> Set[int]:
@@ -30,7 +34,7 @@ def column_digits(grid: np.ndarray, column: int) -> Set[int]:
     Returns:
         Set of all digits in a column
     """
-    return set(grid[list(zip(*column_cells(column)))]) - {0}
+    return _digit_set(grid[:, column])
 
 
 def box_digits(grid: np.ndarray, box: int) -> Set[int]:
@@ -43,7 +47,8 @@ def box_digits(grid: np.ndarray, box: int) -> Set[int]:
     Returns:
         Set of all digits in a box
     """
-    return set(grid[list(zip(*box_cells(box)))]) - {0}
+    row, column = box // 3 * 3, box % 3 * 3
+    return _digit_set(grid[row : row + 3, column : column + 3])
 
 
 def peer_digits(grid: np.ndarray, cell: Cell) -> Set[int]:
@@ -55,4 +60,54 @@ def peer_digits(grid: np.ndarray, cell: Cell) -> Set[int]:
     Returns:
         Set of all digits in a box
     """
-    return set(grid[list(zip(*all_peer_cells(cell)))]) - {0} - {grid[cell]}
+    row, column = cell
+    box = TOPOLOGY.box_ids[flat_index(cell)]
+    digits = row_digits(grid, row) | column_digits(grid, column) | box_digits(grid, box)
+    digits.discard(grid[cell])
+    return digits
+
+
+def house_masks(grid: np.ndarray) -> np.ndarray:
+    """
+    Find the digits in every house at once
+    Args:
+        grid: 2-d array sudoku core
+
+    Returns:
+        (27,) masks of the digits in each house, with bit d set for digit d
+    """
+    bits = np.left_shift(1, grid.reshape(-1).astype(np.intp)) & ALL_DIGITS
+    return np.bitwise_or.reduce(bits[TOPOLOGY.houses], axis=1).astype(CANDIDATE_DTYPE)
+
+
+def has_repeated_digit(grid: np.ndarray, masks: Optional[np.ndarray] = None) -> bool:
+    """
+    Check whether a digit appears twice in any house
+    Args:
+        grid: 2-d array sudoku core
+        masks: house_masks of the core, found from the core if not given
+
+    Returns:
+        True if some row, column or box repeats a digit
+    """
+    if masks is None:
+        masks = house_masks(grid)
+    # each given sets its bit in three houses, and a repeated one adds no bits
+    return int(POPCOUNT_TABLE[masks].sum()) < 3 * int(np.count_nonzero(grid))
+
+
+def all_peer_masks(grid: np.ndarray) -> np.ndarray:
+    """
+    Find the digits among the peers of every cell at once, the bitmask form of
+    peer_digits for the whole core
+    Args:
+        grid: 2-d array sudoku core
+
+    Returns:
+        (81,) masks of the digits in each flat cell's row, column and box,
+        excluding the cell's own digit
+    """
+    by_cell = house_masks(grid)[TOPOLOGY.cell_houses]
+    own = np.left_shift(1, grid.reshape(-1).astype(np.intp)) & ALL_DIGITS
+    masks = by_cell[:, 0] | by_cell[:, 1] | by_cell[:, 2]
+    return (masks & ~own).astype(CANDIDATE_DTYPE)
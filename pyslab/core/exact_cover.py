@@ -0,0 +1,219 @@
+"""Dancing Links (Algorithm X) exact cover search
+
+Sudoku is modelled as an exact cover problem with 729 rows, one for each
+(cell, digit) choice, and 324 constraint columns:
+
+* 0-80: each cell holds a digit
+* 81-161: each row holds each digit
+* 162-242: each column holds each digit
+* 243-323: each box holds each digit
+"""
+from itertools import islice
+from typing import Any, Generator, List, Optional
+
+import numpy as np
+
+from ..stats import SolveStats
+from .topology import TOPOLOGY
+
+N_CONSTRAINTS = 324
+
+
+def _constraints(cell: int, digit: int) -> List[int]:
+    d = digit - 1
+    return [
+        cell,
+        81 + int(TOPOLOGY.rows[cell]) * 9 + d,
+        162 + int(TOPOLOGY.columns[cell]) * 9 + d,
+        243 + TOPOLOGY.box_ids[cell] * 9 + d,
+    ]
+
+
+_ROW_CONSTRAINTS = [
+    _constraints(cell, digit) for cell in range(81) for digit in range(1, 10)
+]
+
+
+class DancingLinks:
+    """
+    Toroidal doubly-linked sparse matrix for the sudoku exact cover problem.
+
+    Node 0 is the root, nodes 1-324 are the column headers and the remaining
+    nodes are the four entries of each (cell, digit) row. Links are stored in
+    flat lists rather than node objects. nodes counts the rows selected by
+    search.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        n_nodes = 1 + N_CONSTRAINTS + 4 * 729
+        self.left = list(range(-1, n_nodes - 1))
+        self.right = list(range(1, n_nodes + 1))
+        self.up = list(range(n_nodes))
+        self.down = list(range(n_nodes))
+        self.column = list(range(n_nodes))
+        self.size = [0] * (1 + N_CONSTRAINTS)
+        self.choice = [0] * n_nodes
+
+        # circular list of headers
+        self.left[0], self.right[N_CONSTRAINTS] = N_CONSTRAINTS, 0
+
+        node = N_CONSTRAINTS + 1
+        for choice, constraints in enumerate(_ROW_CONSTRAINTS):
+            first = node
+            for constraint in constraints:
+                header = constraint + 1
+                self.column[node] = header
+                self.choice[node] = choice
+                self.up[node], self.down[node] = self.up[header], header
+                self.down[self.up[header]] = node
+                self.up[header] = node
+                self.size[header] += 1
+                self.left[node], self.right[node] = node - 1, node + 1
+                node += 1
+            self.left[first], self.right[node - 1] = node - 1, first
+
+        self.solution: List[int] = []
+        self.nodes = 0
+        self.consistent = self._select_givens(grid)
+
+    def _select_givens(self, grid: np.ndarray) -> bool:
+        for cell, digit in enumerate(grid.flatten()):
+            if digit == 0:
+                continue
+            # first node of the row for this (cell, digit) choice
+            node = 1 + N_CONSTRAINTS + 4 * (cell * 9 + int(digit) - 1)
+            if any(
+                self.left[self.right[header]] != header
+                for header in (self.column[node + i] for i in range(4))
+            ):
+                return False
+            self._select(node)
+        return True
+
+    def _cover(self, header: int) -> None:
+        left, right, up, down, column, size = (
+            self.left,
+            self.right,
+            self.up,
+            self.down,
+            self.column,
+            self.size,
+        )
+        right[left[header]], left[right[header]] = right[header], left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]], up[down[j]] = down[j], up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, header: int) -> None:
+        left, right, up, down, column, size = (
+            self.left,
+            self.right,
+            self.up,
+            self.down,
+            self.column,
+            self.size,
+        )
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = left[right[header]] = header
+
+    def _select(self, node: int) -> None:
+        self.solution.append(self.choice[node])
+        self._cover(self.column[node])
+        j = self.right[node]
+        while j != node:
+            self._cover(self.column[j])
+            j = self.right[j]
+
+    def _deselect(self, node: int) -> None:
+        j = self.left[node]
+        while j != node:
+            self._uncover(self.column[j])
+            j = self.left[j]
+        self._uncover(self.column[node])
+        self.solution.pop()
+
+    def search(self) -> Generator[List[int], Any, None]:
+        """
+        Generate exact covers, choosing the column with fewest rows first
+
+        Returns:
+            Chosen (cell * 9 + digit - 1) rows, valid until the next solution
+        """
+        if not self.consistent:
+            return
+
+        right, size = self.right, self.size
+        if right[0] == 0:
+            yield self.solution
+            return
+
+        header, best = 0, N_CONSTRAINTS + 1
+        j = right[0]
+        while j != 0:
+            if size[j] < best:
+                header, best = j, size[j]
+                if best <= 1:
+                    break
+            j = right[j]
+
+        if best == 0:
+            return
+
+        node = self.down[header]
+        while node != header:
+            self.nodes += 1
+            self._select(node)
+            yield from self.search()
+            self._deselect(node)
+            node = self.down[node]
+
+
+def dlx_solutions(
+    grid: np.ndarray, stats: Optional[SolveStats] = None
+) -> Generator[np.ndarray, Any, None]:
+    """
+    Generate all solutions to a core by Dancing Links exact cover search
+    Args:
+        grid: 2-d array sudoku core
+        stats: optional SolveStats to add the number of branches tried to
+
+    Returns:
+        Solved grids
+    """
+    links = DancingLinks(grid)
+    try:
+        for solution in links.search():
+            values = np.zeros(81, dtype=grid.dtype)
+            for choice in solution:
+                values[choice // 9] = choice % 9 + 1
+            yield values.reshape(grid.shape)
+    finally:
+        if stats is not None:
+            stats.search_nodes += links.nodes
+
+
+def dlx_count_solutions(grid: np.ndarray, limit: int = 2) -> int:
+    """
+    Count solutions to a core by Dancing Links, without building grids
+    Args:
+        grid: 2-d array sudoku core
+        limit: stop counting once this many solutions are found
+
+    Returns:
+        Number of solutions, at most limit
+    """
+    if limit <= 0:
+        return 0
+    return sum(1 for _ in islice(DancingLinks(grid).search(), limit))
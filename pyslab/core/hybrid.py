@@ -0,0 +1,370 @@
+"""Backtracking search with logical propagation
+
+Every node of the search runs naked and hidden singles, and optionally naked
+and hidden pairs, to a fixpoint before branching on the cell with the fewest
+candidates. Each change to a candidate mask is recorded on a trail, so a
+branch is undone by unwinding the trail rather than by copying the grid.
+"""
+from itertools import islice
+from typing import Any, Generator, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..stats import SolveStats
+from .bitmask import ALL_DIGITS, POPCOUNT_LIST
+from .digits import has_repeated_digit, house_masks
+from .topology import TOPOLOGY, flat_index
+from .types import Cell
+
+_PEERS = TOPOLOGY.peer_ids
+_HOUSES = TOPOLOGY.house_cell_ids
+_CELL_HOUSES = TOPOLOGY.cell_house_ids
+_DIGITS = [1 << digit for digit in range(1, 10)]
+
+
+class HybridSearch:
+    """
+    Search state for a single core
+
+    Args:
+        grid: 2-d array sudoku core
+        pairs: also propagate naked and hidden pairs at every node
+        candidates: optional candidate core to start from, such as one left
+            by the logical solver
+
+    Attributes:
+        candidates: 81 candidate masks
+        placed: 81 flags marking cells whose digit was removed from its peers
+        trail: (cell, previous mask) for every change, with a cell of -1 - c
+            recording that cell c was placed
+        nodes: number of branches tried
+    """
+
+    def __init__(
+        self,
+        grid: np.ndarray,
+        pairs: bool = False,
+        candidates: Optional[np.ndarray] = None,
+    ):
+        self.pairs = pairs
+        self.trail: List[Tuple[int, int]] = []
+        self.nodes = 0
+
+        # remove the givens from their houses in one pass rather than placing
+        # them one at a time
+        values = grid.reshape(-1).astype(int).tolist()
+        masks = house_masks(grid)
+        self.consistent = not has_repeated_digit(grid, masks)
+        given = masks.tolist()
+
+        self.placed = [bool(digit) for digit in values]
+        self.candidates = [
+            1 << digit
+            if digit
+            else ALL_DIGITS & ~(given[row] | given[column] | given[box])
+            for digit, (row, column, box) in zip(values, _CELL_HOUSES)
+        ]
+        pending = [
+            cell
+            for cell, mask in enumerate(self.candidates)
+            if not self.placed[cell] and not mask & (mask - 1)
+        ]
+        self.consistent = (
+            self.consistent and all(self.candidates) and self._naked_singles(pending)
+        )
+
+        if candidates is not None and self.consistent:
+            pending = []
+            self.consistent = all(
+                self._restrict(cell, int(mask), pending)
+                for cell, mask in enumerate(candidates.flatten())
+            ) and self._naked_singles(pending)
+
+    def snapshot(self) -> int:
+        """
+        Mark the current state
+        Returns:
+            Mark to pass to restore
+        """
+        return len(self.trail)
+
+    def restore(self, mark: int) -> None:
+        """
+        Undo every change made since a snapshot
+        Args:
+            mark: value returned by snapshot
+        """
+        candidates, placed, trail = self.candidates, self.placed, self.trail
+        while len(trail) > mark:
+            cell, mask = trail.pop()
+            if cell < 0:
+                placed[-1 - cell] = False
+            else:
+                candidates[cell] = mask
+
+    def _restrict(self, cell: int, mask: int, pending: List[int]) -> bool:
+        """Narrow the candidates of a cell, queueing it if it becomes single"""
+        old = self.candidates[cell]
+        mask &= old
+        if mask == old:
+            return True
+        if not mask:
+            return False
+        self.trail.append((cell, old))
+        self.candidates[cell] = mask
+        if not mask & (mask - 1):
+            pending.append(cell)
+        return True
+
+    def restrict(self, cell: int, mask: int) -> bool:
+        """
+        Narrow the candidates of a cell to mask and propagate naked singles
+        Args:
+            cell: flat cell to narrow
+            mask: candidates to keep
+
+        Returns:
+            False on a contradiction
+        """
+        pending = []
+        return self._restrict(cell, mask, pending) and self._naked_singles(pending)
+
+    def _assign(self, cell: int, bit: int) -> bool:
+        """Place a digit and propagate naked singles through its peers"""
+        pending = []
+        if not self._restrict(cell, bit, pending):
+            return False
+        pending.append(cell)
+        return self._naked_singles(pending)
+
+    def _naked_singles(self, pending: List[int]) -> bool:
+        candidates, placed, trail = self.candidates, self.placed, self.trail
+        while pending:
+            cell = pending.pop()
+            if placed[cell]:
+                continue
+            placed[cell] = True
+            trail.append((-1 - cell, 0))
+            keep = ALL_DIGITS ^ candidates[cell]
+            for peer in _PEERS[cell]:
+                if candidates[peer] & ~keep:
+                    if placed[peer] or not self._restrict(peer, keep, pending):
+                        return False
+        return True
+
+    def _hidden_singles(self) -> int:
+        """
+        Place every hidden single
+        Returns:
+            Number of placements, or -1 on a contradiction
+        """
+        candidates, placed = self.candidates, self.placed
+        found = 0
+        for house in _HOUSES:
+            seen_once, seen_twice = 0, 0
+            for cell in house:
+                mask = candidates[cell]
+                seen_twice |= seen_once & mask
+                seen_once |= mask
+            if seen_once != ALL_DIGITS:
+                return -1
+
+            singles = seen_once & ~seen_twice
+            if not singles:
+                continue
+            for cell in house:
+                single = candidates[cell] & singles
+                if single and not placed[cell]:
+                    if single & (single - 1) or not self._assign(cell, single):
+                        return -1
+                    found += 1
+        return found
+
+    def _pairs(self) -> int:
+        """
+        Apply naked and hidden pairs in every house
+        Returns:
+            Number of eliminations, or -1 on a contradiction
+        """
+        before = len(self.trail)
+        pending = []
+        for house in _HOUSES:
+            if not self._naked_pairs(house, pending):
+                return -1
+            if not self._hidden_pairs(house, pending):
+                return -1
+
+        if not self._naked_singles(pending):
+            return -1
+        return len(self.trail) - before
+
+    def _naked_pairs(self, house: Tuple[int, ...], pending: List[int]) -> bool:
+        candidates = self.candidates
+        masks = [candidates[cell] for cell in house]
+        pairs = {
+            mask
+            for i, mask in enumerate(masks)
+            if POPCOUNT_LIST[mask] == 2 and mask in masks[i + 1 :]
+        }
+        return all(
+            self._restrict(cell, ~pair, pending)
+            for pair in pairs
+            for cell, other in zip(house, masks)
+            if other != pair and other & pair
+        )
+
+    def _hidden_pairs(self, house: Tuple[int, ...], pending: List[int]) -> bool:
+        positions = [0] * 9
+        for i, cell in enumerate(house):
+            mask = self.candidates[cell]
+            for d, bit in enumerate(_DIGITS):
+                if mask & bit:
+                    positions[d] |= 1 << i
+
+        doubles = [d for d in range(9) if POPCOUNT_LIST[positions[d]] == 2]
+        return all(
+            self._restrict(cell, _DIGITS[a] | _DIGITS[b], pending)
+            for i, a in enumerate(doubles)
+            for b in doubles[i + 1 :]
+            if positions[a] == positions[b]
+            for j, cell in enumerate(house)
+            if positions[a] & (1 << j)
+        )
+
+    def propagate(self) -> bool:
+        """
+        Run the strategies to a fixpoint
+        Returns:
+            False if the grid has no solution
+        """
+        while True:
+            found = self._hidden_singles()
+            if found < 0:
+                return False
+            if found:
+                continue
+            if not self.pairs:
+                return True
+            found = self._pairs()
+            if found < 0:
+                return False
+            if not found:
+                return True
+
+    def _branch_cell(self) -> int:
+        best, best_count = -1, 10
+        for cell, mask in enumerate(self.candidates):
+            if not self.placed[cell]:
+                count = POPCOUNT_LIST[mask]
+                if count < best_count:
+                    best, best_count = cell, count
+                    if count == 2:
+                        break
+        return best
+
+    def solutions(self) -> Generator[List[int], Any, None]:
+        """
+        Generate every solution reachable from the current state
+        Returns:
+            81 candidate masks of each solution, each a single digit
+        """
+        if not self.consistent or not self.propagate():
+            return
+
+        cell = self._branch_cell()
+        if cell < 0:
+            yield self.candidates[:]
+            return
+
+        mask = self.candidates[cell]
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            self.nodes += 1
+            mark = len(self.trail)
+            if self._assign(cell, bit):
+                yield from self.solutions()
+            self.restore(mark)
+
+
+def _to_grid(masks: List[int], grid: np.ndarray) -> np.ndarray:
+    return np.array(
+        [mask.bit_length() - 1 for mask in masks], dtype=grid.dtype
+    ).reshape(grid.shape)
+
+
+def hybrid_solutions(
+    grid: np.ndarray, pairs: bool = False, stats: Optional[SolveStats] = None
+) -> Generator[np.ndarray, Any, None]:
+    """
+    Generate all solutions to a core, propagating singles at every node
+    Args:
+        grid: 2-d array sudoku core
+        pairs: also propagate naked and hidden pairs at every node
+        stats: optional SolveStats to add the number of branches tried to
+
+    Returns:
+        Solved grids
+    """
+    search = HybridSearch(grid, pairs)
+    try:
+        for masks in search.solutions():
+            yield _to_grid(masks, grid)
+    finally:
+        if stats is not None:
+            stats.search_nodes += search.nodes
+
+
+def hybrid_count_solutions(grid: np.ndarray, limit: int = 2) -> int:
+    """
+    Count solutions to a core, propagating singles at every node
+    Args:
+        grid: 2-d array sudoku core
+        limit: stop counting once this many solutions are found
+
+    Returns:
+        Number of solutions, at most limit
+    """
+    if limit <= 0:
+        return 0
+    return sum(1 for _ in islice(HybridSearch(grid).solutions(), limit))
+
+
+def has_other_solution(
+    grid: np.ndarray, solution: np.ndarray, cells: Iterable[Cell]
+) -> bool:
+    """
+    Check whether a core has a solution other than a known one, given that any
+    other solution must differ from the known one in at least one of cells.
+
+    This holds when cells are the clues just removed from a core whose only
+    solution was the known one, so uniqueness can be re-checked with a search
+    constrained to exclude the known digit from each removed cell in turn.
+
+    Args:
+        grid: 2-d array sudoku core
+        solution: known solution of the core
+        cells: cells where any other solution must differ
+
+    Returns:
+        True if another solution exists
+    """
+    search = HybridSearch(grid)
+    if not search.consistent or not search.propagate():
+        return False
+
+    for cell in cells:
+        flat = flat_index(cell)
+        excluded = search.candidates[flat] & ~(1 << int(solution[cell]))
+        if not excluded:
+            continue
+        mark = search.snapshot()
+        if search.restrict(flat, excluded):
+            solutions = search.solutions()
+            found = next(solutions, None) is not None
+            solutions.close()
+            if found:
+                return True
+        search.restore(mark)
+
+    return False
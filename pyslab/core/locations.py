@@ -1,19 +1,26 @@
 from typing import List
 
+from .topology import (
+    TOPOLOGY,
+    flat_index,
+    ROW_HOUSE_OFFSET,
+    COLUMN_HOUSE_OFFSET,
+    BOX_HOUSE_OFFSET,
+)
 from .types import Cell
 
 
 def box_id(cell: Cell) -> int:
-    return (cell.row // 3) * 3 + (cell.column // 3)
+    return TOPOLOGY.box_ids[flat_index(cell)]
 
 
 def row_house_ids() -> List[int]:
-    return list(range(9))
+    return list(range(ROW_HOUSE_OFFSET, ROW_HOUSE_OFFSET + 9))
 
 
 def column_house_ids() -> List[int]:
-    return list(range(10, 18))
+    return list(range(COLUMN_HOUSE_OFFSET, COLUMN_HOUSE_OFFSET + 9))
 
 
 def box_house_ids() -> List[int]:
-    return list(range(19, 27))
+    return list(range(BOX_HOUSE_OFFSET, BOX_HOUSE_OFFSET + 9))
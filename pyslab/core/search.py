@@ -0,0 +1,120 @@
+"""Bitmask backtracking search"""
+from typing import Any, Generator, List, Optional
+
+import numpy as np
+
+from ..stats import SolveStats
+from .bitmask import ALL_DIGITS, POPCOUNT_LIST
+from .digits import has_repeated_digit, house_masks
+from .topology import TOPOLOGY
+
+_CELL_HOUSES = TOPOLOGY.cell_house_ids
+
+
+def _select(
+    empty: List[int], depth: int, masks: List[int], remaining: List[int]
+) -> None:
+    """
+    Swap the most constrained empty cell from depth on into position depth
+    Args:
+        empty: flat empty cells, reordered in place
+        depth: position to fill
+        masks: 27 house masks
+        remaining: digits left to try at each depth, updated in place
+    """
+    best, best_mask, best_count = depth, 0, 10
+    for i in range(depth, len(empty)):
+        row, column, box = _CELL_HOUSES[empty[i]]
+        mask = ALL_DIGITS & ~(masks[row] | masks[column] | masks[box])
+        count = POPCOUNT_LIST[mask]
+        if count < best_count:
+            best, best_mask, best_count = i, mask, count
+            if count <= 1:
+                break
+    empty[depth], empty[best] = empty[best], empty[depth]
+    remaining[depth] = best_mask
+
+
+def bitmask_solutions(
+    grid: np.ndarray, stats: Optional[SolveStats] = None
+) -> Generator[np.ndarray, Any, None]:
+    """
+    Generate all solutions to a core by iterative backtracking.
+
+    Row, column and box digit masks are maintained incrementally and moves are
+    undone in place, so no grid is copied until a solution is found. At each
+    level the empty cell with the fewest remaining candidates is searched next.
+
+    Args:
+        grid: 2-d array sudoku core
+        stats: optional SolveStats to add the number of branches tried to
+
+    Returns:
+        Solved grids
+    """
+    nodes = [0]
+    try:
+        yield from _bitmask_solutions(grid, nodes)
+    finally:
+        if stats is not None:
+            stats.search_nodes += nodes[0]
+
+
+def _bitmask_solutions(
+    grid: np.ndarray, nodes: List[int]
+) -> Generator[np.ndarray, Any, None]:
+    """
+    Generate all solutions to a core, counting the branches tried
+    Args:
+        grid: 2-d array sudoku core
+        nodes: one-item list the number of branches tried is added to
+
+    Returns:
+        Solved grids
+    """
+    if has_repeated_digit(grid):
+        return
+    values = grid.reshape(-1).astype(int).tolist()
+    masks = house_masks(grid).tolist()
+    empty = [cell for cell, digit in enumerate(values) if not digit]
+
+    n = len(empty)
+    if n == 0:
+        yield np.array(values, dtype=grid.dtype).reshape(grid.shape)
+        return
+
+    remaining = [0] * n
+    placed = [0] * n
+    _select(empty, 0, masks, remaining)
+    depth = 0
+    while depth >= 0:
+        cell = empty[depth]
+        r, c, b = _CELL_HOUSES[cell]
+
+        bit = placed[depth]
+        if bit:
+            masks[r] ^= bit
+            masks[c] ^= bit
+            masks[b] ^= bit
+            values[cell] = 0
+
+        mask = remaining[depth]
+        if not mask:
+            depth -= 1
+            continue
+
+        bit = mask & -mask
+        remaining[depth] = mask ^ bit
+        placed[depth] = bit
+        masks[r] |= bit
+        masks[c] |= bit
+        masks[b] |= bit
+        values[cell] = bit.bit_length() - 1
+        nodes[0] += 1
+
+        if depth + 1 == n:
+            yield np.array(values, dtype=grid.dtype).reshape(grid.shape)
+        else:
+            depth += 1
+            _select(empty, depth, masks, remaining)
+            placed[depth] = 0
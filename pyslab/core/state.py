@@ -0,0 +1,152 @@
+"""Solver state with undo
+
+SolverState keeps the digits, candidate masks and house digit masks of a core
+in flat lists. Every change is recorded on a trail, so a caller can take a
+snapshot before trying something and restore it afterwards instead of copying
+the core.
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .bitmask import ALL_DIGITS, CANDIDATE_DTYPE
+from .digits import has_repeated_digit, house_masks
+from .topology import TOPOLOGY
+
+_PEERS = TOPOLOGY.peer_ids
+_CELL_HOUSES = TOPOLOGY.cell_house_ids
+
+
+class SolverState:
+    """
+    Digits, candidates and house digit masks of a core
+
+    Args:
+        grid: 2-d array sudoku core
+        candidates: optional candidate core to start from, such as one left
+            by the logical solver. Otherwise each empty cell starts with every
+            digit missing from its houses
+
+    Attributes:
+        values: 81 digits, 0 for an empty cell
+        candidates: 81 candidate masks, a single digit for filled cells
+        house_masks: 27 masks of the digits placed in each house
+        trail: (list, index, previous value) for every change
+        consistent: False if the givens repeat a digit in a house
+    """
+
+    __slots__ = ("values", "candidates", "house_masks", "trail", "consistent")
+
+    def __init__(self, grid: np.ndarray, candidates: Optional[np.ndarray] = None):
+        self.values = grid.reshape(-1).astype(int).tolist()
+        masks = house_masks(grid)
+        self.house_masks: List[int] = masks.tolist()
+        self.consistent = not has_repeated_digit(grid, masks)
+        self.trail: List[Tuple[List[int], int, int]] = []
+
+        self.candidates = [
+            1 << digit if digit else ALL_DIGITS & ~self._blocked(cell)
+            for cell, digit in enumerate(self.values)
+        ]
+        if candidates is not None:
+            for cell, mask in enumerate(candidates.reshape(-1).tolist()):
+                self.candidates[cell] &= mask
+
+    def _blocked(self, cell: int) -> int:
+        row, column, box = _CELL_HOUSES[cell]
+        masks = self.house_masks
+        return masks[row] | masks[column] | masks[box]
+
+    def snapshot(self) -> int:
+        """
+        Mark the current state
+        Returns:
+            Mark to pass to restore
+        """
+        return len(self.trail)
+
+    def restore(self, mark: int) -> None:
+        """
+        Undo every change made since a snapshot
+        Args:
+            mark: value returned by snapshot
+        """
+        trail = self.trail
+        while len(trail) > mark:
+            array, index, value = trail.pop()
+            array[index] = value
+
+    def _set(self, array: List[int], index: int, value: int) -> None:
+        self.trail.append((array, index, array[index]))
+        array[index] = value
+
+    def place(self, cell: int, digit: int) -> bool:
+        """
+        Place a digit and remove it from the candidates of its peers. Peers
+        left without candidates are not treated as a contradiction here; a
+        search finds them when it reaches them
+        Args:
+            cell: flat cell to place into
+            digit: digit to place
+
+        Returns:
+            False, changing nothing, if the digit is not a candidate of the cell
+        """
+        bit = 1 << digit
+        candidates = self.candidates
+        if self.values[cell] or not candidates[cell] & bit:
+            return False
+
+        self._set(self.values, cell, digit)
+        if candidates[cell] != bit:
+            self._set(candidates, cell, bit)
+        for house in _CELL_HOUSES[cell]:
+            self._set(self.house_masks, house, self.house_masks[house] | bit)
+        for peer in _PEERS[cell]:
+            if candidates[peer] & bit and not self.values[peer]:
+                self._set(candidates, peer, candidates[peer] & ~bit)
+        return True
+
+    def eliminate(self, cell: int, digit: int) -> bool:
+        """
+        Remove a candidate from a cell
+        Args:
+            cell: flat cell to remove the candidate from
+            digit: digit to remove
+
+        Returns:
+            True if the candidate was present
+        """
+        mask = self.candidates[cell]
+        bit = 1 << digit
+        if not mask & bit:
+            return False
+        self._set(self.candidates, cell, mask & ~bit)
+        return True
+
+    def empty_cells(self) -> List[int]:
+        """
+        Find the cells with no digit
+        Returns:
+            Flat indices of the empty cells
+        """
+        return [cell for cell, digit in enumerate(self.values) if not digit]
+
+    def to_grid(self, dtype=np.uint8) -> np.ndarray:
+        """
+        Copy the digits into a new core
+        Args:
+            dtype: dtype of the core
+
+        Returns:
+            2-d array sudoku core
+        """
+        return np.array(self.values, dtype=dtype).reshape(9, 9)
+
+    def to_candidates(self) -> np.ndarray:
+        """
+        Copy the candidate masks into a new candidate core
+        Returns:
+            Candidate core
+        """
+        return np.array(self.candidates, dtype=CANDIDATE_DTYPE).reshape(9, 9)
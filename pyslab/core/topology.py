@@ -0,0 +1,143 @@
+"""Precomputed grid topology
+
+Cells are numbered 0-80 in row-major order (``row * 9 + column``) and houses
+are numbered 0-26: rows 0-8, columns 9-17 and boxes 18-26. All lookups are
+built once at import so that the cell, peer and house helpers never need to
+construct new cells.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from .types import Cell
+
+ROW_HOUSE_OFFSET = 0
+COLUMN_HOUSE_OFFSET = 9
+BOX_HOUSE_OFFSET = 18
+
+HOUSE_TYPES = ("row", "column", "box")
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+def _plain(array: np.ndarray) -> Tuple[Tuple[int, ...], ...]:
+    # plain integer lookups are much faster than numpy indexing in Python loops
+    return tuple(tuple(row) for row in array.tolist())
+
+
+class Topology:
+    """
+    Lookup tables describing how cells, houses and peers relate.
+
+    Flat forms index an 81-element view of the grid; ``(row, column)`` forms are
+    tuples of index arrays suitable for fancy indexing a 9x9 grid. The ``_ids``
+    forms hold plain integers for loops over single cells.
+
+    Attributes:
+        cells: the 81 cells in flat order
+        rows: (81,) row of each flat cell
+        columns: (81,) column of each flat cell
+        boxes: (81,) box of each flat cell
+        box_ids: box of each flat cell as plain integers
+        houses: (27, 9) flat cells of each house
+        house_cell_ids: flat cells of each house as plain integers
+        house_cells: cells of each house
+        house_index: (row, column) index arrays of each house
+        cell_houses: (81, 3) row, column and box house of each flat cell
+        cell_house_ids: houses of each flat cell as plain integers
+        peers: (81, 20) flat peers of each flat cell
+        peer_ids: flat peers of each flat cell as plain integers
+        peer_cells: peer cells of each flat cell
+        peer_index: (row, column) index arrays of the peers of each flat cell
+    """
+
+    def __init__(self):
+        flat = np.arange(81)
+        self.cells: Tuple[Cell, ...] = tuple(
+            Cell(r, c) for r in range(9) for c in range(9)
+        )
+        self.rows = _read_only(flat // 9)
+        self.columns = _read_only(flat % 9)
+        self.boxes = _read_only(self.rows // 3 * 3 + self.columns // 3)
+        self.box_ids: Tuple[int, ...] = tuple(int(box) for box in self.boxes)
+
+        self.houses = _read_only(
+            np.array(
+                [np.flatnonzero(self.rows == row) for row in range(9)]
+                + [np.flatnonzero(self.columns == column) for column in range(9)]
+                + [np.flatnonzero(self.boxes == box) for box in range(9)]
+            )
+        )
+        self.house_cell_ids = _plain(self.houses)
+        self.house_cells: Tuple[Tuple[Cell, ...], ...] = tuple(
+            tuple(self.cells[i] for i in house) for house in self.houses
+        )
+        self.house_index: Tuple[Tuple[np.ndarray, np.ndarray], ...] = tuple(
+            (self.rows[house], self.columns[house]) for house in self.houses
+        )
+
+        self.cell_houses = _read_only(
+            np.stack(
+                [
+                    self.rows + ROW_HOUSE_OFFSET,
+                    self.columns + COLUMN_HOUSE_OFFSET,
+                    self.boxes + BOX_HOUSE_OFFSET,
+                ],
+                axis=1,
+            )
+        )
+        self.cell_house_ids = _plain(self.cell_houses)
+
+        # peers are ordered row, column then the remainder of the box
+        self.peers = _read_only(
+            np.array(
+                [
+                    list(
+                        dict.fromkeys(
+                            i
+                            for house in self.houses[self.cell_houses[cell]]
+                            for i in house
+                            if i != cell
+                        )
+                    )
+                    for cell in flat
+                ]
+            )
+        )
+        self.peer_ids = _plain(self.peers)
+        self.peer_cells: Tuple[Tuple[Cell, ...], ...] = tuple(
+            tuple(self.cells[i] for i in peers) for peers in self.peers
+        )
+        self.peer_index: Tuple[Tuple[np.ndarray, np.ndarray], ...] = tuple(
+            (self.rows[peers], self.columns[peers]) for peers in self.peers
+        )
+
+
+TOPOLOGY = Topology()
+
+
+def flat_index(cell: Cell) -> int:
+    """
+    Find the flat index of a cell
+    Args:
+        cell: (row, column) cell
+
+    Returns:
+        Index of the cell in a flattened grid
+    """
+    return cell[0] * 9 + cell[1]
+
+
+def house_name(house: int) -> str:
+    """
+    Describe a house, e.g. "column 4"
+    Args:
+        house: house id between 0 and 26
+
+    Returns:
+        House type followed by its index within that type
+    """
+    return f"{HOUSE_TYPES[house // 9]} {house % 9}"
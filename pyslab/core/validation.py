@@ -1,9 +1,35 @@
-from typing import Generator, Any, Iterator
+from itertools import islice
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
 
 import numpy as np
 
-from ..core.digits import peer_digits
+from ..core.exact_cover import dlx_solutions, dlx_count_solutions
+from ..core.hybrid import hybrid_solutions, hybrid_count_solutions
+from ..core.search import bitmask_solutions
+from ..core.state import SolverState
 from ..core.types import Cell
+from ..stats import SolveStats
+
+
+class SolverBackend(NamedTuple):
+    solutions: Callable[..., Iterator[np.ndarray]]
+    count_solutions: Callable[[np.ndarray, int], int]
+    counts_nodes: bool = False
+
+
+BACKENDS: Dict[str, SolverBackend] = {}
+
+DEFAULT_BACKEND = "hybrid"
 
 
 def is_solved(grid: np.ndarray) -> bool:
@@ -37,63 +63,173 @@ def is_solved(grid: np.ndarray) -> bool:
     return True
 
 
-def brute_force_solutions(grid: np.ndarray) -> Generator[np.ndarray, Any, None]:
+def register_backend(
+    name: str,
+    solutions: Callable[[np.ndarray], Iterator[np.ndarray]],
+    counter: Optional[Callable[[np.ndarray, int], int]] = None,
+    counts_nodes: bool = False,
+) -> None:
+    """
+    Register a brute force search backend under a name
+    Args:
+        name: name used to select the backend
+        solutions: generator of all solutions to a core
+        counter: counts solutions up to a limit, defaults to counting the
+            solutions generator
+        counts_nodes: solutions accepts a stats keyword argument and adds
+            the number of branches it tries to it
+    """
+
+    def _count_by_iteration(grid: np.ndarray, limit: int = 2) -> int:
+        if limit <= 0:
+            return 0
+        return sum(1 for _ in islice(solutions(grid), limit))
+
+    BACKENDS[name] = SolverBackend(
+        solutions, counter or _count_by_iteration, counts_nodes
+    )
+
+
+def get_backend(name: str) -> SolverBackend:
+    """
+    Look up a registered brute force search backend
+    Args:
+        name: registered backend name
+
+    Returns:
+        The backend
+    """
+    try:
+        return BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown backend {name!r}, expected one of {sorted(BACKENDS)}"
+        ) from None
+
+
+def brute_force_solutions(
+    grid: np.ndarray,
+    backend: str = DEFAULT_BACKEND,
+    stats: Optional[SolveStats] = None,
+) -> Generator[np.ndarray, Any, None]:
     """
     Generate brute force solutions to an unsolved core
     Args:
         grid: 2-d array sudoku core
+        backend: name of the search backend to use
+        stats: optional SolveStats to record the search in. Time is only
+            counted while the search runs, not while the caller holds a
+            solution
 
     Returns:
         Solved grids
     """
+    search = get_backend(backend)
+    if stats is None:
+        yield from search.solutions(grid)
+        return
+
+    stats.searches += 1
+    if search.counts_nodes:
+        solutions = search.solutions(grid, stats=stats)
+    else:
+        solutions = search.solutions(grid)
     try:
-        next_to_solve = next(unsolved_cells(grid))
-        possible_values = set(range(1, 10)) - peer_digits(grid, next_to_solve)
+        while True:
+            start = perf_counter()
+            try:
+                solution = next(solutions)
+            except StopIteration:
+                return
+            finally:
+                stats.search_time += perf_counter() - start
+            yield solution
+    finally:
+        solutions.close()
 
-        for v in possible_values:
-            possible_grid = np.copy(grid)
-            possible_grid[next_to_solve] = v
-            yield from brute_force_solutions(possible_grid)
-    except StopIteration:
-        if is_solved(grid):
-            yield grid
 
+def naive_solutions(grid: np.ndarray) -> Generator[np.ndarray, Any, None]:
+    """
+    Generate brute force solutions by filling the first unsolved cell
+    with each possible digit in turn, undoing each attempt through a
+    SolverState snapshot rather than copying the core
+    Args:
+        grid: 2-d array sudoku core
 
-def brute_force_solution(grid: np.ndarray):
+    Returns:
+        Solved grids
+    """
+    state = SolverState(grid)
+    if state.consistent:
+        yield from _naive_search(state, state.empty_cells(), 0, grid)
+
+
+def _naive_search(
+    state: SolverState, empty: List[int], depth: int, grid: np.ndarray
+) -> Generator[np.ndarray, Any, None]:
+    if depth == len(empty):
+        yield state.to_grid(grid.dtype).reshape(grid.shape)
+        return
+
+    cell = empty[depth]
+    mask = state.candidates[cell]
+    for digit in range(1, 10):
+        if mask & (1 << digit):
+            mark = state.snapshot()
+            state.place(cell, digit)
+            yield from _naive_search(state, empty, depth + 1, grid)
+            state.restore(mark)
+
+
+def brute_force_solution(
+    grid: np.ndarray,
+    backend: str = DEFAULT_BACKEND,
+    stats: Optional[SolveStats] = None,
+):
     """
     Find single solution by brute force search
     Args:
         grid: 2-d array sudoku core
+        backend: name of the search backend to use
+        stats: optional SolveStats to record the search in
 
     Returns:
         Solved core
     """
+    solutions = brute_force_solutions(grid, backend, stats)
     try:
-        return next(brute_force_solutions(grid))
-    except StopIteration:
-        return None
+        return next(solutions, None)
+    finally:
+        solutions.close()
 
 
-def has_unique_solution(grid: np.ndarray) -> bool:
+def has_unique_solution(grid: np.ndarray, backend: str = DEFAULT_BACKEND) -> bool:
     """
     Check if core has a unique solution
     Args:
         grid: 2-d array sudoku core
+        backend: name of the search backend to use
 
     Returns:
         True if core has a unique solution
     """
-    solutions = brute_force_solutions(grid)
-    try:
-        _ = next(solutions)
-    except StopIteration:
-        return False
+    return count_solutions(grid, 2, backend) == 1
 
-    try:
-        _ = next(solutions)
-        return False
-    except StopIteration:
-        return True
+
+def count_solutions(
+    grid: np.ndarray, limit: int = 2, backend: str = DEFAULT_BACKEND
+) -> int:
+    """
+    Count the solutions to a core, stopping once limit have been found
+    Args:
+        grid: 2-d array sudoku core
+        limit: maximum number of solutions to count
+        backend: name of the search backend to use
+
+    Returns:
+        Number of solutions, at most limit
+    """
+    return get_backend(backend).count_solutions(grid, limit)
 
 
 def unsolved_cells(grid: np.ndarray) -> Iterator[Cell]:
@@ -118,3 +254,10 @@ def solved_cells(grid: np.ndarray) -> Iterator[Cell]:
         Iterator of (row, col) cell ids
     """
     return iter(Cell(row, column) for row, column in zip(*np.where(grid > 0)))
+
+
+register_backend("naive", naive_solutions)
+# plain backtracking counts far slower than a search which propagates singles
+register_backend("bitmask", bitmask_solutions, hybrid_count_solutions, True)
+register_backend("dlx", dlx_solutions, dlx_count_solutions, True)
+register_backend("hybrid", hybrid_solutions, hybrid_count_solutions, True)
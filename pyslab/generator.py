@@ -1,16 +1,27 @@
+import logging
+import os
 import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from functools import partial
-from typing import Callable, List, Tuple
+from itertools import count, islice
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+from pyslab.core.hybrid import has_other_solution
+from pyslab.core.topology import HOUSE_TYPES, flat_index
 from pyslab.core.types import Cell
+from pyslab.grading import Grade, grade
+from pyslab.io import format_grid
 from pyslab.core.validation import (
     brute_force_solution,
     has_unique_solution,
     solved_cells,
 )
 from pyslab.solver import create_candidate_grid
+from pyslab.steps import Step
+
+logger = logging.getLogger(__name__)
 
 
 def generate_example(
@@ -21,39 +32,43 @@ def generate_example(
     seed: np.ndarray = np.zeros([9, 9]),
     permutations: int = 1000,
     max_clues: int = 50,
+    rng: Optional[random.Random] = None,
 ) -> np.ndarray:
-    print("Scanning with max_clues =", max_clues)
-    solved_grid = generate_solution(seed, permutations)
-
-    i = 0
-    for grid in generate_problem(solved_grid, max_clues=max_clues):
-        i += 1
-        if all(
-            len(finder(grid, create_candidate_grid(grid))) >= min_match
-            for finder in finders
-        ):
-            print("max clues", max_clues)
-            return grid
-        if i > 5:
-            return generate_example(
-                finders, min_match, seed, permutations, max_clues + 1
-            )
+    while max_clues <= 81:
+        logger.debug("Scanning with max_clues = %d", max_clues)
+        solved_grid = generate_solution(seed, permutations, rng)
+
+        problems = generate_problem(solved_grid, max_clues=max_clues, rng=rng)
+        for grid in islice(problems, 6):
+            candidates = create_candidate_grid(grid)
+            if all(len(finder(grid, candidates)) >= min_match for finder in finders):
+                logger.debug("Found example with max_clues = %d", max_clues)
+                return grid
+        max_clues += 1
 
     raise RuntimeError("Could not generate an example")
 
 
-def generate_solution(seed: np.ndarray = np.zeros([9, 9]), permutations: int = 1000):
+def generate_solution(
+    seed: np.ndarray = np.zeros([9, 9]),
+    permutations: int = 1000,
+    rng: Optional[random.Random] = None,
+):
+    rng = rng or random
     grid = brute_force_solution(seed)
     for _ in range(permutations):
-        permute_function = random.choice(
+        permute_function = rng.choice(
             [permute_rows, permute_cols, permute_row_blocks, permute_col_blocks]
         )
-        grid = permute_function(grid)
+        grid = permute_function(grid, rng)
 
     return grid
 
 
-def generate_problem(grid: np.ndarray, max_clues: int = 30):
+def generate_problem(
+    grid: np.ndarray, max_clues: int = 30, rng: Optional[random.Random] = None
+):
+    rng = rng or random
     if has_unique_solution(grid):
 
         candidates = list(solved_cells(grid))
@@ -61,7 +76,7 @@ def generate_problem(grid: np.ndarray, max_clues: int = 30):
         if len(candidates) <= max_clues:
             yield grid
         else:
-            random.shuffle(candidates)
+            rng.shuffle(candidates)
 
             for r, c in candidates:
                 updated_grid = grid.copy()
@@ -70,13 +85,312 @@ def generate_problem(grid: np.ndarray, max_clues: int = 30):
                 candidates.remove(Cell(r, c))
                 if Cell(8 - r, 8 - c) in candidates:
                     candidates.remove(Cell(8 - r, 8 - c))
-                yield from generate_problem(updated_grid)
+                yield from generate_problem(updated_grid, max_clues, rng)
+
+
+def dig_problem(
+    solution: np.ndarray, max_clues: int = 0, rng: Optional[random.Random] = None
+) -> np.ndarray:
+    """
+    Dig a problem out of a solution by removing symmetric pairs of clues in a
+    random order, keeping each removal only if the problem stays unique.
+
+    Rather than re-solving the problem after every removal, uniqueness is
+    checked by searching only for solutions which differ from the known
+    solution at the removed cells.
+
+    Args:
+        solution: solved core
+        max_clues: stop once the problem has this many clues or fewer. With
+            the default of 0 the problem is dug until no pair can be removed.
+        rng: random number generator, defaults to the random module
+
+    Returns:
+        Problem with a unique solution
+    """
+    rng = rng or random
+    problem = solution.copy()
+    clues = int((problem > 0).sum())
+
+    pairs = [Cell(r, c) for r in range(5) for c in range(9) if r < 4 or c <= 4]
+    rng.shuffle(pairs)
+
+    for r, c in pairs:
+        if clues <= max_clues:
+            break
+
+        removed = [
+            cell
+            for cell in dict.fromkeys([Cell(r, c), Cell(8 - r, 8 - c)])
+            if problem[cell]
+        ]
+        for cell in removed:
+            problem[cell] = 0
+
+        if has_other_solution(problem, solution, removed):
+            for cell in removed:
+                problem[cell] = solution[cell]
+        else:
+            clues -= len(removed)
+
+    return problem
+
+
+def dig_graded(
+    solution: np.ndarray,
+    min_rating: float = 0.0,
+    max_rating: Optional[float] = None,
+    rng: Optional[random.Random] = None,
+) -> Optional[Tuple[np.ndarray, Grade]]:
+    """
+    Dig a problem out of a solution, keeping each removal of a symmetric pair
+    of clues only if the problem can still be solved by strategies rated no
+    higher than max_rating.
+
+    A problem the strategies solve has only the one solution, so the grading
+    doubles as the uniqueness check and no search is needed. Grading stops
+    as soon as a problem needs a strategy rated above max_rating.
+
+    Args:
+        solution: solved core
+        min_rating: reject the problem if it rates lower than this once no
+            more clues can be removed
+        max_rating: highest rating allowed, defaults to any strategy
+        rng: random number generator, defaults to the random module
+
+    Returns:
+        Problem and its grade, or None if it rates lower than min_rating
+    """
+    rng = rng or random
+    problem = solution.copy()
+    graded = grade(problem, max_rating)
+
+    pairs = [Cell(r, c) for r in range(5) for c in range(9) if r < 4 or c <= 4]
+    rng.shuffle(pairs)
+
+    for cell in pairs:
+        removed = _pair_cells(cell)
+        digits = problem.flat[removed]
+        problem.flat[removed] = 0
+
+        candidate = grade(problem, max_rating)
+        if candidate.solved:
+            graded = candidate
+        else:
+            problem.flat[removed] = digits
+
+    if graded.rating < min_rating:
+        return None
+    return problem, graded
+
+
+def generate_graded(
+    min_rating: float = 0.0,
+    max_rating: Optional[float] = None,
+    attempts: int = 100,
+    permutations: int = 1000,
+    rng: Optional[random.Random] = None,
+) -> Tuple[np.ndarray, Grade]:
+    """
+    Generate a problem whose rating falls between min_rating and max_rating
+    Args:
+        min_rating: lowest rating allowed
+        max_rating: highest rating allowed, defaults to any strategy
+        attempts: number of solutions to dig before giving up
+        permutations: permutations applied to each solution
+        rng: random number generator, defaults to the random module
+
+    Returns:
+        Problem and its grade
+
+    Raises:
+        RuntimeError: if no problem in range was found
+    """
+    for _ in range(attempts):
+        solution = generate_solution(permutations=permutations, rng=rng)
+        graded = dig_graded(solution, min_rating, max_rating, rng)
+        if graded is not None:
+            return graded
 
+    raise RuntimeError("Could not generate a problem in the rating range")
 
-def permute_row_blocks(grid: np.ndarray) -> np.ndarray:
+
+def generate_targeted(
+    strategy: str,
+    house_type: Optional[str] = None,
+    min_rating: float = 0.0,
+    max_rating: Optional[float] = None,
+    budget: int = 200,
+    attempts: Optional[int] = 100,
+    permutations: int = 1000,
+    rng: Optional[random.Random] = None,
+) -> Iterator[Tuple[np.ndarray, Grade]]:
+    """
+    Generate problems which need a given strategy to solve, such as examples
+    for teaching it.
+
+    For each solution, the tree of problems made by removing symmetric pairs
+    of clues is searched depth first. Removals are kept while the problem
+    still grades as solved within max_rating, and a branch stops at the first
+    problem whose grading uses the strategy.
+
+    Args:
+        strategy: name of the strategy which must be used, e.g. "Hidden Pair"
+        house_type: row, column or box the strategy must be used in, or None
+            for any
+        min_rating: lowest rating allowed
+        max_rating: highest rating allowed, defaults to any strategy
+        budget: problems graded for each solution before moving on to the next
+        attempts: number of solutions to search, or None to search forever
+        permutations: permutations applied to each solution
+        rng: random number generator, defaults to the random module
+
+    Returns:
+        Problems and their grades, one for each solution which had one
+    """
+    rng = rng or random
+    solutions = count() if attempts is None else range(attempts)
+    for _ in solutions:
+        solution = generate_solution(permutations=permutations, rng=rng)
+        pairs = [Cell(r, c) for r in range(5) for c in range(9) if r < 4 or c <= 4]
+        rng.shuffle(pairs)
+
+        def accept(graded: Grade, steps: List[Step]) -> bool:
+            return min_rating <= graded.rating and any(
+                step.strategy == strategy
+                and (
+                    house_type is None
+                    or step.house is not None
+                    and HOUSE_TYPES[step.house // 9] == house_type
+                )
+                for step in steps
+            )
+
+        found = _dig_targeted(
+            solution.copy(),
+            pairs,
+            accept,
+            max_rating,
+            [budget],
+        )
+        if found is not None:
+            yield found
+
+
+def _dig_targeted(
+    problem: np.ndarray,
+    pairs: List[Cell],
+    accept: Callable[[Grade, List[Step]], bool],
+    max_rating: Optional[float],
+    budget: List[int],
+) -> Optional[Tuple[np.ndarray, Grade]]:
+    """
+    Search the problems made by removing more pairs of clues
+    Args:
+        problem: current problem, restored before returning
+        pairs: cells whose symmetric pair may still be removed
+        accept: checks whether a grade and its steps use the strategy
+        max_rating: highest rating allowed
+        budget: single item list of the problems left to grade, updated in
+            place
+
+    Returns:
+        Accepted problem and its grade, or None
+    """
+    for i, cell in enumerate(pairs):
+        if budget[0] <= 0:
+            return None
+        budget[0] -= 1
+
+        removed = _pair_cells(cell)
+        digits = problem.flat[removed]
+        problem.flat[removed] = 0
+
+        steps: List[Step] = []
+        graded = grade(problem, max_rating, steps.append)
+        found = None
+        if graded.solved:
+            if accept(graded, steps):
+                found = problem.copy(), graded
+            else:
+                found = _dig_targeted(
+                    problem, pairs[i + 1 :], accept, max_rating, budget
+                )
+
+        problem.flat[removed] = digits
+        if found is not None:
+            return found
+
+    return None
+
+
+def _pair_cells(cell: Cell) -> np.ndarray:
+    """Flat indices of a cell and its symmetric partner, once for the centre"""
+    r, c = cell
+    return np.array(list(dict.fromkeys([flat_index(cell), flat_index((8 - r, 8 - c))])))
+
+
+def generate_many(
+    n: int,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    max_clues: int = 30,
+    permutations: int = 1000,
+) -> Iterator[np.ndarray]:
+    """
+    Generate many problems across a pool of processes. Each problem has its
+    own random stream derived from seed, so a given seed always produces the
+    same set of problems regardless of the number of workers.
+
+    Args:
+        n: number of problems to generate
+        workers: number of processes, defaults to the number of CPUs. With a
+            single worker problems are generated in this process.
+        seed: seed for the random streams, or None for a random seed
+        max_clues: stop digging a problem once it has this many clues or
+            fewer. This is best effort: a problem from which no more clues can
+            be removed is returned with more
+        permutations: permutations applied to each solution
+
+    Returns:
+        Problems with a unique solution, in the order they complete
+    """
+    seeds = random.Random(seed)
+    tasks = ((seeds.getrandbits(64), max_clues, permutations) for _ in range(n))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from (_generate_seeded(*task) for task in tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # keep a bounded number of tasks in flight so n can be very large
+        window = 4 * workers
+        pending = set()
+        for task in tasks:
+            pending.add(executor.submit(_generate_seeded, *task))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+
+def _generate_seeded(task_seed: int, max_clues: int, permutations: int) -> np.ndarray:
+    rng = random.Random(task_seed)
+    solution = generate_solution(permutations=permutations, rng=rng)
+    return dig_problem(solution, max_clues, rng)
+
+
+def permute_row_blocks(
+    grid: np.ndarray, rng: Optional[random.Random] = None
+) -> np.ndarray:
+    rng = rng or random
     a, b, c = 0, 1, 2
     while (a, b, c) == (0, 1, 2):
-        a, b, c = random.sample([0, 1, 2], k=3)
+        a, b, c = rng.sample([0, 1, 2], k=3)
     return np.concatenate(
         [
             grid[a * 3 : a * 3 + 3, :],
@@ -86,10 +400,13 @@ def permute_row_blocks(grid: np.ndarray) -> np.ndarray:
     )
 
 
-def permute_col_blocks(grid: np.ndarray) -> np.ndarray:
+def permute_col_blocks(
+    grid: np.ndarray, rng: Optional[random.Random] = None
+) -> np.ndarray:
+    rng = rng or random
     a, b, c = 0, 1, 2
     while (a, b, c) == (0, 1, 2):
-        a, b, c = random.sample([0, 1, 2], k=3)
+        a, b, c = rng.sample([0, 1, 2], k=3)
     return np.concatenate(
         [
             grid[:, a * 3 : a * 3 + 3],
@@ -100,22 +417,24 @@ def permute_col_blocks(grid: np.ndarray) -> np.ndarray:
     )
 
 
-def permute_rows(grid: np.ndarray) -> np.ndarray:
+def permute_rows(grid: np.ndarray, rng: Optional[random.Random] = None) -> np.ndarray:
+    rng = rng or random
     grid = grid.copy()
-    block = random.randint(0, 2)
-    a, b = random.sample([0, 1, 2], k=2)
+    block = rng.randint(0, 2)
+    a, b = rng.sample([0, 1, 2], k=2)
     while (a, b) in [(0, 1), (1, 2)]:
-        a, b = random.sample([0, 1, 2], k=2)
+        a, b = rng.sample([0, 1, 2], k=2)
     grid[[block * 3 + a, block * 3 + b]] = grid[[block * 3 + b, block * 3 + a]]
     return grid
 
 
-def permute_cols(grid: np.ndarray) -> np.ndarray:
+def permute_cols(grid: np.ndarray, rng: Optional[random.Random] = None) -> np.ndarray:
+    rng = rng or random
     grid = grid.copy()
-    block = random.randint(0, 2)
-    a, b = random.sample([0, 1, 2], k=2)
+    block = rng.randint(0, 2)
+    a, b = rng.sample([0, 1, 2], k=2)
     while (a, b) in [(0, 1), (1, 2)]:
-        a, b = random.sample([0, 1, 2], k=2)
+        a, b = rng.sample([0, 1, 2], k=2)
     grid[:, [block * 3 + a, block * 3 + b]] = grid[:, [block * 3 + b, block * 3 + a]]
     return grid
 
@@ -125,7 +444,7 @@ def main(finders, min_match):
     print()
     print(grid)
     print(create_candidate_grid(grid))
-    print("".join([str(int(grid[r, c])) for r in range(9) for c in range(9)]))
+    print(format_grid(grid))
     for finder in finders:
         print(finder(grid, create_candidate_grid(grid)))
 
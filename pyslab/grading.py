@@ -0,0 +1,234 @@
+"""Difficulty grading
+
+A puzzle is graded by solving it with the easiest strategy that makes progress
+at every step, restarting from the easiest after each one. Its rating is the
+difficulty of the hardest strategy it needed, on a scale loosely following
+Sudoku Explainer, so puzzles can be compared and filtered by rating.
+"""
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+import numpy as np
+
+from .core.topology import TOPOLOGY
+from .core.types import Candidate, Elimination, Placement
+from .solver import (
+    ELIMINATION_STRATEGIES,
+    GRID_STRATEGIES,
+    create_candidate_grid,
+    make_elimination,
+    make_placements,
+)
+from .steps import Step, StepSink
+from .strategies import hidden_single, naked_single
+
+DIFFICULTY: Dict[str, float] = {
+    "Hidden Single": 1.5,
+    "Naked Single": 2.3,
+    "Pointing": 2.6,
+    "Box/Line Reduction": 2.8,
+    "Naked Pair": 3.0,
+    "X-Wing": 3.2,
+    "Hidden Pair": 3.4,
+    "Naked Triple": 3.6,
+    "Swordfish": 3.8,
+    "Hidden Triple": 4.0,
+    "Naked Quad": 5.0,
+    "Jellyfish": 5.2,
+    "Hidden Quad": 5.4,
+}
+
+# rating of a puzzle the strategies cannot finish
+UNSOLVED_RATING = 10.0
+
+
+class Grade(NamedTuple):
+    rating: float
+    hardest: Optional[str]
+    counts: Dict[str, int]
+    solved: bool
+
+
+class _Strategy(NamedTuple):
+    name: str
+    difficulty: float
+    find_eliminations: Callable
+    per_house: bool
+
+
+# elimination strategies, easiest first
+STRATEGIES: List[_Strategy] = sorted(
+    [
+        _Strategy(name, DIFFICULTY[name], find_eliminations, True)
+        for name, find_eliminations in ELIMINATION_STRATEGIES
+    ]
+    + [
+        _Strategy(name, DIFFICULTY[name], find_all_eliminations, False)
+        for name, find_all_eliminations in GRID_STRATEGIES
+    ],
+    key=lambda strategy: strategy.difficulty,
+)
+
+# marks a strategy spanning several houses as stalled
+_GRID = -1
+
+
+def grade(
+    grid: np.ndarray,
+    max_rating: Optional[float] = None,
+    sink: Optional[StepSink] = None,
+) -> Grade:
+    """
+    Grade a puzzle by the strategies needed to solve it
+    Args:
+        grid: 2-d array sudoku core, which is left unchanged
+        max_rating: skip strategies harder than this, so puzzles which need
+            them stop early and are rated as unsolved
+        sink: optional callable which receives a Step for each strategy applied
+
+    Returns:
+        Grade with the rating, the hardest strategy used, the number of times
+        each strategy was used and whether the puzzle was solved. Singles are
+        counted per digit placed, other strategies per application. Puzzles
+        the strategies cannot finish are rated UNSOLVED_RATING.
+    """
+    grid = grid.copy()
+    candidates = create_candidate_grid(grid)
+    strategies = [
+        strategy
+        for strategy in STRATEGIES
+        if max_rating is None or strategy.difficulty <= max_rating
+    ]
+    counts: Dict[str, int] = {}
+
+    # houses each strategy is known to make no progress in
+    stalled: List[Set[int]] = [set() for _ in strategies]
+    _place_singles(grid, candidates, counts, max_rating, sink)
+
+    solved = not (grid == 0).any()
+    while not solved:
+        touched = _apply_easiest_strategy(
+            grid, candidates, strategies, stalled, counts, sink
+        )
+        if not touched:
+            break
+        touched |= _place_singles(grid, candidates, counts, max_rating, sink)
+        for houses in stalled:
+            houses.difference_update(touched)
+            houses.discard(_GRID)
+        solved = not (grid == 0).any()
+
+    hardest = max(counts, key=DIFFICULTY.__getitem__, default=None)
+    if solved:
+        rating = DIFFICULTY[hardest] if hardest is not None else 0.0
+    else:
+        rating = UNSOLVED_RATING
+    return Grade(rating, hardest, counts, solved)
+
+
+def _place_singles(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    counts: Dict[str, int],
+    max_rating: Optional[float],
+    sink: Optional[StepSink] = None,
+) -> Set[int]:
+    """
+    Place hidden singles, falling back to naked singles, until there are none
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        counts: number of uses of each strategy, updated in place
+        max_rating: skip singles which are harder than this
+        sink: optional callable which receives a Step for each strategy applied
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    hidden = max_rating is None or DIFFICULTY["Hidden Single"] <= max_rating
+    naked = max_rating is None or DIFFICULTY["Naked Single"] <= max_rating
+    touched = set()
+    no_cells = np.empty(0, dtype=np.intp)
+    while True:
+        cells = digits = no_cells
+        if hidden:
+            _, cells, digits = hidden_single.find_all_placements(grid, candidates)
+        name = "Hidden Single"
+        if not cells.size and naked:
+            cells, digits = naked_single.find_all_placements(grid, candidates)
+            name = "Naked Single"
+        if not cells.size:
+            return touched
+
+        counts[name] = counts.get(name, 0) + int(cells.size)
+        touched |= make_placements(grid, candidates, cells, digits)
+        if sink is not None:
+            placements = [
+                Placement(TOPOLOGY.cells[cell], digit)
+                for cell, digit in zip(cells.tolist(), digits.tolist())
+            ]
+            sink(Step(name, None, placements, []))
+
+
+def _apply_easiest_strategy(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    strategies: List[_Strategy],
+    stalled: List[Set[int]],
+    counts: Dict[str, int],
+    sink: Optional[StepSink] = None,
+) -> Set[int]:
+    """
+    Apply the easiest strategy which makes progress anywhere in the core
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        strategies: strategies to try, easiest first
+        stalled: houses each strategy is known to make no progress in,
+            updated in place
+        counts: number of uses of each strategy, updated in place
+        sink: optional callable which receives a Step for each strategy applied
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    for strategy, houses in zip(strategies, stalled):
+        if strategy.per_house:
+            for house in range(27):
+                if house in houses:
+                    continue
+                cells = TOPOLOGY.house_cells[house]
+                eliminations = strategy.find_eliminations(grid, candidates, cells)
+                touched = _eliminate(candidates, eliminations)
+                if touched:
+                    counts[strategy.name] = counts.get(strategy.name, 0) + 1
+                    if sink is not None:
+                        sink(Step(strategy.name, house, [], _removed(eliminations)))
+                    return touched
+                houses.add(house)
+
+        elif _GRID not in houses:
+            eliminations = strategy.find_eliminations(grid, candidates)
+            touched = _eliminate(candidates, eliminations)
+            if touched:
+                counts[strategy.name] = counts.get(strategy.name, 0) + 1
+                if sink is not None:
+                    sink(Step(strategy.name, None, [], _removed(eliminations)))
+                return touched
+            houses.add(_GRID)
+
+    return set()
+
+
+def _eliminate(candidates: np.ndarray, eliminations: List[Elimination]) -> Set[int]:
+    touched = set()
+    for elimination in eliminations:
+        touched |= make_elimination(candidates, elimination)
+    return touched
+
+
+def _removed(eliminations: List[Elimination]) -> List[Candidate]:
+    return [
+        candidate
+        for elimination in eliminations
+        for candidate in elimination.candidates
+    ]
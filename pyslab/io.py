@@ -0,0 +1,140 @@
+"""Puzzle file I/O
+
+Reads and writes the common line format where each puzzle is 81 characters,
+row by row, with ``0`` or ``.`` for an empty cell. Characters after the first
+81 on a line are ignored, as are blank lines and lines starting with ``#``.
+Files ending in ``.gz`` are compressed and decompressed transparently.
+
+Grids are read as ``uint8`` arrays, and files are processed in chunks so that
+large corpora never need to be held in memory.
+"""
+import gzip
+from itertools import islice
+from typing import IO, Iterable, Iterator, List
+
+import numpy as np
+
+_ZERO, _DOT = ord("0"), ord(".")
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="ascii")
+    return open(path, mode, encoding="ascii")
+
+
+def _parse_lines(lines: List[str]) -> np.ndarray:
+    """
+    Parse puzzle lines into an (N, 9, 9) array
+    Args:
+        lines: lines of at least 81 characters
+
+    Returns:
+        (N, 9, 9) uint8 array of grids
+    """
+    if any(len(line) < 81 for line in lines):
+        raise ValueError("Puzzle lines must contain at least 81 characters")
+
+    buffer = np.frombuffer(
+        "".join(line[:81] for line in lines).encode("ascii"), dtype=np.uint8
+    )
+    values = np.where(buffer == _DOT, _ZERO, buffer) - _ZERO
+    if ((values < 0) | (values > 9)).any():
+        raise ValueError("Puzzle lines may only contain digits and '.'")
+    return values.astype(np.uint8).reshape([-1, 9, 9])
+
+
+def _puzzle_lines(f: IO[str]) -> Iterator[str]:
+    for line in f:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def parse_grid(puzzle: str) -> np.ndarray:
+    """
+    Parse a single puzzle string
+    Args:
+        puzzle: 81 characters, 0 or . for an empty cell
+
+    Returns:
+        2-d uint8 array sudoku core
+    """
+    return _parse_lines([puzzle.strip()])[0]
+
+
+def format_grid(grid: np.ndarray, blank: str = "0") -> str:
+    """
+    Format a grid as a single puzzle string
+    Args:
+        grid: 2-d array sudoku core
+        blank: character used for an empty cell
+
+    Returns:
+        81 character puzzle string
+    """
+    return "".join(str(int(digit)) if digit else blank for digit in grid.flatten())
+
+
+def read_chunks(path: str, chunk_size: int = 65536) -> Iterator[np.ndarray]:
+    """
+    Read puzzles from a file in chunks
+    Args:
+        path: file to read, gzip compressed if it ends with .gz
+        chunk_size: maximum number of puzzles in each chunk
+
+    Returns:
+        (N, 9, 9) uint8 arrays of at most chunk_size grids
+    """
+    with _open(path, "r") as f:
+        lines = _puzzle_lines(f)
+        chunk = list(islice(lines, chunk_size))
+        while chunk:
+            yield _parse_lines(chunk)
+            chunk = list(islice(lines, chunk_size))
+
+
+def read_grids(path: str, chunk_size: int = 65536) -> Iterator[np.ndarray]:
+    """
+    Read puzzles from a file one at a time
+    Args:
+        path: file to read, gzip compressed if it ends with .gz
+        chunk_size: number of puzzles parsed together
+
+    Returns:
+        2-d uint8 array sudoku cores
+    """
+    for chunk in read_chunks(path, chunk_size):
+        yield from chunk
+
+
+def _format_chunk(grids: np.ndarray, blank: str) -> str:
+    values = np.asarray(grids).reshape([-1, 81]).astype(np.uint8) + _ZERO
+    values[values == _ZERO] = ord(blank)
+    lines = np.empty([len(values), 82], dtype=np.uint8)
+    lines[:, :81] = values
+    lines[:, 81] = ord("\n")
+    return lines.tobytes().decode("ascii")
+
+
+def write_grids(path: str, grids: Iterable[np.ndarray], blank: str = "0") -> int:
+    """
+    Write puzzles to a file as they are produced
+    Args:
+        path: file to write, gzip compressed if it ends with .gz
+        grids: 2-d sudoku cores, (N, 9, 9) stacks of cores, or a mixture
+        blank: character used for an empty cell
+
+    Returns:
+        Number of puzzles written
+    """
+    if isinstance(grids, np.ndarray):
+        grids = [grids]
+
+    written = 0
+    with _open(path, "w") as f:
+        for grids_or_grid in grids:
+            chunk = np.asarray(grids_or_grid).reshape([-1, 81])
+            f.write(_format_chunk(chunk, blank))
+            written += len(chunk)
+    return written
@@ -1,94 +1,393 @@
 """Sudoku Solver"""
+from collections import deque
+from time import perf_counter
+from typing import List, Optional, Set
+
 import numpy as np
 
-from .core.cells import row_cells, column_cells, box_cells
-from .core.digits import peer_digits
-from .core.peers import all_peer_cells
-from .core.types import Cell, Elimination, Placement
-from .strategies import hidden_single, naked_single, naked_pair, hidden_pair
+from .core.bitmask import ALL_DIGITS, CANDIDATE_DTYPE, digit_mask, popcount
+from .core.digits import all_peer_masks
+from .core.hybrid import HybridSearch
+from .core.topology import HOUSE_TYPES, TOPOLOGY, flat_index
+from .core.types import Elimination, Placement
+from .stats import SolveStats
+from .steps import Step, StepSink
+from .strategies import (
+    box_line,
+    hidden_pair,
+    hidden_quad,
+    hidden_single,
+    hidden_triple,
+    jellyfish,
+    naked_pair,
+    naked_quad,
+    naked_single,
+    naked_triple,
+    pointing,
+    swordfish,
+    x_wing,
+)
+
+
+# strategies are tried cheapest first, restarting after any progress
+ELIMINATION_STRATEGIES = [
+    ("Naked Pair", naked_pair.find_eliminations),
+    ("Hidden Pair", hidden_pair.find_eliminations),
+    ("Naked Triple", naked_triple.find_eliminations),
+    ("Hidden Triple", hidden_triple.find_eliminations),
+    ("Naked Quad", naked_quad.find_eliminations),
+    ("Hidden Quad", hidden_quad.find_eliminations),
+]
 
+# strategies which look across several houses, tried once every house stalls
+GRID_STRATEGIES = [
+    ("Pointing", pointing.find_all_eliminations),
+    ("Box/Line Reduction", box_line.find_all_eliminations),
+    ("X-Wing", x_wing.find_all_eliminations),
+    ("Swordfish", swordfish.find_all_eliminations),
+    ("Jellyfish", jellyfish.find_all_eliminations),
+]
 
-def solve(grid: np.ndarray):
 
+def solve(
+    grid: np.ndarray,
+    sink: Optional[StepSink] = None,
+    search: bool = False,
+    stats: Optional[SolveStats] = None,
+):
+    """
+    Solve a core in place by repeatedly applying logical strategies. Singles
+    are found across the whole core at once; the elimination strategies run
+    house by house, and only on houses which changed since they last ran.
+    Strategies spanning several houses are tried once every house stalls.
+    Args:
+        grid: 2-d array sudoku core
+        sink: optional callable which receives a Step for each strategy applied
+        search: if the strategies stall, finish with a backtracking search
+            which propagates singles at every node, starting from the
+            candidates the strategies left
+        stats: optional SolveStats which records calls, progress and time
+            for each strategy, and the nodes of any search
+
+    Returns:
+        The core, solved as far as the strategies allow
+    """
     candidates = create_candidate_grid(grid)
+    _apply_strategies(grid, candidates, sink, stats)
 
-    progress = True
-
-    while progress:
-        progress = False
-
-        for house in range(9):
-            for desc, cells in [
-                (f"row {house}", row_cells(house)),
-                (f"column {house}", column_cells(house)),
-                (f"box {house}", box_cells(house)),
-            ]:
-
-                for placement in naked_single.find_placements(grid, candidates, cells):
-                    progress = make_placement(
-                        grid,
-                        candidates,
-                        placement,
-                        f"Naked Single in {desc}, ",
-                    )
-
-                for placement in hidden_single.find_placements(grid, candidates, cells):
-                    progress = make_placement(
-                        grid,
-                        candidates,
-                        placement,
-                        f"Hidden Single in {desc}, ",
-                    )
-
-                for elimination in naked_pair.find_eliminations(
-                    grid, candidates, cells
-                ):
-                    progress = make_elimination(
-                        candidates, elimination, f"Naked Pair in {desc}, "
-                    )
-
-                for elimination in hidden_pair.find_eliminations(
-                    grid, candidates, cells
-                ):
-                    progress = make_elimination(
-                        candidates, elimination, f"Hidden Pair in {desc}, "
-                    )
+    if search and (grid == 0).any():
+        _finish_with_search(grid, candidates, sink, stats)
     return grid
 
 
+def _apply_strategies(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    sink: Optional[StepSink] = None,
+    stats: Optional[SolveStats] = None,
+) -> None:
+    """
+    Apply strategies until none of them make progress
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        sink: optional callable which receives a Step for each strategy applied
+        stats: optional SolveStats to record each strategy in
+    """
+
+    # houses whose cells changed since strategies last ran on them
+    dirty = deque(range(27))
+    queued = set(dirty)
+    touched = _place_singles(grid, candidates, sink, stats)
+
+    while True:
+        for house in touched:
+            if house not in queued:
+                dirty.append(house)
+                queued.add(house)
+        if dirty:
+            house = dirty.popleft()
+            queued.remove(house)
+            touched = _apply_cheapest_strategy(grid, candidates, house, sink, stats)
+        else:
+            touched = _apply_cheapest_grid_strategy(grid, candidates, sink, stats)
+            if not touched:
+                return
+
+        if touched:
+            touched |= _place_singles(grid, candidates, sink, stats)
+
+
+def _finish_with_search(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    sink: Optional[StepSink] = None,
+    stats: Optional[SolveStats] = None,
+) -> None:
+    """
+    Fill the remaining cells with the first solution found by search
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        sink: optional callable which receives a Step for each strategy applied
+        stats: optional SolveStats to record the search in
+    """
+    start = perf_counter() if stats is not None else 0.0
+    search = HybridSearch(grid, candidates=candidates)
+    solution = next(search.solutions(), None)
+    if stats is not None:
+        stats.searches += 1
+        stats.search_nodes += search.nodes
+        stats.search_time += perf_counter() - start
+    if solution is None:
+        return
+
+    cells = np.flatnonzero(grid.reshape(-1) == 0)
+    digits = np.array([solution[cell].bit_length() - 1 for cell in cells.tolist()])
+    make_placements(grid, candidates, cells, digits)
+    if sink is not None:
+        sink(Step("Search", None, _placements(cells, digits), []))
+
+
+def _place_singles(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    sink: Optional[StepSink] = None,
+    stats: Optional[SolveStats] = None,
+) -> Set[int]:
+    """
+    Place naked singles, then hidden singles, across the whole core until
+    there are none left
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        sink: optional callable which receives a Step for each strategy applied
+        stats: optional SolveStats to record each strategy in
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    touched = set()
+    while True:
+        start = perf_counter() if stats is not None else 0.0
+        cells, digits = naked_single.find_all_placements(grid, candidates)
+        if cells.size:
+            touched |= make_placements(grid, candidates, cells, digits)
+        if stats is not None:
+            stats.record("Naked Single", "grid", start, placements=cells.size)
+        if cells.size:
+            if sink is not None:
+                sink(Step("Naked Single", None, _placements(cells, digits), []))
+            continue
+
+        start = perf_counter() if stats is not None else 0.0
+        houses, cells, digits = hidden_single.find_all_placements(grid, candidates)
+        if cells.size:
+            touched |= make_placements(grid, candidates, cells, digits)
+        if stats is not None:
+            stats.record("Hidden Single", "grid", start, placements=cells.size)
+        if not cells.size:
+            return touched
+
+        if sink is not None:
+            for house in dict.fromkeys(houses.tolist()):
+                in_house = houses == house
+                placements = _placements(cells[in_house], digits[in_house])
+                sink(Step("Hidden Single", house, placements, []))
+
+
+def _placements(cells: np.ndarray, digits: np.ndarray) -> List[Placement]:
+    return [
+        Placement(TOPOLOGY.cells[cell], digit)
+        for cell, digit in zip(cells.tolist(), digits.tolist())
+    ]
+
+
+def _apply_eliminations(
+    candidates: np.ndarray,
+    eliminations: List[Elimination],
+    stats: Optional[SolveStats],
+    name: str,
+    house_type: str,
+    start: float,
+) -> Set[int]:
+    """Remove candidates, recording the strategy which found them"""
+    before = int(popcount(candidates).sum()) if stats is not None else 0
+    touched = set()
+    for elimination in eliminations:
+        touched |= make_elimination(candidates, elimination)
+    if stats is not None:
+        removed = before - int(popcount(candidates).sum())
+        stats.record(name, house_type, start, eliminations=removed)
+    return touched
+
+
+def _apply_cheapest_strategy(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    house: int,
+    sink: Optional[StepSink] = None,
+    stats: Optional[SolveStats] = None,
+) -> Set[int]:
+    """
+    Apply the first elimination strategy which makes progress in a house
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        house: house id between 0 and 26
+        sink: optional callable which receives a Step for each strategy applied
+        stats: optional SolveStats to record each strategy in
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    cells = TOPOLOGY.house_cells[house]
+    house_type = HOUSE_TYPES[house // 9]
+
+    for name, find_eliminations in ELIMINATION_STRATEGIES:
+        start = perf_counter() if stats is not None else 0.0
+        eliminations = find_eliminations(grid, candidates, cells)
+        touched = _apply_eliminations(
+            candidates, eliminations, stats, name, house_type, start
+        )
+        if touched:
+            if sink is not None:
+                removed = [
+                    candidate
+                    for elimination in eliminations
+                    for candidate in elimination.candidates
+                ]
+                sink(Step(name, house, [], removed))
+            return touched
+
+    return set()
+
+
+def _apply_cheapest_grid_strategy(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    sink: Optional[StepSink] = None,
+    stats: Optional[SolveStats] = None,
+) -> Set[int]:
+    """
+    Apply the first strategy spanning several houses which makes progress
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        sink: optional callable which receives a Step for each strategy applied
+        stats: optional SolveStats to record each strategy in
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    for name, find_all_eliminations in GRID_STRATEGIES:
+        start = perf_counter() if stats is not None else 0.0
+        eliminations = find_all_eliminations(grid, candidates)
+        touched = _apply_eliminations(
+            candidates, eliminations, stats, name, "grid", start
+        )
+        if touched:
+            if sink is not None:
+                removed = [
+                    candidate
+                    for elimination in eliminations
+                    for candidate in elimination.candidates
+                ]
+                sink(Step(name, None, [], removed))
+            return touched
+
+    return set()
+
+
 def make_placement(
-    grid: np.ndarray, candidates: np.ndarray, placement: Placement, message: str = ""
-) -> bool:
-    print(f"{message}Placing {placement.digit} into {placement.cell}")
+    grid: np.ndarray, candidates: np.ndarray, placement: Placement
+) -> Set[int]:
+    """
+    Place a digit and remove it from the candidates of its peers
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        placement: digit to place and the cell to place it in
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
     grid[placement.cell] = placement.digit
-    candidates[placement.cell] = [placement.digit]
+    candidates[placement.cell] = digit_mask(placement.digit)
 
     # propagate changes through candidates
-    for peer_cell in all_peer_cells(placement.cell):
-        if placement.digit in candidates[peer_cell]:
-            candidates[peer_cell].remove(placement.digit)
+    flat = flat_index(placement.cell)
+    peer_index = TOPOLOGY.peer_index[flat]
+    peer_candidates = candidates[peer_index]
+    changed = TOPOLOGY.peers[flat][(peer_candidates & candidates[placement.cell]) > 0]
+    candidates[peer_index] = peer_candidates & (
+        ALL_DIGITS ^ digit_mask(placement.digit)
+    )
+
+    return set(TOPOLOGY.cell_houses[flat].tolist()) | set(
+        TOPOLOGY.cell_houses[changed].flatten().tolist()
+    )
+
+
+def make_placements(
+    grid: np.ndarray, candidates: np.ndarray, cells: np.ndarray, digits: np.ndarray
+) -> Set[int]:
+    """
+    Place several digits at once and remove them from the candidates of their
+    peers
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        cells: flat indices of the cells to place digits in
+        digits: digit to place in each cell
 
-    return True
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    bits = np.left_shift(1, digits).astype(CANDIDATE_DTYPE)
+    removed = np.zeros(81, dtype=CANDIDATE_DTYPE)
+    np.bitwise_or.at(removed, TOPOLOGY.peers[cells].ravel(), np.repeat(bits, 20))
+
+    masks = candidates.reshape(-1)
+    updated = masks & ~removed
+    updated[cells] = bits
+    changed = np.flatnonzero(updated != masks)
+
+    candidates[:] = updated.reshape(candidates.shape)
+    grid[TOPOLOGY.rows[cells], TOPOLOGY.columns[cells]] = digits
+
+    return set(TOPOLOGY.cell_houses[np.union1d(changed, cells)].ravel().tolist())
 
 
 def make_elimination(
     candidates: np.ndarray,
     elimination: Elimination,
-    message: str = "",
-) -> bool:
-    print(f"{message}Eliminating {elimination.candidates}")
+) -> Set[int]:
+    """
+    Remove candidates from cells
+    Args:
+        candidates: candidate core
+        elimination: candidates to remove
+
+    Returns:
+        Ids of houses containing cells that were changed
+    """
+    touched = set()
     for candidate in elimination.candidates:
-        candidates[candidate.cell].remove(candidate.digit)
+        bit = digit_mask(candidate.digit)
+        if candidates[candidate.cell] & bit:
+            candidates[candidate.cell] &= ALL_DIGITS ^ bit
+            touched.update(TOPOLOGY.cell_houses[flat_index(candidate.cell)].tolist())
 
-    return True
+    return touched
 
 
 def create_candidate_grid(grid: np.ndarray) -> np.ndarray:
     """
-    Generate a 2-d array of candidate Sets. Each cell in the
-    array contains a set of candidates that may occur in that
-    position. A fully solved core will return a candidate
-    core of single-cell sets.
+    Generate a 2-d array of candidate masks. Each cell in the
+    array contains a bitmask of candidates that may occur in that
+    position, with bit d set if digit d is a candidate. A fully
+    solved core will return a candidate core of single-digit masks.
 
     Args:
         grid: 2-d array sudoku core
@@ -96,18 +395,8 @@ def create_candidate_grid(grid: np.ndarray) -> np.ndarray:
     Returns:
         Candidate core
     """
-    return np.array(
-        [
-            [
-                [
-                    digit
-                    for digit in range(1, 10)
-                    if digit not in peer_digits(grid, Cell(r, c))
-                ]
-                if grid[r, c] == 0
-                else [grid[r, c]]
-                for c in range(9)
-            ]
-            for r in range(9)
-        ]
+    values = grid.reshape(-1).astype(np.intp)
+    candidates = np.where(
+        values == 0, ALL_DIGITS & ~all_peer_masks(grid), np.left_shift(1, values)
     )
+    return candidates.astype(CANDIDATE_DTYPE).reshape([9, 9])
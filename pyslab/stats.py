@@ -0,0 +1,113 @@
+"""Solver instrumentation
+
+Pass a SolveStats to ``solve`` or the brute force search functions to record
+where time goes. Strategies are recorded by name and by the type of house they
+ran on: ``row``, ``column`` or ``box``, or ``grid`` for strategies that look at
+the whole core at once. When no stats object is passed, the only cost is a
+check against None at each strategy call.
+"""
+from time import perf_counter
+from typing import Any, Dict, Tuple
+
+
+class StrategyStats:
+    """
+    Counters for one strategy on one type of house
+
+    Attributes:
+        calls: number of times the strategy was run
+        hits: number of runs which made progress
+        placements: digits placed
+        eliminations: candidates removed
+        time: seconds spent finding and applying the strategy
+    """
+
+    __slots__ = ("calls", "hits", "placements", "eliminations", "time")
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.placements = 0
+        self.eliminations = 0
+        self.time = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SolveStats:
+    """
+    Counters for a solver run, which accumulate over every call they are
+    passed to
+
+    Attributes:
+        strategies: StrategyStats keyed by (strategy name, house type)
+        searches: number of brute force searches
+        search_nodes: branches tried by brute force searches
+        search_time: seconds spent in brute force searches
+    """
+
+    def __init__(self):
+        self.strategies: Dict[Tuple[str, str], StrategyStats] = {}
+        self.searches = 0
+        self.search_nodes = 0
+        self.search_time = 0.0
+
+    def record(
+        self,
+        strategy: str,
+        house_type: str,
+        start: float,
+        placements: int = 0,
+        eliminations: int = 0,
+    ) -> None:
+        """
+        Record one run of a strategy
+        Args:
+            strategy: strategy name
+            house_type: row, column, box or grid
+            start: perf_counter value when the strategy started
+            placements: digits placed
+            eliminations: candidates removed
+        """
+        elapsed = perf_counter() - start
+        key = (strategy, house_type)
+        counters = self.strategies.get(key)
+        if counters is None:
+            counters = self.strategies[key] = StrategyStats()
+        counters.calls += 1
+        counters.hits += bool(placements or eliminations)
+        counters.placements += placements
+        counters.eliminations += eliminations
+        counters.time += elapsed
+
+    def by_strategy(self) -> Dict[str, StrategyStats]:
+        """
+        Combine the counters of each strategy over every house type
+        Returns:
+            StrategyStats keyed by strategy name
+        """
+        combined: Dict[str, StrategyStats] = {}
+        for (strategy, _), counters in self.strategies.items():
+            total = combined.setdefault(strategy, StrategyStats())
+            for name in StrategyStats.__slots__:
+                setattr(total, name, getattr(total, name) + getattr(counters, name))
+        return combined
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Export the counters as plain data, for logging or JSON
+        Returns:
+            Nested dict of strategy counters and search counters
+        """
+        strategies: Dict[str, Dict[str, Any]] = {}
+        for (strategy, house_type), counters in self.strategies.items():
+            strategies.setdefault(strategy, {})[house_type] = counters.to_dict()
+        return {
+            "strategies": strategies,
+            "search": {
+                "searches": self.searches,
+                "nodes": self.search_nodes,
+                "time": self.search_time,
+            },
+        }
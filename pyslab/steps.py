@@ -0,0 +1,46 @@
+"""Structured solver steps
+
+The solver reports each strategy it applies as a Step passed to an optional
+sink. A sink is any callable taking a Step: ``steps.append`` collects steps in
+a list, and LoggingSink forwards them to the ``logging`` module. Steps are only
+formatted as text when a sink asks for it.
+"""
+import logging
+from typing import Callable, List, NamedTuple, Optional
+
+from .core.topology import house_name
+from .core.types import Candidate, Placement
+
+
+class Step(NamedTuple):
+    strategy: str
+    house: Optional[int]
+    placements: List[Placement]
+    eliminations: List[Candidate]
+
+    def __str__(self) -> str:
+        where = f" in {house_name(self.house)}" if self.house is not None else ""
+        actions = [
+            f"Placing {placement.digit} into {placement.cell}"
+            for placement in self.placements
+        ]
+        if self.eliminations:
+            actions.append(f"Eliminating {self.eliminations}")
+        return f"{self.strategy}{where}, {', '.join(actions)}"
+
+
+StepSink = Callable[[Step], None]
+
+
+class LoggingSink:
+    """
+    Step sink which logs each step, formatting it only if the logger is
+    enabled for the level
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("pyslab.solver")
+        self.level = level
+
+    def __call__(self, step: Step) -> None:
+        self.logger.log(self.level, "%s", step)
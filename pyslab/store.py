@@ -0,0 +1,222 @@
+"""Memory-mapped binary puzzle store
+
+A store is a 32 byte header followed by fixed-size little-endian records, one
+per puzzle. Each record holds the 81 puzzle digits as bytes and, depending on
+the header flags, the 81 solution digits, the clue count and a difficulty.
+
+Records are read through ``np.memmap``, so ``PuzzleStore.puzzles`` is an
+(N, 9, 9) ``uint8`` view of the file and any puzzle can be accessed without
+loading the rest of the store into memory.
+"""
+from itertools import repeat
+from typing import Iterable, Optional
+
+import numpy as np
+
+MAGIC = b"PYSLABPZ"
+VERSION = 1
+
+HAS_SOLUTIONS = 1
+HAS_CLUES = 2
+HAS_DIFFICULTY = 4
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u2"),
+        ("flags", "<u2"),
+        ("reserved", "<u4"),
+        ("count", "<u8"),
+        ("padding", "V8"),
+    ]
+)
+
+
+def record_dtype(flags: int) -> np.dtype:
+    """
+    Build the record layout for a set of header flags
+    Args:
+        flags: combination of HAS_SOLUTIONS, HAS_CLUES and HAS_DIFFICULTY
+
+    Returns:
+        Structured dtype of a single puzzle record
+    """
+    fields = [("puzzle", "u1", (9, 9))]
+    if flags & HAS_SOLUTIONS:
+        fields.append(("solution", "u1", (9, 9)))
+    if flags & HAS_CLUES:
+        fields.append(("clues", "u1"))
+    if flags & HAS_DIFFICULTY:
+        fields.append(("difficulty", "<f4"))
+    return np.dtype(fields)
+
+
+class StoreWriter:
+    """
+    Append puzzles to a new store in chunks. The puzzle count in the header
+    is written when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        solutions: bool = False,
+        clues: bool = True,
+        difficulty: bool = False,
+    ):
+        self.flags = (
+            (HAS_SOLUTIONS if solutions else 0)
+            | (HAS_CLUES if clues else 0)
+            | (HAS_DIFFICULTY if difficulty else 0)
+        )
+        self.dtype = record_dtype(self.flags)
+        self.count = 0
+        self._file = open(path, "wb")  # pylint: disable=consider-using-with
+        self._write_header()
+
+    def _write_header(self) -> None:
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["flags"] = self.flags
+        header["count"] = self.count
+        self._file.seek(0)
+        self._file.write(header.tobytes())
+
+    def append(
+        self,
+        puzzles: np.ndarray,
+        solutions: Optional[np.ndarray] = None,
+        difficulty: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Append a chunk of puzzles
+        Args:
+            puzzles: (N, 9, 9) puzzles, or a single 9x9 puzzle
+            solutions: (N, 9, 9) solutions, required if the store has solutions
+            difficulty: (N,) difficulty, required if the store has difficulty
+        """
+        puzzles = np.asarray(puzzles).reshape([-1, 9, 9])
+        records = np.zeros(len(puzzles), dtype=self.dtype)
+        records["puzzle"] = puzzles
+
+        for flag, name, values in [
+            (HAS_SOLUTIONS, "solution", solutions),
+            (HAS_DIFFICULTY, "difficulty", difficulty),
+        ]:
+            if self.flags & flag:
+                if values is None:
+                    raise ValueError(f"Store requires a {name} for every puzzle")
+                records[name] = np.asarray(values).reshape(records[name].shape)
+
+        if self.flags & HAS_CLUES:
+            records["clues"] = (puzzles > 0).sum(axis=(1, 2))
+
+        self._file.write(records.tobytes())
+        self.count += len(records)
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._write_header()
+            self._file.close()
+
+    def __enter__(self) -> "StoreWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_store(
+    path: str,
+    puzzles: Iterable[np.ndarray],
+    solutions: Optional[Iterable[np.ndarray]] = None,
+    difficulty: Optional[Iterable[np.ndarray]] = None,
+    clues: bool = True,
+) -> int:
+    """
+    Write puzzles to a new store
+    Args:
+        path: file to write
+        puzzles: (N, 9, 9) array, or an iterable of grids or chunks of grids
+        solutions: optional solutions matching puzzles
+        difficulty: optional difficulty matching puzzles
+        clues: store the clue count of each puzzle
+
+    Returns:
+        Number of puzzles written
+    """
+    with StoreWriter(
+        path, solutions is not None, clues, difficulty is not None
+    ) as writer:
+        if isinstance(puzzles, np.ndarray):
+            writer.append(puzzles, solutions, difficulty)
+        else:
+            for chunk, chunk_solutions, chunk_difficulty in zip(
+                puzzles,
+                repeat(None) if solutions is None else solutions,
+                repeat(None) if difficulty is None else difficulty,
+            ):
+                writer.append(chunk, chunk_solutions, chunk_difficulty)
+        return writer.count
+
+
+class PuzzleStore:
+    """
+    Read-only view of a puzzle store. Columns are memory-mapped views of the
+    file, and are None if the store does not contain them.
+
+    Attributes:
+        puzzles: (N, 9, 9) uint8 puzzles
+        solutions: (N, 9, 9) uint8 solutions
+        clues: (N,) uint8 clue counts
+        difficulty: (N,) float32 difficulty
+    """
+
+    def __init__(self, path: str):
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if len(header) == 0 or header["magic"][0] != MAGIC:
+            raise ValueError(f"{path} is not a puzzle store")
+        if header["version"][0] != VERSION:
+            raise ValueError(f"Unsupported puzzle store version {header['version'][0]}")
+
+        self.flags = int(header["flags"][0])
+        count = int(header["count"][0])
+        dtype = record_dtype(self.flags)
+
+        if count:
+            self.records = np.memmap(
+                path,
+                dtype=dtype,
+                mode="r",
+                offset=HEADER_DTYPE.itemsize,
+                shape=(count,),
+            )
+        else:
+            self.records = np.zeros(0, dtype=dtype)
+
+        self.puzzles = self.records["puzzle"]
+        self.solutions = self._column("solution", HAS_SOLUTIONS)
+        self.clues = self._column("clues", HAS_CLUES)
+        self.difficulty = self._column("difficulty", HAS_DIFFICULTY)
+
+    def _column(self, name: str, flag: int) -> Optional[np.ndarray]:
+        return self.records[name] if self.flags & flag else None
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index) -> np.ndarray:
+        return self.puzzles[index]
+
+    def chunks(self, chunk_size: int = 65536) -> Iterable[np.ndarray]:
+        """
+        Iterate over the puzzles in chunks
+        Args:
+            chunk_size: maximum number of puzzles in each chunk
+
+        Returns:
+            (N, 9, 9) views of at most chunk_size puzzles
+        """
+        for start in range(0, len(self), chunk_size):
+            yield self.puzzles[start : start + chunk_size]
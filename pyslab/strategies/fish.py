@@ -0,0 +1,53 @@
+"""Find basic fish of any size
+
+A fish of size n is a set of n rows in which a digit can only go in the same
+n columns. The digit must then fill those columns within the n rows, so it is
+removed from the rest of each column. The same holds with rows and columns
+swapped. X-Wing, Swordfish and Jellyfish are fish of size 2, 3 and 4.
+
+The row positions of each digit are read from candidate planes as bitmasks,
+and the rows are combined with the subset search used for naked subsets.
+"""
+import numpy as np
+from ..core.bitmask import POPCOUNT_LIST
+from .subsets import find_subsets
+
+_COLUMN_BITS = 1 << np.arange(9)
+
+
+def _row_fish(planes: np.ndarray, size: int) -> np.ndarray:
+    """Candidates removed from columns by fish on rows, given (9, 9, 9) planes"""
+    removed = np.zeros_like(planes)
+    # bit c of row_masks[d][r] is set if digit d + 1 is a candidate in (r, c)
+    row_masks = (planes * _COLUMN_BITS).sum(axis=2).tolist()
+
+    for digit, masks in enumerate(row_masks):
+        # rows with more positions than the fish size can never be in its base
+        rows = [
+            row for row, mask in enumerate(masks) if 2 <= POPCOUNT_LIST[mask] <= size
+        ]
+        for subset in find_subsets([masks[row] for row in rows], size):
+            base = [rows[i] for i in subset]
+            cover = 0
+            for row in base:
+                cover |= masks[row]
+
+            others = [row for row in range(9) if row not in base]
+            columns = [column for column in range(9) if cover & (1 << column)]
+            cells = np.ix_(others, columns)
+            removed[digit][cells] = planes[digit][cells]
+    return removed
+
+
+def find_fish(planes: np.ndarray, size: int) -> np.ndarray:
+    """
+    Find candidates removed by fish with rows or columns as the base
+    Args:
+        planes: (9, 9, 9) candidate planes
+        size: number of lines in the base of each fish
+
+    Returns:
+        (9, 9, 9) planes of candidates to remove
+    """
+    columns = _row_fish(planes.transpose(0, 2, 1), size).transpose(0, 2, 1)
+    return _row_fish(planes, size) | columns
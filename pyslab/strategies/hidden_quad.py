@@ -0,0 +1,13 @@
+"""Find hidden quads"""
+from typing import List
+import numpy as np
+from ..core.types import Cell, Elimination
+from .subsets import find_hidden_subsets
+
+
+def find_eliminations(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    cells: List[Cell],
+) -> List[Elimination]:
+    return find_hidden_subsets(grid, candidates, cells, 4)
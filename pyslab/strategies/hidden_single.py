@@ -1,7 +1,8 @@
 """Find hidden singles"""
 from typing import List, Tuple
-from collections import Counter
 import numpy as np
+from ..core.bitmask import digit_planes, mask_digits, popcount
+from ..core.topology import TOPOLOGY
 from ..core.types import Cell, Placement
 
 
@@ -11,15 +12,44 @@ def find_placements(
     cells: List[Cell],
 ) -> List[Placement]:
 
-    digit_counts = Counter(
-        digit for cell in cells for digit in candidates[cell] if grid[cell] == 0
-    ).items()
+    seen_once, seen_twice = 0, 0
+    for cell in cells:
+        if grid[cell] == 0:
+            seen_twice |= seen_once & int(candidates[cell])
+            seen_once |= int(candidates[cell])
 
-    singles = [digit for digit, cnt in digit_counts if cnt == 1]
+    singles = seen_once & ~seen_twice
 
     return [
         Placement(cell, single)
         for cell in cells
-        for single in singles
-        if single in candidates[cell] and len(candidates[cell]) > 1
+        if popcount(candidates[cell]) > 1
+        for single in mask_digits(singles & int(candidates[cell]))
     ]
+
+
+def find_all_placements(
+    grid: np.ndarray, candidates: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the hidden singles in every house at once, by counting each digit
+    over the houses of its candidate plane. A cell which is a hidden single
+    in more than one house is only returned for the first.
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+
+    Returns:
+        House ids, flat indices of cells and digits of the hidden singles
+    """
+    masks = np.where(grid.reshape(-1) == 0, candidates.reshape(-1), 0)
+    house_planes = digit_planes(masks)[TOPOLOGY.houses]
+
+    singles = house_planes & (house_planes.sum(axis=1) == 1)[:, None, :]
+    singles &= (popcount(masks) > 1)[TOPOLOGY.houses][:, :, None]
+
+    houses, positions, digits = np.nonzero(singles)
+    cells = TOPOLOGY.houses[houses, positions]
+    _, first = np.unique(cells, return_index=True)
+    first.sort()
+    return houses[first], cells[first], digits[first] + 1
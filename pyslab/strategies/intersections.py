@@ -0,0 +1,62 @@
+"""Find intersection removals
+
+Where a box and a line (row or column) intersect, a digit confined to the
+intersection within one of them cannot appear elsewhere in the other:
+
+- pointing: a digit confined to one line within a box is removed from the
+  rest of that line
+- box/line reduction: a digit confined to one box within a line is removed
+  from the rest of that box
+
+Both are found for every digit, box and line at once on candidate planes.
+Columns are handled by transposing the planes.
+"""
+import numpy as np
+from .planes import box_view
+
+
+def _pointing_rows(planes: np.ndarray) -> np.ndarray:
+    """Candidates removed from rows by pointing, given (9, 9, 9) planes"""
+    boxes = box_view(planes)
+    # box_rows[d, band, row, stack] if digit d is in that row of the box
+    box_rows = boxes.any(axis=4)
+    pointing = box_rows & (box_rows.sum(axis=2) == 1)[:, :, None, :]
+    # a row loses the digit in every stack except the one pointing at it
+    other_stacks = pointing.sum(axis=3, keepdims=True) - pointing
+    return (boxes & (other_stacks > 0)[..., None]).reshape([9, 9, 9])
+
+
+def _box_line_rows(planes: np.ndarray) -> np.ndarray:
+    """Candidates removed from boxes by rows, given (9, 9, 9) planes"""
+    boxes = box_view(planes)
+    box_rows = boxes.any(axis=4)
+    claiming = box_rows & (box_rows.sum(axis=3) == 1)[..., None]
+    # a box loses the digit in every row except the one claiming it
+    other_rows = claiming.sum(axis=2, keepdims=True) - claiming
+    return (boxes & (other_rows > 0)[..., None]).reshape([9, 9, 9])
+
+
+def find_pointing(planes: np.ndarray) -> np.ndarray:
+    """
+    Find candidates removed by pointing pairs and triples
+    Args:
+        planes: (9, 9, 9) candidate planes
+
+    Returns:
+        (9, 9, 9) planes of candidates to remove
+    """
+    columns = _pointing_rows(planes.transpose(0, 2, 1)).transpose(0, 2, 1)
+    return _pointing_rows(planes) | columns
+
+
+def find_box_line(planes: np.ndarray) -> np.ndarray:
+    """
+    Find candidates removed by box/line reduction
+    Args:
+        planes: (9, 9, 9) candidate planes
+
+    Returns:
+        (9, 9, 9) planes of candidates to remove
+    """
+    columns = _box_line_rows(planes.transpose(0, 2, 1)).transpose(0, 2, 1)
+    return _box_line_rows(planes) | columns
@@ -1,6 +1,7 @@
 """Find naked singles"""
 import numpy as np
-from typing import List
+from typing import List, Tuple
+from ..core.bitmask import lowest_digit, popcount
 from ..core.types import Cell, Placement
 
 
@@ -11,8 +12,24 @@ def find_placements(
 ) -> List[Placement]:
 
     return [
-        Placement(cell, digit)
+        Placement(cell, int(lowest_digit(candidates[cell])))
         for cell in cells
-        if len(candidates[cell]) == 1 and grid[cell] == 0
-        for digit in candidates[cell]
+        if popcount(candidates[cell]) == 1 and grid[cell] == 0
     ]
+
+
+def find_all_placements(
+    grid: np.ndarray, candidates: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the naked singles in every house at once
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+
+    Returns:
+        Flat indices of cells with a single candidate, and their digits
+    """
+    masks = candidates.reshape(-1)
+    cells = np.flatnonzero((popcount(masks) == 1) & (grid.reshape(-1) == 0))
+    return cells, lowest_digit(masks[cells]).astype(np.int64)
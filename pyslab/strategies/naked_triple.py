@@ -0,0 +1,13 @@
+"""Find naked triples"""
+from typing import List
+import numpy as np
+from ..core.types import Cell, Elimination
+from .subsets import find_naked_subsets
+
+
+def find_eliminations(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    cells: List[Cell],
+) -> List[Elimination]:
+    return find_naked_subsets(grid, candidates, cells, 3)
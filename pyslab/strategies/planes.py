@@ -0,0 +1,58 @@
+"""Per-digit candidate planes
+
+Strategies which look across several houses at once work on a (9, 9, 9)
+boolean array, where ``planes[d - 1, row, column]`` is True if digit d is a
+candidate in an empty cell, so that row, column and box occurrence tests
+become array reductions.
+"""
+from typing import List
+
+import numpy as np
+from ..core.bitmask import digit_planes
+from ..core.types import Candidate, Cell, Elimination
+
+
+def candidate_planes(grid: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Split the candidates of empty cells into one plane per digit
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+
+    Returns:
+        (9, 9, 9) boolean array indexed by digit - 1, row and column
+    """
+    return np.moveaxis(digit_planes(np.where(grid == 0, candidates, 0)), -1, 0)
+
+
+def box_view(planes: np.ndarray) -> np.ndarray:
+    """
+    Reshape planes so each box is addressable
+    Args:
+        planes: (9, 9, 9) planes
+
+    Returns:
+        (9, 3, 3, 3, 3) view indexed by digit - 1, band, row in band, stack
+        and column in stack
+    """
+    return planes.reshape([9, 3, 3, 3, 3])
+
+
+def plane_eliminations(removed: np.ndarray) -> List[Elimination]:
+    """
+    Convert planes of candidates to remove into eliminations
+    Args:
+        removed: (9, 9, 9) planes of candidates to remove
+
+    Returns:
+        One elimination for each digit with candidates to remove
+    """
+    return [
+        Elimination(
+            [
+                Candidate(Cell(row, column), digit + 1)
+                for row, column in zip(*np.nonzero(removed[digit]))
+            ]
+        )
+        for digit in np.flatnonzero(removed.any(axis=(1, 2)))
+    ]
@@ -0,0 +1,142 @@
+"""Find naked and hidden subsets of any size
+
+A naked subset is a group of n cells in a house whose candidates together
+contain only n digits, so those digits can be removed from the rest of the
+house. A hidden subset is a group of n digits which together can only go in n
+cells of a house, so every other digit can be removed from those cells.
+
+Both are found by a depth-first search over bitmask unions, abandoning a
+branch as soon as its union holds more than n digits (or cells).
+"""
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from ..core.bitmask import POPCOUNT_LIST, mask_digits
+from ..core.types import Cell, Candidate, Elimination
+
+
+def find_subsets(masks: List[int], size: int) -> Iterator[Tuple[int, ...]]:
+    """
+    Find groups of size masks whose union has exactly size bits set
+    Args:
+        masks: bitmasks to combine, each with at least 2 and at most size bits
+        size: number of masks in each group
+
+    Returns:
+        Indices into masks of each group, in lexicographic order
+    """
+
+    def extend(start: int, union: int, chosen: Tuple[int, ...]):
+        if len(chosen) == size:
+            if POPCOUNT_LIST[union] == size:
+                yield chosen
+            return
+        for i in range(start, len(masks) - (size - len(chosen)) + 1):
+            extended = union | masks[i]
+            if POPCOUNT_LIST[extended] <= size:
+                yield from extend(i + 1, extended, chosen + (i,))
+
+    return extend(0, 0, ())
+
+
+def find_naked_subsets(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    cells: List[Cell],
+    size: int,
+) -> List[Elimination]:
+    """
+    Find naked subsets in a house
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        cells: cells of the house
+        size: number of cells in each subset
+
+    Returns:
+        For each subset, its digits in the other cells of the house
+    """
+    empty = [cell for cell in cells if grid[cell] == 0]
+    if len(empty) <= size:
+        return []
+
+    # cells with more candidates than the subset size can never be members
+    members = [cell for cell in empty if 2 <= POPCOUNT_LIST[candidates[cell]] <= size]
+    masks = [int(candidates[cell]) for cell in members]
+
+    eliminations = []
+    for subset in find_subsets(masks, size):
+        union = 0
+        for i in subset:
+            union |= masks[i]
+        # more cells than digits means the grid is already contradictory
+        if sum(1 for mask in masks if mask & union == mask) > size:
+            continue
+
+        chosen = {members[i] for i in subset}
+        eliminations.append(
+            Elimination(
+                [
+                    Candidate(cell, digit)
+                    for cell in empty
+                    if cell not in chosen
+                    for digit in mask_digits(candidates[cell] & union)
+                ]
+            )
+        )
+
+    # no need to return subsets if they don't help to eliminate anything!
+    return [elimination for elimination in eliminations if elimination.candidates]
+
+
+def find_hidden_subsets(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+    cells: List[Cell],
+    size: int,
+) -> List[Elimination]:
+    """
+    Find hidden subsets in a house
+    Args:
+        grid: 2-d array sudoku core
+        candidates: candidate core
+        cells: cells of the house
+        size: number of digits in each subset
+
+    Returns:
+        For each subset, the other digits in the cells of the subset
+    """
+    # bit i of positions[digit] is set if digit is a candidate in cells[i]
+    positions = [0] * 10
+    for i, cell in enumerate(cells):
+        if grid[cell] == 0:
+            for digit in mask_digits(candidates[cell]):
+                positions[digit] |= 1 << i
+
+    # digits in more cells than the subset size can never be members
+    digits = [d for d in range(1, 10) if 2 <= POPCOUNT_LIST[positions[d]] <= size]
+    masks = [positions[digit] for digit in digits]
+
+    eliminations = []
+    for subset in find_subsets(masks, size):
+        union, digits_union = 0, 0
+        for i in subset:
+            union |= masks[i]
+            digits_union |= 1 << digits[i]
+        # more digits than cells means the grid is already contradictory
+        if sum(1 for mask in masks if mask & union == mask) > size:
+            continue
+
+        eliminations.append(
+            Elimination(
+                [
+                    Candidate(cell, digit)
+                    for i, cell in enumerate(cells)
+                    if union & (1 << i)
+                    for digit in mask_digits(int(candidates[cell]) & ~digits_union)
+                ]
+            )
+        )
+
+    # no need to return subsets if they don't help to eliminate anything!
+    return [elimination for elimination in eliminations if elimination.candidates]
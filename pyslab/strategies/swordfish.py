@@ -0,0 +1,14 @@
+"""Find Swordfish eliminations"""
+from typing import List
+import numpy as np
+from ..core.types import Elimination
+from .fish import find_fish
+from .planes import candidate_planes, plane_eliminations
+
+
+def find_all_eliminations(
+    grid: np.ndarray,
+    candidates: np.ndarray,
+) -> List[Elimination]:
+    planes = candidate_planes(grid, candidates)
+    return plane_eliminations(find_fish(planes, 3))
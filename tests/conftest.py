@@ -1,8 +1,15 @@
+import random
 from typing import Tuple
 
 import numpy as np
 import pytest
 
+from pyslab.generator import (
+    permute_col_blocks,
+    permute_cols,
+    permute_row_blocks,
+    permute_rows,
+)
 from pyslab.solver import create_candidate_grid
 
 
@@ -31,3 +38,16 @@ def simple_candidates(simple_grid):
 def str_to_grid_candidates(sudoku: str) -> Tuple[np.ndarray, np.ndarray]:
     grid = np.array([int(e) for e in sudoku]).reshape([9, 9])
     return grid, create_candidate_grid(grid)
+
+
+def isomorph(grid: np.ndarray, seed: int) -> np.ndarray:
+    rng = random.Random(seed)
+    for _ in range(50):
+        permute = rng.choice(
+            [permute_rows, permute_cols, permute_row_blocks, permute_col_blocks]
+        )
+        grid = permute(grid, rng)
+    if rng.random() < 0.5:
+        grid = grid.T.copy()
+    relabel = np.array([0] + rng.sample(range(1, 10), 9), dtype=grid.dtype)
+    return relabel[grid]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from pyslab.core.bitmask import (
+    ALL_DIGITS,
+    digit_mask,
+    digit_planes,
+    digits_mask,
+    mask_digits,
+    popcount,
+    lowest_digit,
+)
+
+
+class TestDigitMask:
+    @staticmethod
+    @pytest.mark.parametrize("digit", list(range(1, 10)))
+    def test_single_bit(digit):
+        assert digit_mask(digit) == 1 << digit
+
+    @staticmethod
+    def test_all_digits():
+        assert digits_mask(range(1, 10)) == ALL_DIGITS
+
+    @staticmethod
+    def test_zero_ignored():
+        assert digits_mask([0, 3, 5]) == digit_mask(3) | digit_mask(5)
+
+
+class TestMaskDigits:
+    @staticmethod
+    def test_round_trip():
+        assert mask_digits(digits_mask([7, 2, 4])) == (2, 4, 7)
+
+    @staticmethod
+    def test_empty():
+        assert mask_digits(0) == ()
+
+    @staticmethod
+    def test_numpy_scalar():
+        assert mask_digits(np.uint16(digits_mask([1, 9]))) == (1, 9)
+
+
+class TestPopcount:
+    @staticmethod
+    def test_scalar():
+        assert popcount(digits_mask([1, 5, 9])) == 3
+
+    @staticmethod
+    def test_array():
+        masks = np.array([0, ALL_DIGITS, digit_mask(4)], dtype=np.uint16)
+        assert popcount(masks).tolist() == [0, 9, 1]
+
+
+class TestLowestDigit:
+    @staticmethod
+    def test_scalar():
+        assert lowest_digit(digits_mask([6, 3, 8])) == 3
+
+    @staticmethod
+    def test_array():
+        masks = np.array([0, ALL_DIGITS, digit_mask(9)], dtype=np.uint16)
+        assert lowest_digit(masks).tolist() == [0, 1, 9]
+
+
+class TestDigitPlanes:
+    @staticmethod
+    def test_planes():
+        masks = np.array([0, ALL_DIGITS, digits_mask([2, 9])], dtype=np.uint16)
+        planes = digit_planes(masks)
+        assert planes.shape == (3, 9)
+        assert not planes[0].any()
+        assert planes[1].all()
+        assert np.flatnonzero(planes[2]).tolist() == [1, 8]
@@ -2,7 +2,19 @@ import random
 
 import pytest
 
-from pyslab.core.digits import row_digits, column_digits, box_digits, peer_digits
+import numpy as np
+
+from pyslab.core.digits import (
+    row_digits,
+    column_digits,
+    box_digits,
+    peer_digits,
+    has_repeated_digit,
+    house_masks,
+    all_peer_masks,
+)
+from pyslab.core.bitmask import digits_mask
+from pyslab.core.topology import TOPOLOGY
 from pyslab.core.types import Cell
 
 
@@ -81,3 +93,51 @@ class TestPeerDigits:
         assert peer_digits(simple_grid, cell) == {
             digit for digit in range(1, 10) if digit != simple_grid[cell]
         }
+
+
+class TestHouseMasks:
+    @staticmethod
+    def test_all_solved(simple_grid):
+        assert (house_masks(simple_grid) == digits_mask(range(1, 10))).all()
+
+    @staticmethod
+    def test_matches_digit_sets(simple_grid):
+        simple_grid[::2, 1::3] = 0
+        masks = house_masks(simple_grid)
+        assert masks.shape == (27,)
+        for i in range(9):
+            assert masks[i] == digits_mask(row_digits(simple_grid, i))
+            assert masks[9 + i] == digits_mask(column_digits(simple_grid, i))
+            assert masks[18 + i] == digits_mask(box_digits(simple_grid, i))
+
+
+class TestHasRepeatedDigit:
+    @staticmethod
+    def test_valid(simple_grid):
+        assert not has_repeated_digit(simple_grid)
+        simple_grid[::2, 1::3] = 0
+        assert not has_repeated_digit(simple_grid, house_masks(simple_grid))
+
+    @staticmethod
+    def test_repeat(simple_grid):
+        simple_grid[0, :] = 0
+        simple_grid[0, 0] = simple_grid[0, 8] = 5
+        assert has_repeated_digit(simple_grid)
+
+
+class TestAllPeerMasks:
+    @staticmethod
+    def test_matches_peer_digits(simple_grid):
+        rng = random.Random(0)
+        for cell in rng.sample(TOPOLOGY.cells, 30):
+            simple_grid[cell] = 0
+        masks = all_peer_masks(simple_grid)
+        assert masks.shape == (81,)
+        for i, cell in enumerate(TOPOLOGY.cells):
+            assert masks[i] == digits_mask(peer_digits(simple_grid, cell))
+
+    @staticmethod
+    def test_float_grid(simple_grid):
+        assert np.array_equal(
+            all_peer_masks(simple_grid.astype(float)), all_peer_masks(simple_grid)
+        )
@@ -0,0 +1,47 @@
+import numpy as np
+
+from pyslab.core.exact_cover import dlx_solutions, dlx_count_solutions
+from pyslab.core.validation import is_solved
+from ..conftest import str_to_grid_candidates
+
+
+class TestDlxSolutions:
+    @staticmethod
+    def test_hard_problem():
+        grid, _ = str_to_grid_candidates(
+            "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+        )
+        solutions = list(dlx_solutions(grid))
+        assert len(solutions) == 1
+        assert is_solved(solutions[0])
+        assert (solutions[0][grid > 0] == grid[grid > 0]).all()
+
+    @staticmethod
+    def test_simple_problem(simple_grid):
+        test_grid = np.copy(simple_grid)
+        test_grid[0:2, :] = 0
+        test_grid[:, 4] = 0
+        assert np.array_equal(next(dlx_solutions(test_grid)), simple_grid)
+
+    @staticmethod
+    def test_conflicting_givens(simple_grid):
+        simple_grid[0, 0] = 0
+        simple_grid[0, 1] = 1
+        assert not list(dlx_solutions(simple_grid))
+
+
+class TestDlxCountSolutions:
+    @staticmethod
+    def test_limit_reached():
+        assert dlx_count_solutions(np.zeros([9, 9]), limit=3) == 3
+
+    @staticmethod
+    def test_unique(simple_grid):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        assert dlx_count_solutions(simple_grid, limit=10) == 1
+
+    @staticmethod
+    def test_none():
+        grid = np.ones([9, 9])
+        grid[0, 0] = 0
+        assert dlx_count_solutions(grid) == 0
@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from pyslab.core.exact_cover import dlx_solutions
+from pyslab.core.hybrid import (
+    HybridSearch,
+    has_other_solution,
+    hybrid_count_solutions,
+    hybrid_solutions,
+)
+from pyslab.core.types import Cell
+from pyslab.core.validation import is_solved
+from pyslab.solver import create_candidate_grid
+from ..conftest import str_to_grid_candidates
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+class TestHybridSolutions:
+    @staticmethod
+    @pytest.mark.parametrize("pairs", [False, True])
+    def test_hard_problem(pairs):
+        grid, _ = str_to_grid_candidates(HARD)
+        solutions = list(hybrid_solutions(grid, pairs))
+        assert len(solutions) == 1
+        assert is_solved(solutions[0])
+        assert (solutions[0][grid > 0] == grid[grid > 0]).all()
+        assert solutions[0].dtype == grid.dtype
+
+    @staticmethod
+    @pytest.mark.parametrize("pairs", [False, True])
+    def test_matches_dlx(simple_grid, pairs):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        simple_grid[np.where(simple_grid == 2)] = 0
+        expected = {solution.tobytes() for solution in dlx_solutions(simple_grid)}
+        found = [
+            solution.tobytes() for solution in hybrid_solutions(simple_grid, pairs)
+        ]
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+
+    @staticmethod
+    def test_conflicting_givens(simple_grid):
+        simple_grid[0, 0] = simple_grid[0, 1]
+        assert list(hybrid_solutions(simple_grid)) == []
+
+
+class TestHybridCountSolutions:
+    @staticmethod
+    def test_limit(simple_grid):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        simple_grid[np.where(simple_grid == 2)] = 0
+        assert hybrid_count_solutions(simple_grid, 1) == 1
+        assert hybrid_count_solutions(simple_grid, 100) > 1
+
+    @staticmethod
+    def test_empty_grid_not_unique():
+        assert hybrid_count_solutions(np.zeros([9, 9], dtype=np.uint8)) == 2
+
+    @staticmethod
+    def test_conflicting_givens(simple_grid):
+        simple_grid[0, 0] = simple_grid[0, 1]
+        assert hybrid_count_solutions(simple_grid) == 0
+
+
+class TestHybridSearch:
+    @staticmethod
+    def test_restrict():
+        grid, _ = str_to_grid_candidates(HARD)
+        search = HybridSearch(grid)
+        candidates = search.candidates[:]
+        mark = search.snapshot()
+
+        cell = next(i for i, mask in enumerate(candidates) if mask & (mask - 1))
+        assert search.restrict(cell, candidates[cell] & -candidates[cell])
+        assert search.placed[cell]
+        search.restore(mark)
+        assert search.candidates == candidates
+        assert not search.restrict(cell, ~candidates[cell])
+
+    @staticmethod
+    def test_undo_restores_state():
+        grid, _ = str_to_grid_candidates(HARD)
+        search = HybridSearch(grid)
+        search.propagate()
+        candidates, placed = search.candidates[:], search.placed[:]
+        mark = search.snapshot()
+
+        list(search.solutions())
+        assert search.nodes > 0
+        search.restore(mark)
+        assert search.candidates == candidates
+        assert search.placed == placed
+
+    @staticmethod
+    def test_start_from_candidates():
+        grid, candidates = str_to_grid_candidates(HARD)
+        solution = next(hybrid_solutions(grid))
+        # leave only the solution digit in the first empty cell
+        cell = tuple(np.argwhere(grid == 0)[0])
+        candidates[cell] = 1 << int(solution[cell])
+
+        search = HybridSearch(grid, candidates=candidates)
+        assert search.candidates[cell[0] * 9 + cell[1]] == candidates[cell]
+        assert len(list(search.solutions())) == 1
+
+    @staticmethod
+    def test_contradictory_candidates(simple_grid):
+        simple_grid[0, 0] = 0
+        candidates = create_candidate_grid(simple_grid)
+        candidates[0, 0] = 0
+        search = HybridSearch(simple_grid, candidates=candidates)
+        assert not search.consistent
+        assert list(search.solutions()) == []
+
+
+class TestHasOtherSolution:
+    @staticmethod
+    def test_unique_after_removal(simple_grid):
+        problem = np.copy(simple_grid)
+        problem[np.where(simple_grid == 1)] = 0
+        removed = [Cell(0, 0), Cell(8, 5)]
+        assert not has_other_solution(problem, simple_grid, removed)
+
+    @staticmethod
+    def test_other_after_removal(simple_grid):
+        problem = np.copy(simple_grid)
+        problem[np.where(simple_grid == 1)] = 0
+        problem[np.where(simple_grid == 2)] = 0
+        removed = [Cell(0, 1)]
+        assert has_other_solution(problem, simple_grid, removed)
@@ -0,0 +1,47 @@
+from itertools import islice
+
+import numpy as np
+
+from pyslab.core.search import bitmask_solutions
+from pyslab.core.validation import is_solved
+from ..conftest import str_to_grid_candidates
+
+
+class TestBitmaskSolutions:
+    @staticmethod
+    def test_hard_problem():
+        grid, _ = str_to_grid_candidates(
+            "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+        )
+        solutions = list(bitmask_solutions(grid))
+        assert len(solutions) == 1
+        assert is_solved(solutions[0])
+        assert (solutions[0][grid > 0] == grid[grid > 0]).all()
+
+    @staticmethod
+    def test_input_unchanged(simple_grid):
+        test_grid = np.copy(simple_grid)
+        test_grid[0:2, :] = 0
+        _ = list(bitmask_solutions(test_grid))
+        assert (test_grid[0:2, :] == 0).all()
+
+    @staticmethod
+    def test_all_solutions_distinct(simple_grid):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        simple_grid[np.where(simple_grid == 2)] = 0
+        solutions = list(bitmask_solutions(simple_grid))
+        assert len(solutions) > 1
+        assert all(is_solved(solution) for solution in solutions)
+        assert len({solution.tobytes() for solution in solutions}) == len(solutions)
+
+    @staticmethod
+    def test_keeps_dtype():
+        solution = next(bitmask_solutions(np.zeros([9, 9])))
+        assert solution.dtype == np.float64
+        assert is_solved(solution)
+
+    @staticmethod
+    def test_conflicting_givens(simple_grid):
+        simple_grid[0, 0] = 0
+        simple_grid[0, 1] = 1
+        assert not list(islice(bitmask_solutions(simple_grid), 1))
@@ -0,0 +1,89 @@
+import pickle
+
+import numpy as np
+
+from pyslab.core.bitmask import mask_digits
+from pyslab.core.state import SolverState
+from pyslab.solver import create_candidate_grid
+
+
+class TestSolverState:
+    @staticmethod
+    def test_matches_candidate_grid(simple_grid):
+        simple_grid[0, :] = 0
+        simple_grid[:, 0] = 0
+        state = SolverState(simple_grid)
+        assert state.consistent
+        assert np.array_equal(state.to_grid(simple_grid.dtype), simple_grid)
+        assert np.array_equal(state.to_candidates(), create_candidate_grid(simple_grid))
+
+    @staticmethod
+    def test_start_from_candidates(simple_grid):
+        simple_grid[0, :] = 0
+        candidates = create_candidate_grid(simple_grid)
+        candidates[0, 0] = 1 << int(simple_grid.max())
+        state = SolverState(simple_grid, candidates)
+        assert state.candidates[0] == candidates[0, 0] & state.candidates[0]
+        assert np.array_equal(
+            state.to_candidates(), candidates & create_candidate_grid(simple_grid)
+        )
+
+    @staticmethod
+    def test_conflicting_givens(simple_grid):
+        simple_grid[0, 0] = simple_grid[0, 1]
+        assert not SolverState(simple_grid).consistent
+
+    @staticmethod
+    def test_place(simple_grid):
+        digit = int(simple_grid[0, 0])
+        simple_grid[0, :] = 0
+        state = SolverState(simple_grid)
+
+        assert state.place(0, digit)
+        assert state.values[0] == digit
+        assert state.house_masks[0] & (1 << digit)
+        assert all(
+            digit not in mask_digits(state.candidates[cell]) for cell in range(1, 9)
+        )
+        assert not state.place(0, digit)
+        assert not state.place(1, digit)
+
+    @staticmethod
+    def test_snapshot_restore(simple_grid):
+        simple_grid[0, :] = 0
+        simple_grid[:, 0] = 0
+        state = SolverState(simple_grid)
+        values, candidates = state.values[:], state.candidates[:]
+        house_masks = state.house_masks[:]
+
+        mark = state.snapshot()
+        state.place(0, int(mask_digits(state.candidates[0])[0]))
+        state.eliminate(1, int(mask_digits(state.candidates[1])[-1]))
+        assert state.candidates != candidates
+        state.restore(mark)
+
+        assert state.values == values
+        assert state.candidates == candidates
+        assert state.house_masks == house_masks
+        assert state.snapshot() == mark
+
+    @staticmethod
+    def test_eliminate(simple_grid):
+        simple_grid[0, :] = 0
+        state = SolverState(simple_grid)
+        digit = mask_digits(state.candidates[0])[0]
+        assert state.eliminate(0, digit)
+        assert digit not in mask_digits(state.candidates[0])
+        assert not state.eliminate(0, digit)
+
+    @staticmethod
+    def test_pickle(simple_grid):
+        simple_grid[0, :] = 0
+        state = SolverState(simple_grid)
+        mark = state.snapshot()
+        state.place(0, int(mask_digits(state.candidates[0])[0]))
+
+        copied = pickle.loads(pickle.dumps(state))
+        copied.restore(mark)
+        assert copied.values[0] == 0
+        assert state.values[0] != 0
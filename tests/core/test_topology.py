@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from pyslab.core.topology import TOPOLOGY, flat_index, house_name
+from pyslab.core.types import Cell
+
+
+class TestHouses:
+    @staticmethod
+    def test_every_cell_in_three_houses():
+        counts = np.bincount(TOPOLOGY.houses.flatten(), minlength=81)
+        assert (counts == 3).all()
+
+    @staticmethod
+    @pytest.mark.parametrize("house", list(range(27)))
+    def test_house_index_matches_flat(house):
+        grid = np.arange(81).reshape([9, 9])
+        assert grid[TOPOLOGY.house_index[house]].tolist() == list(
+            TOPOLOGY.houses[house]
+        )
+
+    @staticmethod
+    def test_cell_houses_contain_cell():
+        assert all(
+            cell in TOPOLOGY.houses[house]
+            for cell in range(81)
+            for house in TOPOLOGY.cell_houses[cell]
+        )
+
+
+class TestPeers:
+    @staticmethod
+    @pytest.mark.parametrize("cell", list(range(81)))
+    def test_twenty_distinct_peers(cell):
+        peers = set(TOPOLOGY.peers[cell])
+        assert len(peers) == 20
+        assert cell not in peers
+
+    @staticmethod
+    @pytest.mark.parametrize("cell", list(range(81)))
+    def test_peers_share_a_house(cell):
+        houses = set(TOPOLOGY.cell_houses[cell])
+        assert all(
+            houses & set(TOPOLOGY.cell_houses[peer]) for peer in TOPOLOGY.peers[cell]
+        )
+
+    @staticmethod
+    def test_plain_forms_match_arrays():
+        assert TOPOLOGY.peer_ids == tuple(map(tuple, TOPOLOGY.peers.tolist()))
+        assert TOPOLOGY.house_cell_ids == tuple(map(tuple, TOPOLOGY.houses.tolist()))
+        assert TOPOLOGY.cell_house_ids == tuple(
+            map(tuple, TOPOLOGY.cell_houses.tolist())
+        )
+        assert all(isinstance(peer, int) for peer in TOPOLOGY.peer_ids[0])
+
+    @staticmethod
+    def test_tables_read_only():
+        with pytest.raises(ValueError):
+            TOPOLOGY.peers[0, 0] = 1
+
+
+def test_flat_index():
+    assert [flat_index(cell) for cell in TOPOLOGY.cells] == list(range(81))
+    assert flat_index(Cell(4, 7)) == 43
+
+
+def test_house_name():
+    assert [house_name(house) for house in (0, 8, 9, 17, 18, 26)] == [
+        "row 0",
+        "row 8",
+        "column 0",
+        "column 8",
+        "box 0",
+        "box 8",
+    ]
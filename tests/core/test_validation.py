@@ -2,11 +2,14 @@ import numpy as np
 import pytest
 
 from pyslab.core.validation import (
+    BACKENDS,
+    register_backend,
     unsolved_cells,
     solved_cells,
     is_solved,
     brute_force_solution,
     brute_force_solutions,
+    count_solutions,
     has_unique_solution,
 )
 
@@ -151,3 +154,79 @@ class TestHasUniqueSolution:
         grid = np.ones([9, 9])
         grid[0, 0] = 0
         assert not has_unique_solution(grid)
+
+
+@pytest.mark.parametrize("backend", ["naive", "bitmask", "dlx", "hybrid"])
+class TestBackends:
+    @staticmethod
+    def test_brute_force_solution(simple_grid, backend):
+        test_grid = np.copy(simple_grid)
+        test_grid[0:3, 0:3] = 0
+        solution = brute_force_solution(test_grid, backend=backend)
+        assert np.array_equal(solution, simple_grid)
+
+    @staticmethod
+    def test_brute_force_solutions(simple_grid, backend):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        simple_grid[np.where(simple_grid == 2)] = 0
+        solutions = list(brute_force_solutions(simple_grid, backend=backend))
+        assert len(solutions) > 1
+        assert all(is_solved(solution) for solution in solutions)
+
+    @staticmethod
+    def test_unique(simple_grid, backend):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        assert has_unique_solution(simple_grid, backend=backend)
+
+    @staticmethod
+    def test_non_unique(simple_grid, backend):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        simple_grid[np.where(simple_grid == 2)] = 0
+        assert not has_unique_solution(simple_grid, backend=backend)
+
+    @staticmethod
+    def test_unsolveable(backend):
+        grid = np.ones([9, 9])
+        grid[0, 0] = 0
+        assert not has_unique_solution(grid, backend=backend)
+
+
+class TestCountSolutions:
+    @staticmethod
+    def test_solved(simple_grid):
+        assert count_solutions(simple_grid) == 1
+
+    @staticmethod
+    def test_limit():
+        assert count_solutions(np.zeros([9, 9]), limit=4) == 4
+
+    @staticmethod
+    @pytest.mark.parametrize("backend", ["naive", "bitmask", "dlx", "hybrid"])
+    def test_backends_agree(simple_grid, backend):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        simple_grid[np.where(simple_grid == 2)] = 0
+        assert count_solutions(simple_grid, 100, backend) == count_solutions(
+            simple_grid, 100, "dlx"
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("backend", ["naive", "bitmask", "dlx", "hybrid"])
+    def test_negative_limit(simple_grid, backend):
+        assert count_solutions(simple_grid, -1, backend) == 0
+
+
+class TestRegisterBackend:
+    @staticmethod
+    def test_custom_backend(simple_grid):
+        register_backend("fixed", lambda grid: iter([simple_grid]))
+        try:
+            assert brute_force_solution(np.zeros([9, 9]), "fixed") is simple_grid
+            assert has_unique_solution(np.zeros([9, 9]), "fixed")
+            assert count_solutions(np.zeros([9, 9]), -1, "fixed") == 0
+        finally:
+            del BACKENDS["fixed"]
+
+    @staticmethod
+    def test_unknown_backend(simple_grid):
+        with pytest.raises(ValueError):
+            brute_force_solution(simple_grid, backend="unknown")
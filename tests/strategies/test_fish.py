@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pyslab.core.bitmask import ALL_DIGITS, digit_mask
+from pyslab.core.types import Cell
+from pyslab.core.validation import brute_force_solution
+from pyslab.strategies import jellyfish, swordfish, x_wing
+from pyslab.strategies.fish import find_fish
+from pyslab.strategies.planes import candidate_planes
+from ..conftest import str_to_grid_candidates
+
+EMPTY = np.zeros([9, 9], dtype=np.uint8)
+
+
+def fish_candidates(digit: int, rows, columns) -> np.ndarray:
+    """Open candidates where digit is confined to columns within rows"""
+    candidates = np.full([9, 9], ALL_DIGITS, dtype=np.uint16)
+    outside = [c for c in range(9) if c not in columns]
+    candidates[np.ix_(rows, outside)] &= ALL_DIGITS ^ digit_mask(digit)
+    return candidates
+
+
+class TestFish:
+    @staticmethod
+    def test_x_wing():
+        candidates = fish_candidates(5, [1, 4], [2, 7])
+        eliminations = x_wing.find_all_eliminations(EMPTY, candidates)
+
+        assert len(eliminations) == 1
+        assert eliminations[0].candidates == [
+            (Cell(r, c), 5) for r in [0, 2, 3, 5, 6, 7, 8] for c in [2, 7]
+        ]
+
+    @staticmethod
+    def test_swordfish_on_columns():
+        candidates = fish_candidates(2, [0, 3, 8], [1, 4, 6]).T.copy()
+        eliminations = swordfish.find_all_eliminations(EMPTY, candidates)
+
+        assert eliminations[0].candidates == [
+            (Cell(r, c), 2) for r in [1, 4, 6] for c in range(9) if c not in [0, 3, 8]
+        ]
+
+    @staticmethod
+    def test_jellyfish():
+        candidates = fish_candidates(8, [0, 2, 4, 6], [1, 3, 5, 7])
+        eliminations = jellyfish.find_all_eliminations(EMPTY, candidates)
+
+        assert len(eliminations[0].candidates) == 5 * 4
+        assert x_wing.find_all_eliminations(EMPTY, candidates) == []
+
+    @staticmethod
+    @pytest.mark.parametrize("size", [2, 3, 4])
+    @pytest.mark.parametrize(
+        "board",
+        [
+            "000008300004600078000027045040000200280000097001000030790210000130006700005800000",
+            "007000060300600908004010200043500000000080000000003870008030400102005009060000100",
+        ],
+    )
+    def test_never_eliminates_solution(board, size):
+        grid, candidates = str_to_grid_candidates(board)
+        solution = brute_force_solution(grid)
+        removed = find_fish(candidate_planes(grid, candidates), size)
+
+        digits, rows, columns = np.nonzero(removed)
+        assert (solution[rows, columns] != digits + 1).all()
@@ -0,0 +1,15 @@
+from pyslab.core.cells import column_cells
+from pyslab.core.types import Cell
+from pyslab.strategies.hidden_quad import find_eliminations
+from ..conftest import str_to_grid_candidates
+
+
+class TestFindEliminations:
+    @staticmethod
+    def test_hidden_quad_in_column():
+        grid, candidates = str_to_grid_candidates(
+            "097000005000908310200005008089200056406000703120007890300700009012403000900000430"
+        )
+        eliminations = find_eliminations(grid, candidates, column_cells(7))
+
+        assert eliminations[0].candidates == [(Cell(0, 7), 2), (Cell(6, 7), 2)]
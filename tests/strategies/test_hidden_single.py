@@ -1,7 +1,8 @@
 import pytest
 
 from pyslab.core.cells import row_cells, column_cells, box_cells
-from pyslab.strategies.hidden_single import find_placements
+from pyslab.core.topology import TOPOLOGY, flat_index
+from pyslab.strategies.hidden_single import find_all_placements, find_placements
 from ..conftest import str_to_grid_candidates
 
 
@@ -82,3 +83,27 @@ class TestFindPlacements:
             find_placements(simple_grid, simple_candidates, column_cells(i))
         )
         assert not list(find_placements(simple_grid, simple_candidates, box_cells(i)))
+
+
+class TestFindAllPlacements:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "board",
+        [
+            "403010005056480100200000040900004000005020600000700008020000006008036910600090507",
+            "008006002020500070070010005001060000046275810000040600800050090010008060500900300",
+        ],
+    )
+    def test_matches_houses(board):
+        grid, candidates = str_to_grid_candidates(board)
+        expected = {
+            (house, flat_index(cell), digit)
+            for house, cells in enumerate(TOPOLOGY.house_cells)
+            for cell, digit in find_placements(grid, candidates, cells)
+        }
+        houses, cells, digits = find_all_placements(grid, candidates)
+        found = set(zip(houses.tolist(), cells.tolist(), digits.tolist()))
+
+        assert found <= expected
+        assert {(c, d) for _, c, d in found} == {(c, d) for _, c, d in expected}
+        assert len(set(cells.tolist())) == len(cells)
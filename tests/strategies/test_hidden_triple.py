@@ -0,0 +1,15 @@
+from pyslab.core.cells import row_cells
+from pyslab.core.types import Cell
+from pyslab.strategies.hidden_triple import find_eliminations
+from ..conftest import str_to_grid_candidates
+
+
+class TestFindEliminations:
+    @staticmethod
+    def test_hidden_triple_in_row():
+        grid, candidates = str_to_grid_candidates(
+            "097000005000908310200005008089200056406000703120007890300700009012403000900000430"
+        )
+        eliminations = find_eliminations(grid, candidates, row_cells(4))
+
+        assert eliminations[0].candidates == [(Cell(4, 3), 5), (Cell(4, 4), 5)]
@@ -0,0 +1,70 @@
+import numpy as np
+
+from pyslab.core.bitmask import ALL_DIGITS, digit_mask
+from pyslab.core.types import Cell
+from pyslab.strategies import box_line, pointing
+from pyslab.strategies.intersections import find_box_line, find_pointing
+from pyslab.strategies.planes import candidate_planes
+
+EMPTY = np.zeros([9, 9], dtype=np.uint8)
+
+
+def open_candidates() -> np.ndarray:
+    return np.full([9, 9], ALL_DIGITS, dtype=np.uint16)
+
+
+def remove(candidates: np.ndarray, digit: int, rows, columns) -> np.ndarray:
+    candidates[np.ix_(rows, columns)] &= ALL_DIGITS ^ digit_mask(digit)
+    return candidates
+
+
+class TestPointing:
+    @staticmethod
+    def test_pointing_row():
+        # 3 can only go in row 1 of box 0
+        candidates = remove(open_candidates(), 3, [0, 2], [0, 1, 2])
+        eliminations = pointing.find_all_eliminations(EMPTY, candidates)
+
+        assert len(eliminations) == 1
+        assert eliminations[0].candidates == [(Cell(1, c), 3) for c in range(3, 9)]
+
+    @staticmethod
+    def test_pointing_column():
+        # 7 can only go in column 5 of box 4
+        candidates = remove(open_candidates(), 7, [3, 4, 5], [3, 4])
+        eliminations = pointing.find_all_eliminations(EMPTY, candidates)
+
+        assert eliminations[0].candidates == [
+            (Cell(r, 5), 7) for r in [0, 1, 2, 6, 7, 8]
+        ]
+
+    @staticmethod
+    def test_nothing_to_remove():
+        assert not find_pointing(candidate_planes(EMPTY, open_candidates())).any()
+
+
+class TestBoxLine:
+    @staticmethod
+    def test_row_in_box():
+        # 4 can only go in box 2 within row 0
+        candidates = remove(open_candidates(), 4, [0], range(6))
+        eliminations = box_line.find_all_eliminations(EMPTY, candidates)
+
+        assert eliminations[0].candidates == [
+            (Cell(r, c), 4) for r in [1, 2] for c in [6, 7, 8]
+        ]
+
+    @staticmethod
+    def test_column_in_box():
+        # 9 can only go in box 6 within column 1
+        candidates = remove(open_candidates(), 9, range(6), [1])
+        removed = find_box_line(candidate_planes(EMPTY, candidates))
+
+        assert np.argwhere(removed).tolist() == [
+            [8, r, c] for r in [6, 7, 8] for c in [0, 2]
+        ]
+
+    @staticmethod
+    def test_solved_cells_ignored(simple_grid):
+        candidates = remove(open_candidates(), 4, [0], range(6))
+        assert box_line.find_all_eliminations(simple_grid, candidates) == []
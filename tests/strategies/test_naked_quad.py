@@ -0,0 +1,19 @@
+from pyslab.core.cells import row_cells
+from pyslab.core.types import Cell
+from pyslab.strategies.naked_quad import find_eliminations
+from ..conftest import str_to_grid_candidates
+
+
+class TestFindEliminations:
+    @staticmethod
+    def test_naked_quad_in_row():
+        grid, candidates = str_to_grid_candidates(
+            "504000310890023040000006008000042050103070804050890000900200000040510069012000507"
+        )
+        eliminations = find_eliminations(grid, candidates, row_cells(2))
+
+        assert eliminations[0].candidates == [
+            (Cell(2, 2), 7),
+            (Cell(2, 3), 7),
+            (Cell(2, 3), 9),
+        ]
@@ -1,5 +1,6 @@
 from pyslab.core.cells import row_cells, column_cells, box_cells
-from pyslab.strategies.naked_single import find_placements
+from pyslab.core.topology import TOPOLOGY, flat_index
+from pyslab.strategies.naked_single import find_all_placements, find_placements
 from ..conftest import str_to_grid_candidates
 
 
@@ -59,3 +60,25 @@ class TestFindPlacements:
             ((0, 0), 1),
             ((1, 1), 5),
         ]
+
+
+class TestFindAllPlacements:
+    @staticmethod
+    def test_matches_houses():
+        grid, candidates = str_to_grid_candidates(
+            "000000805300457000000918030030700102700000004109003050090231000000584009405000000"
+        )
+        expected = {
+            (flat_index(cell), digit)
+            for cells in TOPOLOGY.house_cells
+            for cell, digit in find_placements(grid, candidates, cells)
+        }
+        cells, digits = find_all_placements(grid, candidates)
+
+        assert expected
+        assert set(zip(cells.tolist(), digits.tolist())) == expected
+
+    @staticmethod
+    def test_solved(simple_grid, simple_candidates):
+        cells, digits = find_all_placements(simple_grid, simple_candidates)
+        assert cells.size == digits.size == 0
@@ -0,0 +1,15 @@
+from pyslab.core.cells import row_cells
+from pyslab.core.types import Cell
+from pyslab.strategies.naked_triple import find_eliminations
+from ..conftest import str_to_grid_candidates
+
+
+class TestFindEliminations:
+    @staticmethod
+    def test_naked_triple_in_row():
+        grid, candidates = str_to_grid_candidates(
+            "504000310890023040000006008000042050103070804050890000900200000040510069012000507"
+        )
+        eliminations = find_eliminations(grid, candidates, row_cells(1))
+
+        assert [e.candidates for e in eliminations] == [[(Cell(1, 8), 6)]]
@@ -0,0 +1,68 @@
+import pytest
+
+from pyslab.core.bitmask import digits_mask
+from pyslab.core.cells import row_cells
+from pyslab.core.topology import TOPOLOGY
+from pyslab.core.validation import brute_force_solution
+from pyslab.strategies.subsets import (
+    find_hidden_subsets,
+    find_naked_subsets,
+    find_subsets,
+)
+from ..conftest import str_to_grid_candidates
+
+BOARDS = [
+    "504000310890023040000006008000042050103070804050890000900200000040510069012000507",
+    "097000005000908310200005008089200056406000703120007890300700009012403000900000430",
+    "400000805030000000000700000020000060000080400000010000000603070500200000104000000",
+]
+
+
+class TestSubsets:
+    @staticmethod
+    @pytest.mark.parametrize("board", BOARDS)
+    @pytest.mark.parametrize("finder", [find_naked_subsets, find_hidden_subsets])
+    @pytest.mark.parametrize("size", [2, 3, 4])
+    def test_never_eliminates_solution(board, finder, size):
+        grid, candidates = str_to_grid_candidates(board)
+        solution = brute_force_solution(grid)
+
+        for cells in TOPOLOGY.house_cells:
+            for elimination in finder(grid, candidates, cells, size):
+                assert elimination.candidates
+                for cell, digit in elimination.candidates:
+                    assert solution[cell] != digit
+
+    @staticmethod
+    def test_contradiction_ignored(simple_grid):
+        simple_grid[0, :3] = 0
+        simple_grid[0, 8] = 0
+        _, candidates = str_to_grid_candidates("0" * 81)
+        candidates[0, :3] = digits_mask([1, 2])
+        candidates[0, 8] = digits_mask([1, 2, 9])
+
+        assert find_naked_subsets(simple_grid, candidates, row_cells(0), 2) == []
+
+    @staticmethod
+    def test_hidden_contradiction_ignored(simple_grid):
+        simple_grid[0, :4] = 0
+        _, candidates = str_to_grid_candidates("0" * 81)
+        candidates[0, :2] = digits_mask([1, 2, 3, 4])
+        candidates[0, 2:4] = digits_mask([4, 5])
+
+        assert find_hidden_subsets(simple_grid, candidates, row_cells(0), 2) == []
+
+    @staticmethod
+    def test_union_smaller_than_size():
+        masks = [digits_mask([1, 2])] * 3
+        assert list(find_subsets(masks, 3)) == []
+        assert list(find_subsets(masks, 2)) == [(0, 1), (0, 2), (1, 2)]
+
+    @staticmethod
+    def test_full_house_ignored(simple_grid):
+        simple_grid[0, :3] = 0
+        _, candidates = str_to_grid_candidates("0" * 81)
+        candidates[0, :3] = digits_mask([1, 2, 3])
+
+        assert find_naked_subsets(simple_grid, candidates, row_cells(0), 3) == []
+        assert find_hidden_subsets(simple_grid, candidates, row_cells(0), 3) == []
@@ -0,0 +1,75 @@
+import numpy as np
+
+from pyslab.batch import SolveStatus, create_candidate_grid_batch, solve_batch
+from pyslab.core.validation import is_solved
+from pyslab.solver import create_candidate_grid
+from .conftest import str_to_grid_candidates
+
+BOARDS = [
+    "080107040700469001400803007135974600270618530608532100900046005000781000860095010",
+    "000000805300457000000918030030700102700000004109003050090231000000584009405000000",
+    "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+]
+
+
+def stack(boards):
+    return np.stack([str_to_grid_candidates(board)[0] for board in boards])
+
+
+class TestCreateCandidateGridBatch:
+    @staticmethod
+    def test_matches_single_grid():
+        grids = stack(BOARDS)
+        candidates = create_candidate_grid_batch(grids)
+        assert candidates.shape == (3, 9, 9)
+        for grid, grid_candidates in zip(grids, candidates):
+            assert np.array_equal(grid_candidates, create_candidate_grid(grid))
+
+    @staticmethod
+    def test_solved(simple_grid):
+        candidates = create_candidate_grid_batch(simple_grid[None])
+        assert np.array_equal(candidates[0], create_candidate_grid(simple_grid))
+
+
+class TestSolveBatch:
+    @staticmethod
+    def test_solved_by_singles():
+        grids = stack(BOARDS[:1])
+        result = solve_batch(grids)
+        assert result.status.tolist() == [SolveStatus.SOLVED]
+        assert is_solved(result.grids[0])
+
+    @staticmethod
+    def test_stalled_grid_searched():
+        result = solve_batch(stack(BOARDS[2:]))
+        assert result.status.tolist() == [SolveStatus.SEARCHED]
+        assert is_solved(result.grids[0])
+
+    @staticmethod
+    def test_stalled_grid_without_search():
+        grids = stack(BOARDS[2:])
+        result = solve_batch(grids, search=False)
+        assert result.status.tolist() == [SolveStatus.UNSOLVED]
+        assert (result.grids[grids > 0] == grids[grids > 0]).all()
+
+    @staticmethod
+    def test_invalid(simple_grid):
+        simple_grid[0, 0] = 0
+        simple_grid[0, 1] = 1
+        result = solve_batch(simple_grid[None])
+        assert result.status.tolist() == [SolveStatus.INVALID]
+
+    @staticmethod
+    def test_mixed_batch_in_chunks(simple_grid):
+        grids = np.concatenate([stack(BOARDS), simple_grid[None]] * 2)
+        result = solve_batch(grids, chunk_size=3)
+        assert result.grids.shape == grids.shape
+        assert all(is_solved(grid) for grid in result.grids)
+        assert (result.grids[grids > 0] == grids[grids > 0]).all()
+
+    @staticmethod
+    def test_input_unchanged():
+        grids = stack(BOARDS)
+        original = grids.copy()
+        _ = solve_batch(grids)
+        assert np.array_equal(grids, original)
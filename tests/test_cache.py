@@ -0,0 +1,110 @@
+import numpy as np
+
+from pyslab.cache import SolveCache
+from pyslab.core.topology import TOPOLOGY
+from pyslab.core.validation import brute_force_solution, has_unique_solution
+from pyslab.io import parse_grid
+from pyslab.solver import solve
+from .conftest import isomorph
+
+BOARD = parse_grid(
+    "000000805300457000000918030030700102700000004109003050090231000000584009405000000"
+)
+HARD = parse_grid(
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+)
+
+
+class TestSolve:
+    @staticmethod
+    def test_matches_solve():
+        cache = SolveCache()
+        expected = solve(BOARD.copy())
+        assert np.array_equal(cache.solve(BOARD.copy()), expected)
+        assert np.array_equal(cache.solve(BOARD.copy()), expected)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @staticmethod
+    def test_isomorph_hit():
+        cache = SolveCache()
+        cache.solve(BOARD.copy())
+
+        grid = isomorph(BOARD, 1)
+        expected = solve(grid.copy())
+        steps = []
+        assert np.array_equal(cache.solve(grid, steps.append), expected)
+        assert cache.hits == 1
+
+        replayed = isomorph(BOARD, 1)
+        for step in steps:
+            for placement in step.placements:
+                if step.house is not None:
+                    assert placement.cell in TOPOLOGY.house_cells[step.house]
+                replayed[placement.cell] = placement.digit
+        assert np.array_equal(replayed, expected)
+
+    @staticmethod
+    def test_in_place():
+        cache = SolveCache()
+        cache.solve(BOARD.copy())
+        grid = isomorph(BOARD, 2)
+        cache.solve(grid)
+        assert (grid > 0).all()
+
+
+class TestBruteForce:
+    @staticmethod
+    def test_isomorph_solution():
+        cache = SolveCache()
+        cache.brute_force_solution(HARD)
+
+        grid = isomorph(HARD, 3)
+        assert np.array_equal(
+            cache.brute_force_solution(grid), brute_force_solution(grid)
+        )
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @staticmethod
+    def test_no_solution():
+        cache = SolveCache()
+        grid = HARD.copy()
+        grid[0, 0] = grid[0, 7]
+        assert cache.brute_force_solution(grid) is None
+        assert cache.brute_force_solution(grid) is None
+        assert cache.hits == 1
+
+    @staticmethod
+    def test_uniqueness():
+        cache = SolveCache()
+        grid = HARD.copy()
+        grid[0, 7] = 0
+        assert cache.has_unique_solution(HARD) == has_unique_solution(HARD)
+        assert cache.has_unique_solution(grid) == has_unique_solution(grid)
+        assert cache.has_unique_solution(isomorph(grid, 4)) == has_unique_solution(grid)
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+class TestStorage:
+    @staticmethod
+    def test_lru():
+        cache = SolveCache(maxsize=1)
+        cache.has_unique_solution(BOARD)
+        cache.has_unique_solution(HARD)
+        cache.has_unique_solution(BOARD)
+        assert len(cache) == 1
+        assert cache.misses == 3
+
+    @staticmethod
+    def test_shelve(tmp_path):
+        path = str(tmp_path / "cache")
+        with SolveCache(path=path) as cache:
+            cache.solve(BOARD.copy())
+            cache.brute_force_solution(HARD)
+
+        with SolveCache(path=path) as cache:
+            grid = isomorph(BOARD, 5)
+            assert np.array_equal(cache.solve(grid.copy()), solve(grid.copy()))
+            assert np.array_equal(
+                cache.brute_force_solution(HARD), brute_force_solution(HARD)
+            )
+            assert (cache.hits, cache.misses) == (2, 0)
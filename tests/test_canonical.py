@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+
+from pyslab.canonical import (
+    CanonicalIndex,
+    Transform,
+    canonical_form,
+    canonical_hash,
+    canonicalize,
+)
+from pyslab.core.topology import TOPOLOGY
+from pyslab.core.types import Cell
+from pyslab.io import parse_grid
+from .conftest import isomorph
+
+PUZZLE = parse_grid(
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+)
+
+
+class TestCanonicalize:
+    @staticmethod
+    @pytest.mark.parametrize("seed", range(5))
+    def test_isomorphs_match(seed):
+        assert np.array_equal(
+            canonicalize(isomorph(PUZZLE, seed)), canonicalize(PUZZLE)
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("seed", range(3))
+    def test_solution_isomorphs_match(simple_grid, seed):
+        assert np.array_equal(
+            canonicalize(isomorph(simple_grid, seed)), canonicalize(simple_grid)
+        )
+
+    @staticmethod
+    def test_minimal(simple_grid):
+        canonical = canonicalize(simple_grid)
+        assert canonical[0].tolist() == list(range(1, 10))
+        for seed in range(5):
+            other = isomorph(simple_grid, seed).flatten().tolist()
+            assert canonical.flatten().tolist() <= other
+
+    @staticmethod
+    def test_idempotent():
+        canonical = canonicalize(PUZZLE)
+        assert np.array_equal(canonicalize(canonical), canonical)
+
+    @staticmethod
+    def test_preserves_clues():
+        canonical = canonicalize(PUZZLE)
+        assert canonical.dtype == PUZZLE.dtype
+        assert (canonical > 0).sum() == (PUZZLE > 0).sum()
+
+    @staticmethod
+    def test_empty():
+        grid = np.zeros([9, 9], dtype=np.uint8)
+        assert np.array_equal(canonicalize(grid), grid)
+
+    @staticmethod
+    def test_distinct_classes(simple_grid):
+        other = simple_grid.copy()
+        other[0, 0] = 0
+        assert not np.array_equal(canonicalize(other), canonicalize(simple_grid))
+
+
+class TestTransform:
+    @staticmethod
+    @pytest.mark.parametrize("seed", range(3))
+    def test_invert(seed):
+        grid = isomorph(PUZZLE, seed)
+        canonical, transform = canonical_form(grid)
+        assert np.array_equal(transform.apply(grid), canonical)
+        assert np.array_equal(transform.invert(canonical), grid)
+
+    @staticmethod
+    def test_cells_and_digits():
+        grid = isomorph(PUZZLE, 0)
+        canonical, transform = canonical_form(grid)
+        for cell in [Cell(0, 7), Cell(4, 4), Cell(8, 2)]:
+            mapped = transform.apply_cell(cell)
+            assert transform.invert_cell(mapped) == cell
+            assert canonical[mapped] == transform.apply_digit(grid[cell])
+            assert transform.invert_digit(canonical[mapped]) == grid[cell]
+
+    @staticmethod
+    def test_transpose():
+        transform = Transform(True, tuple(range(9)), tuple(range(9)), tuple(range(10)))
+        assert np.array_equal(transform.apply(PUZZLE), PUZZLE.T)
+        assert transform.apply_cell(Cell(1, 2)) == Cell(2, 1)
+
+    @staticmethod
+    def test_houses():
+        _, transform = canonical_form(isomorph(PUZZLE, 1))
+        for house in range(27):
+            mapped = transform.apply_house(house)
+            assert transform.invert_house(mapped) == house
+            assert {
+                transform.apply_cell(cell) for cell in TOPOLOGY.house_cells[house]
+            } == set(TOPOLOGY.house_cells[mapped])
+
+
+class TestCanonicalIndex:
+    @staticmethod
+    def test_unique(simple_grid):
+        index = CanonicalIndex()
+        grids = [PUZZLE, isomorph(PUZZLE, 1), simple_grid, isomorph(simple_grid, 2)]
+        unique = list(index.unique(grids))
+
+        assert len(unique) == 2
+        assert unique[0] is grids[0]
+        assert unique[1] is grids[2]
+        assert len(index) == 2
+
+    @staticmethod
+    def test_contains(simple_grid):
+        index = CanonicalIndex()
+        assert index.add(PUZZLE)
+        assert not index.add(isomorph(PUZZLE, 3))
+        assert isomorph(PUZZLE, 4) in index
+        assert simple_grid not in index
+
+    @staticmethod
+    def test_hash():
+        assert canonical_hash(PUZZLE) == canonical_hash(isomorph(PUZZLE, 5))
+        assert len(canonical_hash(PUZZLE)) == 16
@@ -1,7 +1,18 @@
+import random
+
 import numpy as np
 
 from pyslab.core.validation import has_unique_solution
-from pyslab.generator import generate_solution, generate_problem
+from pyslab.grading import grade
+from pyslab.generator import (
+    dig_graded,
+    dig_problem,
+    generate_graded,
+    generate_targeted,
+    generate_solution,
+    generate_problem,
+    generate_many,
+)
 from pyslab.generator import (
     permute_row_blocks,
     permute_col_blocks,
@@ -29,6 +40,12 @@ class TestGenerateProblem:
         problem = next(generate_problem(grid, max_clues=60))
         assert has_unique_solution(problem)
 
+    @staticmethod
+    def test_max_clues_kept():
+        grid = generate_solution()
+        problems = generate_problem(grid, max_clues=55)
+        assert all((next(problems) > 0).sum() >= 54 for _ in range(3))
+
     @staticmethod
     def test_multiple_valid():
         grid = generate_solution()
@@ -38,6 +55,63 @@ class TestGenerateProblem:
         assert not np.array_equal(problem1, problem2)
 
 
+class TestDigGraded:
+    @staticmethod
+    def test_within_max_rating():
+        rng = random.Random(3)
+        solution = generate_solution(permutations=100, rng=rng)
+        problem, graded = dig_graded(solution, max_rating=2.3, rng=rng)
+        assert graded.solved
+        assert graded.rating <= 2.3
+        assert graded == grade(problem)
+        assert has_unique_solution(problem)
+        assert ((problem == 0) | (problem == solution)).all()
+
+    @staticmethod
+    def test_below_min_rating():
+        rng = random.Random(3)
+        solution = generate_solution(permutations=100, rng=rng)
+        assert dig_graded(solution, min_rating=2.0, max_rating=1.5, rng=rng) is None
+
+
+class TestGenerateGraded:
+    @staticmethod
+    def test_in_range():
+        problem, graded = generate_graded(2.3, 2.8, rng=random.Random(0))
+        assert 2.3 <= graded.rating <= 2.8
+        assert has_unique_solution(problem)
+
+
+class TestGenerateTargeted:
+    @staticmethod
+    def test_uses_strategy():
+        problems = generate_targeted(
+            "Pointing", attempts=5, permutations=100, rng=random.Random(0)
+        )
+        problem, graded = next(problems)
+        assert graded.solved
+        assert graded.counts["Pointing"] > 0
+        assert graded == grade(problem)
+        assert has_unique_solution(problem)
+
+    @staticmethod
+    def test_house_type():
+        steps = []
+        problems = generate_targeted(
+            "Naked Pair", "row", attempts=10, permutations=100, rng=random.Random(0)
+        )
+        problem, _ = next(problems)
+        grade(problem, sink=steps.append)
+        assert any(step.strategy == "Naked Pair" and step.house < 9 for step in steps)
+
+    @staticmethod
+    def test_budget_exhausted():
+        problems = generate_targeted(
+            "Jellyfish", budget=5, attempts=2, permutations=100, rng=random.Random(0)
+        )
+        assert list(problems) == []
+
+
 class TestPermuteRowBlocks:
     @staticmethod
     def test_grid_changed(simple_grid):
@@ -128,3 +202,64 @@ class TestPermuteCols:
             )
             == 7
         )
+
+
+class TestDigProblem:
+    @staticmethod
+    def test_unique_and_minimal_pairs():
+        solution = generate_solution(permutations=100, rng=random.Random(5))
+        problem = dig_problem(solution, rng=random.Random(5))
+        assert has_unique_solution(problem)
+        assert (problem[problem > 0] == solution[problem > 0]).all()
+        assert (problem > 0).sum() < 40
+
+    @staticmethod
+    def test_symmetric():
+        solution = generate_solution(permutations=100, rng=random.Random(6))
+        problem = dig_problem(solution, rng=random.Random(6))
+        assert np.array_equal(problem > 0, (problem > 0)[::-1, ::-1])
+
+    @staticmethod
+    def test_max_clues():
+        solution = generate_solution(permutations=100, rng=random.Random(7))
+        problem = dig_problem(solution, max_clues=60, rng=random.Random(7))
+        assert 59 <= (problem > 0).sum() <= 60
+        assert has_unique_solution(problem)
+
+
+class TestGenerateMany:
+    @staticmethod
+    def test_count_and_valid():
+        problems = list(generate_many(3, workers=2, seed=1, max_clues=60))
+        assert len(problems) == 3
+        assert all(has_unique_solution(problem) for problem in problems)
+        assert all((problem > 0).sum() <= 60 for problem in problems)
+
+    @staticmethod
+    def test_deterministic_across_workers():
+        def key(problems):
+            return sorted(problem.tobytes() for problem in problems)
+
+        serial = list(generate_many(4, workers=1, seed=7, max_clues=60))
+        parallel = list(generate_many(4, workers=2, seed=7, max_clues=60))
+        assert key(serial) == key(parallel)
+
+    @staticmethod
+    def test_max_clues_best_effort():
+        problems = list(generate_many(3, workers=1, seed=1, max_clues=0))
+        assert len(problems) == 3
+        assert all(has_unique_solution(problem) for problem in problems)
+
+    @staticmethod
+    def test_seeds_differ():
+        problem_a = next(generate_many(1, workers=1, seed=1, max_clues=60))
+        problem_b = next(generate_many(1, workers=1, seed=2, max_clues=60))
+        assert not np.array_equal(problem_a, problem_b)
+
+
+class TestSeededRandom:
+    @staticmethod
+    def test_generate_solution_repeatable():
+        grid_a = generate_solution(permutations=50, rng=random.Random(3))
+        grid_b = generate_solution(permutations=50, rng=random.Random(3))
+        assert np.array_equal(grid_a, grid_b)
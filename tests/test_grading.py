@@ -0,0 +1,94 @@
+import numpy as np
+
+from pyslab.grading import DIFFICULTY, STRATEGIES, UNSOLVED_RATING, grade
+from .conftest import str_to_grid_candidates
+
+SINGLES = (
+    "080107040700469001400803007135974600270618530608532100900046005000781000860095010"
+)
+BOX_LINE = (
+    "000000012008030000000000040120500000000004700060000000507000300000620000000100000"
+)
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+class TestGrade:
+    @staticmethod
+    def test_singles():
+        grid, _ = str_to_grid_candidates(SINGLES)
+        graded = grade(grid)
+        assert graded.solved
+        assert graded.hardest == "Naked Single"
+        assert graded.rating == DIFFICULTY["Naked Single"]
+        assert sum(graded.counts.values()) == np.count_nonzero(grid == 0)
+
+    @staticmethod
+    def test_hardest_strategy():
+        grid, _ = str_to_grid_candidates(BOX_LINE)
+        graded = grade(grid)
+        assert graded.solved
+        assert graded.hardest == "Box/Line Reduction"
+        assert graded.rating == DIFFICULTY["Box/Line Reduction"]
+        assert graded.counts["Pointing"] == 1
+
+    @staticmethod
+    def test_grid_unchanged():
+        grid, _ = str_to_grid_candidates(BOX_LINE)
+        original = grid.copy()
+        grade(grid)
+        assert np.array_equal(grid, original)
+
+    @staticmethod
+    def test_solved_grid(simple_grid):
+        graded = grade(simple_grid)
+        assert graded.solved
+        assert graded.hardest is None
+        assert graded.rating == 0.0
+
+    @staticmethod
+    def test_unsolved():
+        grid, _ = str_to_grid_candidates(HARD)
+        graded = grade(grid)
+        assert not graded.solved
+        assert graded.rating == UNSOLVED_RATING
+
+    @staticmethod
+    def test_max_rating():
+        grid, _ = str_to_grid_candidates(BOX_LINE)
+        graded = grade(grid, max_rating=DIFFICULTY["Pointing"])
+        assert not graded.solved
+        assert graded.rating == UNSOLVED_RATING
+        assert "Box/Line Reduction" not in graded.counts
+
+    @staticmethod
+    def test_max_rating_below_singles():
+        grid, _ = str_to_grid_candidates(SINGLES)
+        graded = grade(grid, max_rating=1.0)
+        assert not graded.solved
+        assert graded.counts == {}
+
+    @staticmethod
+    def test_sink():
+        grid, _ = str_to_grid_candidates(BOX_LINE)
+        steps = []
+        graded = grade(grid, sink=steps.append)
+        used = {}
+        for step in steps:
+            used[step.strategy] = used.get(step.strategy, 0) + max(
+                len(step.placements), 1
+            )
+        assert used == graded.counts
+
+
+class TestStrategies:
+    @staticmethod
+    def test_easiest_first():
+        difficulties = [strategy.difficulty for strategy in STRATEGIES]
+        assert difficulties == sorted(difficulties)
+
+    @staticmethod
+    def test_all_rated():
+        names = {strategy.name for strategy in STRATEGIES}
+        assert names | {"Naked Single", "Hidden Single"} == set(DIFFICULTY)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from pyslab.io import format_grid, parse_grid, read_chunks, read_grids, write_grids
+from pyslab.solver import create_candidate_grid, solve
+
+PUZZLE = (
+    "080107040700469001400803007135974600270618530608532100900046005000781000860095010"
+)
+
+
+class TestParseGrid:
+    @staticmethod
+    def test_zeros():
+        grid = parse_grid(PUZZLE)
+        assert grid.shape == (9, 9)
+        assert grid.dtype == np.uint8
+        assert grid[0].tolist() == [0, 8, 0, 1, 0, 7, 0, 4, 0]
+
+    @staticmethod
+    def test_matches_int_grid():
+        expected = np.array([int(e) for e in PUZZLE]).reshape([9, 9])
+        grid = parse_grid(PUZZLE)
+        assert np.array_equal(grid, expected)
+        assert np.array_equal(
+            create_candidate_grid(grid), create_candidate_grid(expected)
+        )
+        assert np.array_equal(solve(grid), solve(expected))
+
+    @staticmethod
+    def test_dots():
+        assert np.array_equal(parse_grid(PUZZLE.replace("0", ".")), parse_grid(PUZZLE))
+
+    @staticmethod
+    def test_too_short():
+        with pytest.raises(ValueError):
+            parse_grid(PUZZLE[:80])
+
+    @staticmethod
+    def test_invalid_character():
+        with pytest.raises(ValueError):
+            parse_grid("x" + PUZZLE[1:])
+
+
+class TestFormatGrid:
+    @staticmethod
+    def test_round_trip():
+        assert format_grid(parse_grid(PUZZLE)) == PUZZLE
+
+    @staticmethod
+    def test_blank():
+        assert format_grid(parse_grid(PUZZLE), blank=".") == PUZZLE.replace("0", ".")
+
+
+class TestReadWrite:
+    @staticmethod
+    @pytest.mark.parametrize("name", ["puzzles.txt", "puzzles.txt.gz"])
+    def test_round_trip(tmp_path, simple_grid, name):
+        path = str(tmp_path / name)
+        grids = np.stack([parse_grid(PUZZLE), simple_grid])
+
+        assert write_grids(path, grids) == 2
+        assert np.array_equal(np.stack(list(read_grids(path))), grids)
+
+    @staticmethod
+    def test_streamed_grids(tmp_path, simple_grid):
+        path = str(tmp_path / "puzzles.txt")
+        written = write_grids(path, (simple_grid for _ in range(3)))
+        assert written == 3
+        assert all(np.array_equal(grid, simple_grid) for grid in read_grids(path))
+
+    @staticmethod
+    def test_chunks(tmp_path, simple_grid):
+        path = str(tmp_path / "puzzles.txt")
+        write_grids(path, np.stack([simple_grid] * 5))
+        chunks = list(read_chunks(path, chunk_size=2))
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[0].shape == (2, 9, 9)
+
+    @staticmethod
+    def test_skips_comments_and_extra_columns(tmp_path):
+        path = tmp_path / "puzzles.txt"
+        path.write_text(f"# corpus\n\n{PUZZLE} 3.5\n{PUZZLE.replace('0', '.')}\n")
+        grids = list(read_grids(str(path)))
+        assert len(grids) == 2
+        assert np.array_equal(grids[0], grids[1])
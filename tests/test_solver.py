@@ -1,9 +1,16 @@
 import numpy as np
 import pytest
 
-from pyslab.core.types import Cell, Placement
-from pyslab.core.validation import is_solved
-from pyslab.solver import solve, make_placement, create_candidate_grid
+from pyslab.core.bitmask import digit_mask, mask_digits
+from pyslab.core.types import Candidate, Cell, Elimination, Placement
+from pyslab.core.validation import brute_force_solution, is_solved
+from pyslab.solver import (
+    solve,
+    make_placement,
+    make_placements,
+    make_elimination,
+    create_candidate_grid,
+)
 from .conftest import str_to_grid_candidates
 
 
@@ -21,6 +28,57 @@ def test_boards(board):
     assert is_solved(grid)
 
 
+@pytest.mark.parametrize(
+    "board, strategy",
+    [
+        (
+            "000100089190702050006000100400008610000206000062400005007000500020604097650007000",
+            "Box/Line Reduction",
+        ),
+        (
+            "000008300004600078000027045040000200280000097001000030790210000130006700005800000",
+            "X-Wing",
+        ),
+        (
+            "007000060300600908004010200043500000000080000000003870008030400102005009060000100",
+            "Swordfish",
+        ),
+    ],
+)
+def test_grid_strategies(board, strategy):
+    grid, _ = str_to_grid_candidates(board)
+    solution = brute_force_solution(grid)
+    steps = []
+    solve(grid, steps.append)
+
+    assert strategy in {step.strategy for step in steps}
+    assert ((grid == 0) | (grid == solution)).all()
+
+
+class TestSearch:
+    @staticmethod
+    def test_finishes_with_search():
+        grid, _ = str_to_grid_candidates(
+            "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+        )
+        expected = brute_force_solution(grid)
+        steps = []
+        solve(grid, steps.append, search=True)
+
+        assert np.array_equal(grid, expected)
+        assert steps[-1].strategy == "Search"
+
+    @staticmethod
+    def test_logical_only_by_default():
+        grid, _ = str_to_grid_candidates(
+            "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+        )
+        steps = []
+        solve(grid, steps.append)
+        assert (grid == 0).any()
+        assert "Search" not in {step.strategy for step in steps}
+
+
 class TestSetCell:
     @staticmethod
     def test_grid_cell_set(simple_grid):
@@ -40,9 +98,9 @@ class TestSetCell:
         simple_grid[:, 0] = 0
         candidates = create_candidate_grid(simple_grid)
 
-        assert candidates[0, 0] == [1, 2, 3, 4, 7]
+        assert mask_digits(candidates[0, 0]) == (1, 2, 3, 4, 7)
         make_placement(simple_grid, candidates, Placement(Cell(0, 0), 1))
-        assert candidates[0, 0] == [1]
+        assert mask_digits(candidates[0, 0]) == (1,)
 
     @staticmethod
     def test_row_peer_candidates_updated(simple_grid):
@@ -53,9 +111,60 @@ class TestSetCell:
         simple_grid[np.where(simple_grid == 1)] = 0
         candidates = create_candidate_grid(simple_grid)
 
-        assert any(1 in c for c in candidates[0, 1:])
+        assert any(1 in mask_digits(c) for c in candidates[0, 1:])
         make_placement(simple_grid, candidates, Placement(Cell(0, 0), 1))
-        assert not any(1 in c for c in candidates[0, 1:])
+        assert not any(1 in mask_digits(c) for c in candidates[0, 1:])
+
+    @staticmethod
+    def test_touched_houses(simple_grid):
+        simple_grid[0, 0] = 0
+        simple_grid[0, 3] = 0
+        simple_grid[2, 3] = 0
+        candidates = create_candidate_grid(simple_grid)
+
+        touched = make_placement(simple_grid, candidates, Placement(Cell(0, 0), 1))
+        # houses of the placed cell, and of (0, 3) which lost candidate 1
+        assert touched == {0, 9, 18, 12, 19}
+
+
+class TestMakePlacements:
+    @staticmethod
+    def test_matches_make_placement(simple_grid):
+        simple_grid[0, :] = 0
+        simple_grid[:, 0] = 0
+        expected_grid = simple_grid.copy()
+        expected_candidates = create_candidate_grid(expected_grid)
+        candidates = create_candidate_grid(simple_grid)
+
+        touched = make_placements(
+            simple_grid, candidates, np.array([0, 13]), np.array([1, 5])
+        )
+        expected = make_placement(
+            expected_grid, expected_candidates, Placement(Cell(0, 0), 1)
+        ) | make_placement(expected_grid, expected_candidates, Placement(Cell(1, 4), 5))
+
+        assert touched == expected
+        assert np.array_equal(simple_grid, expected_grid)
+        assert np.array_equal(candidates, expected_candidates)
+
+
+class TestMakeElimination:
+    @staticmethod
+    def test_candidate_removed(simple_grid):
+        simple_grid[0, :] = 0
+        candidates = create_candidate_grid(simple_grid)
+
+        touched = make_elimination(candidates, Elimination([Candidate(Cell(0, 4), 5)]))
+        assert 5 not in mask_digits(candidates[0, 4])
+        assert touched == {0, 13, 19}
+
+    @staticmethod
+    def test_missing_candidate_ignored(simple_grid):
+        simple_grid[0, :] = 0
+        candidates = create_candidate_grid(simple_grid)
+
+        touched = make_elimination(candidates, Elimination([Candidate(Cell(0, 4), 1)]))
+        assert not touched
 
 
 class TestCreateCandidateGrid:
@@ -63,7 +172,9 @@ class TestCreateCandidateGrid:
     def test_solved(simple_grid):
         candidates = create_candidate_grid(simple_grid)
         assert all(
-            candidates[r, c] == simple_grid[r, c] for r in range(9) for c in range(9)
+            candidates[r, c] == digit_mask(simple_grid[r, c])
+            for r in range(9)
+            for c in range(9)
         )
 
     @staticmethod
@@ -71,9 +182,11 @@ class TestCreateCandidateGrid:
         simple_grid[0, :] = 0
         simple_grid[1, :] = 0
         candidates = create_candidate_grid(simple_grid)
-        assert all(len(candidates[r, c]) == 2 for r in range(2) for c in range(9))
         assert all(
-            candidates[r, c].pop() == simple_grid[r, c]
+            len(mask_digits(candidates[r, c])) == 2 for r in range(2) for c in range(9)
+        )
+        assert all(
+            mask_digits(candidates[r, c]) == (simple_grid[r, c],)
             for r in range(2, 9)
             for c in range(9)
         )
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from pyslab.core.validation import brute_force_solution, brute_force_solutions
+from pyslab.solver import solve
+from pyslab.stats import SolveStats, StrategyStats
+from .conftest import str_to_grid_candidates
+
+HARD = (
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+)
+
+
+class TestSolveStats:
+    @staticmethod
+    def test_record():
+        stats = SolveStats()
+        stats.record("Naked Pair", "row", 0.0, eliminations=3)
+        stats.record("Naked Pair", "row", 0.0)
+        stats.record("Naked Pair", "box", 0.0, placements=1)
+
+        row = stats.strategies[("Naked Pair", "row")]
+        assert (row.calls, row.hits, row.eliminations) == (2, 1, 3)
+        assert row.time > 0
+
+        combined = stats.by_strategy()["Naked Pair"]
+        assert (combined.calls, combined.hits, combined.placements) == (3, 2, 1)
+
+    @staticmethod
+    def test_to_dict():
+        stats = SolveStats()
+        stats.record("X-Wing", "grid", 0.0, eliminations=2)
+        exported = stats.to_dict()
+        assert exported["strategies"]["X-Wing"]["grid"]["eliminations"] == 2
+        assert set(exported["strategies"]["X-Wing"]["grid"]) == set(
+            StrategyStats.__slots__
+        )
+        assert exported["search"] == {"searches": 0, "nodes": 0, "time": 0.0}
+
+
+class TestSolveWithStats:
+    @staticmethod
+    def test_counts_match_steps():
+        grid, _ = str_to_grid_candidates(HARD)
+        empty = np.count_nonzero(grid == 0)
+        stats = SolveStats()
+        steps = []
+        solve(grid, steps.append, search=True, stats=stats)
+
+        strategies = stats.by_strategy()
+        hits = {}
+        for step in steps:
+            hits[step.strategy] = hits.get(step.strategy, 0) + 1
+        for name, counters in strategies.items():
+            if name != "Hidden Single":
+                assert counters.hits == hits.get(name, 0)
+            assert counters.calls >= counters.hits
+        eliminations = sum(len(step.eliminations) for step in steps)
+        assert sum(c.eliminations for c in strategies.values()) <= eliminations
+        placements = sum(len(step.placements) for step in steps)
+        assert placements == empty
+        assert stats.searches == 1
+        assert stats.search_nodes > 0
+
+    @staticmethod
+    def test_house_types():
+        grid, _ = str_to_grid_candidates(HARD)
+        stats = SolveStats()
+        solve(grid, stats=stats)
+        assert {house_type for _, house_type in stats.strategies} >= {
+            "row",
+            "column",
+            "box",
+            "grid",
+        }
+
+    @staticmethod
+    def test_disabled_matches_enabled():
+        grid, _ = str_to_grid_candidates(HARD)
+        expected = solve(grid.copy())
+        assert np.array_equal(solve(grid, stats=SolveStats()), expected)
+
+
+@pytest.mark.parametrize("backend", ["naive", "bitmask", "dlx", "hybrid"])
+class TestBruteForceStats:
+    @staticmethod
+    def test_solution(simple_grid, backend):
+        grid = simple_grid.copy()
+        grid[0:3, 0:3] = 0
+        stats = SolveStats()
+        solution = brute_force_solution(grid, backend, stats)
+        assert np.array_equal(solution, simple_grid)
+        assert stats.searches == 1
+        assert stats.search_time > 0
+
+    @staticmethod
+    def test_nodes(backend):
+        if backend == "naive":
+            pytest.skip("naive search does not count nodes")
+        grid, _ = str_to_grid_candidates(HARD)
+        stats = SolveStats()
+        brute_force_solution(grid, backend, stats)
+        assert stats.search_nodes > 0
+
+    @staticmethod
+    def test_accumulates(simple_grid, backend):
+        simple_grid[np.where(simple_grid == 1)] = 0
+        stats = SolveStats()
+        list(brute_force_solutions(simple_grid, backend, stats))
+        nodes = stats.search_nodes
+        list(brute_force_solutions(simple_grid, backend, stats))
+        assert stats.searches == 2
+        assert stats.search_nodes == 2 * nodes
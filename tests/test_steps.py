@@ -0,0 +1,62 @@
+import logging
+
+from pyslab.core.types import Candidate, Cell, Placement
+from pyslab.solver import solve
+from pyslab.steps import LoggingSink, Step
+from .conftest import str_to_grid_candidates
+
+BOARD = (
+    "000000805300457000000918030030700102700000004109003050090231000000584009405000000"
+)
+
+
+class TestSolveSteps:
+    @staticmethod
+    def test_silent_by_default(capsys):
+        grid, _ = str_to_grid_candidates(BOARD)
+        solve(grid)
+        assert capsys.readouterr().out == ""
+
+    @staticmethod
+    def test_list_collector():
+        grid, _ = str_to_grid_candidates(BOARD)
+        steps = []
+        solve(grid, sink=steps.append)
+
+        placements = [p for step in steps for p in step.placements]
+        assert (
+            len(placements)
+            == (grid > 0).sum() - (str_to_grid_candidates(BOARD)[0] > 0).sum()
+        )
+        assert all(grid[p.cell] == p.digit for p in placements)
+        assert {step.strategy for step in steps} >= {"Naked Single", "Hidden Single"}
+
+    @staticmethod
+    def test_logging_sink(caplog):
+        grid, _ = str_to_grid_candidates(BOARD)
+        with caplog.at_level(logging.INFO, logger="pyslab.solver"):
+            solve(grid, sink=LoggingSink())
+        assert caplog.records
+        assert (
+            caplog.records[0]
+            .getMessage()
+            .endswith("Naked Single, Placing 6 into Cell(row=8, column=3)")
+        )
+
+
+class TestStep:
+    @staticmethod
+    def test_placement_str():
+        step = Step("Hidden Single", 11, [Placement(Cell(4, 2), 7)], [])
+        assert (
+            str(step)
+            == "Hidden Single in column 2, Placing 7 into Cell(row=4, column=2)"
+        )
+
+    @staticmethod
+    def test_elimination_str():
+        step = Step("Naked Pair", 18, [], [Candidate(Cell(0, 0), 3)])
+        assert str(step) == (
+            "Naked Pair in box 0, "
+            "Eliminating [Candidate(cell=Cell(row=0, column=0), digit=3)]"
+        )
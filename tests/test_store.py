@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from pyslab.batch import solve_batch
+from pyslab.store import PuzzleStore, StoreWriter, write_store
+from .conftest import str_to_grid_candidates
+
+PUZZLE = (
+    "080107040700469001400803007135974600270618530608532100900046005000781000860095010"
+)
+
+
+@pytest.fixture(name="puzzles")
+def fixture_puzzles(simple_grid):
+    problem, _ = str_to_grid_candidates(PUZZLE)
+    return np.stack([problem, simple_grid, problem])
+
+
+class TestWriteStore:
+    @staticmethod
+    def test_puzzles_only(tmp_path, puzzles):
+        path = str(tmp_path / "puzzles.pzs")
+        assert write_store(path, puzzles, clues=False) == 3
+
+        store = PuzzleStore(path)
+        assert len(store) == 3
+        assert store.puzzles.dtype == np.uint8
+        assert np.array_equal(store.puzzles, puzzles)
+        assert store.solutions is None
+        assert store.clues is None
+        assert store.difficulty is None
+
+    @staticmethod
+    def test_all_columns(tmp_path, puzzles):
+        path = str(tmp_path / "puzzles.pzs")
+        solutions = solve_batch(puzzles).grids
+        difficulty = np.array([1.5, 0.0, 1.5])
+        write_store(path, puzzles, solutions=solutions, difficulty=difficulty)
+
+        store = PuzzleStore(path)
+        assert np.array_equal(store.solutions, solutions)
+        assert store.clues.tolist() == [45, 81, 45]
+        assert store.difficulty.tolist() == [1.5, 0.0, 1.5]
+
+    @staticmethod
+    def test_streamed_chunks(tmp_path, puzzles):
+        path = str(tmp_path / "puzzles.pzs")
+        assert write_store(path, (puzzles for _ in range(4))) == 12
+
+        store = PuzzleStore(path)
+        assert np.array_equal(store[7], puzzles[1])
+        assert [len(chunk) for chunk in store.chunks(5)] == [5, 5, 2]
+
+    @staticmethod
+    def test_memory_mapped(tmp_path, puzzles):
+        path = str(tmp_path / "puzzles.pzs")
+        write_store(path, puzzles)
+        store = PuzzleStore(path)
+        assert isinstance(store.puzzles, np.memmap)
+        with pytest.raises(ValueError):
+            store.puzzles[0, 0, 0] = 1
+
+
+class TestStoreWriter:
+    @staticmethod
+    def test_missing_column(tmp_path, puzzles):
+        with StoreWriter(str(tmp_path / "puzzles.pzs"), solutions=True) as writer:
+            with pytest.raises(ValueError):
+                writer.append(puzzles)
+
+    @staticmethod
+    def test_empty(tmp_path):
+        path = str(tmp_path / "puzzles.pzs")
+        with StoreWriter(path):
+            pass
+        assert len(PuzzleStore(path)) == 0
+
+
+def test_not_a_store(tmp_path):
+    path = tmp_path / "puzzles.txt"
+    path.write_text(PUZZLE)
+    with pytest.raises(ValueError):
+        PuzzleStore(str(path))